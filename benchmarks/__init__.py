@@ -0,0 +1 @@
+"""Headless benchmarks for the data paths behind scout.py (``python -m benchmarks.run``)."""
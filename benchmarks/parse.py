@@ -0,0 +1,168 @@
+"""Parse throughput of the sync's parsing stage against the number of worker processes.
+
+    python -m benchmarks.parse                          # synthetic fixture pages
+    python -m benchmarks.parse --workers 0 1 2 4 8 --rows 2000
+    python -m benchmarks.parse --pages data/page_cache  # pages recorded by real syncs
+
+Pages come from a page cache directory (``scout_core.sync.pagecache``,
+filled by any sync run with a cache) or, by default, are rendered from a
+synthetic player table in each source's format: FBref stat tables inside
+HTML comments, Transfermarkt market value lists, and the ASA and Sofascore
+JSON APIs. Every page is parsed through ``submit_parse`` with ``0`` (in
+this process) to N pool processes; pools are warmed up before timing, so
+process start-up isn't counted. The ``combine`` column is the main
+process folding the returned tables into per-source frames.
+
+Only counts processes the machine has cores for: on a single-core
+machine every pool size runs at about the in-process rate.
+"""
+import argparse
+import json
+import os
+import time
+from html import escape
+
+from benchmarks.synthetic import synthetic_players
+from scout_core.schema import expand_players
+from scout_core.sync.merge import combine_tables
+from scout_core.sync.parsing import parse_pool, submit_parse
+from scout_core.sync.sources import SOURCES
+
+FBREF_ROWS_PER_PAGE = 500
+TRANSFERMARKT_ROWS_PER_PAGE = 25
+SOFASCORE_ROWS_PER_PAGE = 100
+
+
+def _fbref_page(players):
+    rows = []
+    for player in players.itertuples():
+        cells = [
+            f'<th data-stat="player" data-append-csv="{player.id:08x}">'
+            f'<a href="/en/players/{player.id:08x}/">{escape(player.name)}</a></th>',
+            f'<td data-stat="nationality"><span>us</span> {escape(player.nationality)}</td>',
+            f'<td data-stat="position">{"GK" if player.position == "GK" else "MF,FW"}</td>',
+            f'<td data-stat="team"><a>{escape(player.club)}</a></td>',
+            f'<td data-stat="age">{player.age}-123</td>',
+            f'<td data-stat="games">{player.matches}</td>',
+            f'<td data-stat="minutes">{player.minutes_played:,}</td>',
+            f'<td data-stat="goals">{player.goals}</td>',
+            f'<td data-stat="assists">{player.assists}</td>',
+        ]
+        rows.append(f'<tr>{"".join(cells)}</tr>')
+    table = f'<table id="stats_standard"><thead><tr><th>Player</th></tr></thead><tbody>{"".join(rows)}</tbody></table>'
+    return f'<html><body><div id="all_stats_standard"><!--\n{table}\n--></div></body></html>'.encode()
+
+
+def _transfermarkt_page(players):
+    rows = []
+    for player in players.itertuples():
+        rows.append(
+            '<tr><td><table class="inline-table"><tr><td class="hauptlink">'
+            f'<a href="/player/profil/spieler/{player.id}">{escape(player.name)}</a></td></tr>'
+            '<tr><td>Centre-Forward</td></tr></table></td>'
+            f'<td class="zentriert">{player.age}</td>'
+            f'<td class="zentriert"><img class="flaggenrahmen" title="{escape(player.nationality)}"/></td>'
+            f'<td class="zentriert"><a title="{escape(player.club)}"></a></td>'
+            f'<td class="rechts hauptlink"><a>€{player.market_value / 1e6:.2f}m</a></td></tr>'
+        )
+    return f'<html><body><table class="items"><tbody>{"".join(rows)}</tbody></table></body></html>'.encode()
+
+
+def _asa_page(players):
+    return json.dumps([
+        {'player_id': f"asa{player.id}", 'player_name': player.name, 'nationality': player.nationality,
+         'birth_date': f"{2024 - player.age}-01-01"}
+        for player in players.itertuples()
+    ]).encode()
+
+
+def _sofascore_page(players):
+    return json.dumps({'results': [
+        {'player': {'name': player.name, 'id': player.id}, 'team': {'name': player.club}, 'rating': player.rating,
+         'accuratePassesPercentage': player.pass_accuracy, 'appearances': player.matches}
+        for player in players.itertuples()
+    ]}).encode()
+
+
+def synthetic_pages(rows):
+    """``(source, league, body)`` pages covering ``rows`` synthetic players in every source."""
+    players = expand_players(synthetic_players(rows))
+    pages = []
+    for render, source, per_page in (
+        (_fbref_page, 'fbref', FBREF_ROWS_PER_PAGE),
+        (_transfermarkt_page, 'transfermarkt', TRANSFERMARKT_ROWS_PER_PAGE),
+        (_asa_page, 'asa', rows),
+        (_sofascore_page, 'sofascore', SOFASCORE_ROWS_PER_PAGE),
+    ):
+        for start in range(0, rows, per_page):
+            pages.append((source, 'MLS', render(players.iloc[start:start + per_page])))
+    return pages
+
+
+def cached_pages(directory):
+    """``(source, league, body)`` of every page in a page cache directory."""
+    from scout_core.sync.pagecache import PageCache
+
+    with PageCache(directory) as cache:
+        return [
+            (source, league, body)
+            for source, league, url in cache.pages()
+            if (body := cache.get(url)) is not None
+        ]
+
+
+def parse_all(pages, executor):
+    """Parse ``pages``; returns the tables per source."""
+    futures = [(source, submit_parse(executor, source, league, body)) for source, league, body in pages]
+    tables = {}
+    for source, future in futures:
+        tables.setdefault(source, []).append(future.result())
+    return tables
+
+
+def measure(pages, executor, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        tables = parse_all(pages, executor)
+        parsed = time.perf_counter() - start
+        start = time.perf_counter()
+        for source, source_tables in tables.items():
+            combine_tables(SOURCES[source], source_tables)
+        combined = time.perf_counter() - start
+        if best is None or parsed < best[0]:
+            best = (parsed, combined)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure parse throughput against worker processes")
+    parser.add_argument('--workers', type=int, nargs='+', default=[0, 1, 2, 4],
+                        help="pool sizes to measure (0: parse in this process)")
+    parser.add_argument('--rows', type=int, default=5000, help="synthetic players per source")
+    parser.add_argument('--pages', metavar='DIR', help="parse the pages of this page cache instead")
+    parser.add_argument('--repeat', type=int, default=3, help="timed runs per pool size (best is kept)")
+    args = parser.parse_args(argv)
+
+    pages = cached_pages(args.pages) if args.pages else synthetic_pages(args.rows)
+    if not pages:
+        parser.error("no pages to parse")
+    total_mb = sum(len(body) for _, _, body in pages) / 2**20
+    print(f"{len(pages)} pages, {total_mb:.1f} MiB; {os.cpu_count()} CPUs")
+    print(f"{'workers':<10}{'pages/s':>12}{'MiB/s':>10}{'parse':>12}{'combine':>12}{'speedup':>10}")
+    baseline = None
+    for workers in args.workers:
+        if workers:
+            with parse_pool(workers) as pool:
+                parse_all(pages[:workers], pool)  # start every process before timing
+                parsed, combined = measure(pages, pool, args.repeat)
+        else:
+            parsed, combined = measure(pages, None, args.repeat)
+        baseline = baseline or parsed
+        print(f"{workers:<10}{len(pages) / parsed:>12.1f}{total_mb / parsed:>10.1f}"
+              f"{parsed * 1000:>9.0f} ms{combined * 1000:>9.0f} ms{baseline / parsed:>9.2f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
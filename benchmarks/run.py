@@ -0,0 +1,206 @@
+"""Time the data paths behind scout.py on synthetic tables, without a browser.
+
+    python -m benchmarks.run                      # 1k, 10k, 100k and 1m rows
+    python -m benchmarks.run --sizes 10k 100k --repeat 3
+
+Each stage is run up to ``--repeat`` times (fewer once it has used a
+second) and reported as the median latency, plus the peak memory traced
+by ``tracemalloc`` during one extra run. NumPy and pandas allocations are
+traced; Arrow buffers inside the store scan are not. The deep memory of the
+loaded table is reported in the compact schema (``scout_core.schema``) and
+in the wide layout it replaced. Every run appends one
+JSON line per table size to ``benchmarks/results.jsonl`` so results can be
+compared across commits; a run from a tree with uncommitted changes is
+recorded as ``<commit>-dirty``.
+"""
+import argparse
+import json
+import platform
+import resource
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.synthetic import SIZES, synthetic_players
+from scout_core.export import export_chunks, write_export
+from scout_core.query import PlayerIndex, PlayerQuery
+from scout_core.stats import attach_player_stats
+from scout_core.schema import expand_players, memory_footprint
+from scout_core.store import Store
+from scout_core.sync.resolve import resolve_players
+from scout_core.teams import team_aggregates, update_team_aggregates
+
+RESULTS_PATH = Path(__file__).with_name('results.jsonl')
+
+# A typical sidebar state: one league, one position, narrowed age and value
+SIDEBAR_QUERY = PlayerQuery(
+    league='MLS',
+    position='ST',
+    age_range=(20, 30),
+    value_range=(0, 5_000_000),
+    sort_by='rating',
+)
+SORT_QUERY = PlayerQuery(sort_by='market_value', ascending=True)
+CHANGED_FRACTION = 0.01
+RESOLVED_FRACTION = 0.05
+
+
+def measure(fn, repeat, budget=1.0):
+    """Median and minimum seconds over up to ``repeat`` runs, and traced peak bytes."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+        if sum(timings) > budget:
+            break
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        'median_s': statistics.median(timings),
+        'min_s': min(timings),
+        'runs': len(timings),
+        'peak_bytes': peak,
+    }
+
+
+def wide_layout(players):
+    """``players`` as loaded before the compact schema: plain strings, bool flags, 64-bit numbers."""
+    wide = expand_players(players)
+    return wide.astype({
+        column: np.int64 if pd.api.types.is_integer_dtype(dtype) else np.float64
+        for column, dtype in wide.dtypes.items()
+        if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+    })
+
+
+def bench_size(rows, repeat):
+    players = synthetic_players(rows)
+    stages = {}
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = Store(directory)
+        # Load path: what load_player_index does after a store rewrite
+        stages['store_write'] = measure(lambda: store.write_players(players), repeat)
+        stages['store_load'] = measure(store.load_players, repeat)
+        loaded = store.load_players()
+    memory = {'compact_bytes': memory_footprint(loaded), 'wide_bytes': memory_footprint(wide_layout(loaded))}
+    stages['player_stats'] = measure(lambda: attach_player_stats(loaded), repeat)
+    df = attach_player_stats(loaded)
+    stages['index_build'] = measure(lambda: PlayerIndex(df), 1)
+    index = PlayerIndex(df)
+
+    stages['filter'] = measure(lambda: index.select(SIDEBAR_QUERY), repeat)
+    stages['search'] = measure(lambda: index.search_index.search('rossi'), repeat)
+    stages['search_fuzzy'] = measure(lambda: index.search_index.search('rossy', fuzzy=True), repeat)
+    stages['sort'] = measure(lambda: index.query(SORT_QUERY), repeat)
+    stages['similar'] = measure(lambda: index.similarity_index.similar(0, k=10), repeat)
+
+    # Team aggregation: full pass, and a sync touching 1% of the players
+    teams = team_aggregates(df)
+    stages['team_aggregates'] = measure(lambda: team_aggregates(df), repeat)
+    changed_ids = df['id'].sample(frac=CHANGED_FRACTION, random_state=0).to_numpy()
+    synced = df.copy()
+    synced.loc[synced['id'].isin(changed_ids), 'goals'] += 1
+    stages['team_update'] = measure(
+        lambda: update_team_aggregates(teams, df, synced, changed_ids), repeat
+    )
+
+    # Entity resolution of one source reporting 5% of the players with
+    # accent-folded names: first sync (blocking) and re-sync (id map)
+    expanded = expand_players(df)
+    source = expanded.sample(frac=RESOLVED_FRACTION, random_state=0)[['name', 'age', 'nationality']]
+    source = source.assign(name=source['name'].str.replace('a', 'á', n=1))
+    source.index = source['name'].str.lower()
+    source = source[~source.index.duplicated()]
+    stages['resolve'] = measure(lambda: resolve_players({'fbref': source}, expanded), repeat)
+    _, mappings = resolve_players({'fbref': source}, expanded)
+    id_maps = {'fbref': mappings['fbref'].to_dict()}
+    stages['resolve_mapped'] = measure(lambda: resolve_players({'fbref': source}, expanded, id_maps), repeat)
+
+    # Chunked CSV export of the filtered league (the sidebar query without position)
+    exported = index.select(PlayerQuery(league='MLS'))
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'export.csv'
+        stages['csv_export'] = measure(lambda: write_export(export_chunks(df, exported), 'CSV', path), repeat)
+
+    return stages, memory
+
+
+def git_commit():
+    """Short hash of HEAD, suffixed ``-dirty`` when tracked files have uncommitted changes."""
+    try:
+        return subprocess.run(
+            ['git', 'describe', '--always', '--dirty', '--abbrev=7'],
+            capture_output=True, text=True, check=True, cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_table(results):
+    sizes = list(results)
+    stages = list(next(iter(results.values()))['stages'])
+    print(f"{'stage':<16}" + ''.join(f"{size:>22}" for size in sizes))
+    for stage in stages:
+        cells = []
+        for size in sizes:
+            measured = results[size]['stages'][stage]
+            cells.append(f"{measured['median_s'] * 1000:10.2f} ms {measured['peak_bytes'] / 2**20:6.1f} MiB")
+        print(f"{stage:<16}" + ''.join(f"{cell:>22}" for cell in cells))
+    cells = []
+    for size in sizes:
+        memory = results[size]['memory']
+        cells.append(f"{memory['wide_bytes'] / 2**20:.1f} -> {memory['compact_bytes'] / 2**20:.1f} MiB")
+    print(f"{'table memory':<16}" + ''.join(f"{cell:>22}" for cell in cells))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the scout data paths on synthetic data")
+    parser.add_argument('--sizes', nargs='+', choices=list(SIZES), default=list(SIZES))
+    parser.add_argument('--repeat', type=int, default=5, help="maximum timed runs per stage")
+    parser.add_argument('--output', type=Path, default=RESULTS_PATH, help="JSON lines file to append to")
+    parser.add_argument('--no-save', action='store_true', help="print the results without saving them")
+    args = parser.parse_args(argv)
+
+    run = {
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+    }
+    results = {}
+    for size in args.sizes:
+        stages, memory = bench_size(SIZES[size], args.repeat)
+        results[size] = {
+            **run,
+            'size': size,
+            'rows': SIZES[size],
+            'max_rss_bytes': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+            'memory': memory,
+            'stages': stages,
+        }
+        print(f"{size}: done", flush=True)
+
+    print_table(results)
+    if not args.no_save:
+        with open(args.output, 'a') as f:
+            for result in results.values():
+                f.write(json.dumps(result) + '\n')
+        print(f"Appended {len(results)} results to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,116 @@
+"""Cold-start check for scout.py: import time and first script run in fresh interpreters.
+
+    python -m benchmarks.startup
+    python -m benchmarks.startup --repeat 5 --import-budget 800
+
+Two stages, each measured in ``--repeat`` new processes and reported as
+the median:
+
+* ``imports``: scout.py's top-level imports, after Streamlit itself is
+  imported (Streamlit's own import time is reported as ``streamlit`` but not
+  budgeted). Also fails if any of ``DEFERRED_MODULES`` got loaded: those
+  belong to code paths (syncing, the HTTP API, ``plotly.express``) that a
+  worker serving the dashboard may never run.
+* ``first_run``: the first full script run of a worker through AppTest,
+  against a data directory seeded beforehand, so it covers imports, the
+  store scan, the index build and rendering every tab.
+
+Exits with status 1 when a stage exceeds its budget, so it can gate CI.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+APP_PATH = Path(__file__).resolve().parent.parent / 'scout.py'
+
+# Median milliseconds allowed per stage
+IMPORT_BUDGET_MS = 600
+FIRST_RUN_BUDGET_MS = 2500
+
+DEFERRED_MODULES = ('requests', 'lxml', 'bs4', 'selenium', 'aiohttp', 'plotly.express', 'pyarrow.parquet')
+
+IMPORTS_PROBE = """
+import ast, json, sys, time
+start = time.perf_counter()
+import streamlit
+streamlit_s = time.perf_counter() - start
+tree = ast.parse(open(APP_PATH).read())
+imports = ast.Module([node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))], [])
+code = compile(imports, APP_PATH, 'exec')
+start = time.perf_counter()
+exec(code, {})
+print(json.dumps({
+    'streamlit_s': streamlit_s,
+    'imports_s': time.perf_counter() - start,
+    'deferred_loaded': [name for name in DEFERRED_MODULES if name in sys.modules],
+}))
+"""
+
+FIRST_RUN_PROBE = """
+import json, time
+from streamlit.testing.v1 import AppTest
+start = time.perf_counter()
+at = AppTest.from_file(APP_PATH, default_timeout=120).run()
+elapsed = time.perf_counter() - start
+if at.exception:
+    raise SystemExit(at.exception[0].message)
+print(json.dumps({'first_run_s': elapsed}))
+"""
+
+
+def probe(source, env):
+    """Run ``source`` in a fresh interpreter and return the JSON it prints."""
+    prelude = f"APP_PATH = {str(APP_PATH)!r}\nDEFERRED_MODULES = {DEFERRED_MODULES!r}\n"
+    result = subprocess.run(
+        [sys.executable, '-c', prelude + source],
+        capture_output=True, text=True, env=env, cwd=APP_PATH.parent,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"startup probe failed:\n{result.stderr or result.stdout}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check scout.py cold-start time against a budget")
+    parser.add_argument('--repeat', type=int, default=3, help="fresh processes per stage")
+    parser.add_argument('--import-budget', type=float, default=IMPORT_BUDGET_MS, metavar='MS')
+    parser.add_argument('--first-run-budget', type=float, default=FIRST_RUN_BUDGET_MS, metavar='MS')
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        env = {
+            **os.environ,
+            'SCOUT_DATA_DIR': data_dir,
+            'PYTHONPATH': os.pathsep.join(filter(None, [str(APP_PATH.parent), os.environ.get('PYTHONPATH')])),
+        }
+        imports = [probe(IMPORTS_PROBE, env) for _ in range(args.repeat)]
+        probe(FIRST_RUN_PROBE, env)  # seeds the store; later workers start from it
+        first_runs = [probe(FIRST_RUN_PROBE, env) for _ in range(args.repeat)]
+
+    measured = {
+        'streamlit': (statistics.median(run['streamlit_s'] for run in imports) * 1000, None),
+        'imports': (statistics.median(run['imports_s'] for run in imports) * 1000, args.import_budget),
+        'first_run': (statistics.median(run['first_run_s'] for run in first_runs) * 1000, args.first_run_budget),
+    }
+    failures = []
+    print(f"{'stage':<12}{'median':>12}{'budget':>12}")
+    for stage, (ms, budget) in measured.items():
+        print(f"{stage:<12}{ms:>9.0f} ms" + (f"{budget:>9.0f} ms" if budget is not None else f"{'-':>12}"))
+        if budget is not None and ms > budget:
+            failures.append(f"{stage} took {ms:.0f} ms (budget {budget:.0f} ms)")
+    deferred = sorted({name for run in imports for name in run['deferred_loaded']})
+    if deferred:
+        failures.append(f"imported at startup: {', '.join(deferred)}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
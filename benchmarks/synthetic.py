@@ -0,0 +1,107 @@
+"""Synthetic player tables with realistic distributions of the real columns.
+
+Leagues, clubs and positions follow the shape of the real data (MLS has
+the most clubs and the highest values, USL League One the fewest and
+lowest); ages, ratings and market values are drawn from skewed
+distributions and the per-game stats depend on position. Output is in the
+compact schema, like ``Store.load_players``.
+"""
+import numpy as np
+import pandas as pd
+
+from scout_core.schema import SOURCE_BITS, compact_players
+
+# league -> (clubs, share of players, median market value)
+LEAGUE_SHAPES = {
+    'MLS': (29, 0.45, 1_500_000),
+    'USL Championship': (24, 0.35, 300_000),
+    'USL League One': (12, 0.20, 100_000),
+}
+
+POSITION_SHARES = {
+    'GK': 0.09, 'CB': 0.16, 'LB': 0.08, 'RB': 0.08, 'CDM': 0.09, 'CM': 0.12,
+    'CAM': 0.08, 'LW': 0.07, 'RW': 0.07, 'ST': 0.11, 'FW': 0.05,
+}
+
+# position -> relative attacking / defending involvement
+POSITION_PROFILE = {
+    'GK': (0.0, 0.2), 'CB': (0.1, 1.0), 'LB': (0.3, 0.8), 'RB': (0.3, 0.8),
+    'CDM': (0.3, 0.9), 'CM': (0.5, 0.6), 'CAM': (0.8, 0.3), 'LW': (0.9, 0.2),
+    'RW': (0.9, 0.2), 'ST': (1.0, 0.1), 'FW': (1.0, 0.1),
+}
+
+FIRST_NAMES = [
+    'Diego', 'Tyler', 'Ricardo', 'Emiliano', 'Tanner', 'Nick', 'Jonathan', 'Hadji', 'Milan',
+    'Arturo', 'Dariusz', 'Greg', 'Carlos', 'José', 'Luca', 'Mateo', 'Kai', 'Jordan', 'Sam',
+    'Andrés', 'Brenden', 'Julian', 'Paxton', 'Cristian', 'Gianluca', 'Noah', 'Darlington',
+]
+LAST_NAMES = [
+    'Rossi', 'Adams', 'Pepi', 'Rigoni', 'Tessmann', 'Lima', 'Lewis', 'Barry', 'Iloski',
+    'Rodriguez', 'Formella', 'Hurst', 'Hernández', 'Müller', 'Nagbe', 'Aaronson', 'Reyna',
+    'Dike', 'Zardes', 'Vázquez', 'Busio', 'Gressel', 'Pomykal', 'Arango', 'Espinoza', 'Ferreira',
+]
+NATIONALITIES = ['USA', 'Mexico', 'Canada', 'Argentina', 'Uruguay', 'Brazil', 'Colombia', 'England', 'Ghana', 'Jamaica']
+NATIONALITY_SHARES = [0.45, 0.08, 0.07, 0.07, 0.05, 0.05, 0.06, 0.07, 0.05, 0.05]
+
+SIZES = {'1k': 1_000, '10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+
+
+def synthetic_players(n, seed=0):
+    """A compact player table of ``n`` rows."""
+    rng = np.random.default_rng(seed)
+
+    leagues = list(LEAGUE_SHAPES)
+    league_idx = rng.choice(len(leagues), n, p=[share for _, share, _ in LEAGUE_SHAPES.values()])
+    clubs = np.array([
+        f"{league} Club {number:02d}"
+        for league, (count, _, _) in LEAGUE_SHAPES.items()
+        for number in range(1, count + 1)
+    ])
+    club_offsets = np.cumsum([0] + [count for count, _, _ in LEAGUE_SHAPES.values()])
+    club_counts = np.array([count for count, _, _ in LEAGUE_SHAPES.values()])
+    club_idx = club_offsets[league_idx] + rng.integers(0, club_counts[league_idx])
+
+    positions = list(POSITION_SHARES)
+    position_idx = rng.choice(len(positions), n, p=list(POSITION_SHARES.values()))
+    attack, defend = np.array([POSITION_PROFILE[p] for p in positions]).T
+    attack, defend = attack[position_idx], defend[position_idx]
+
+    age = np.clip(rng.normal(25.5, 4, n).round(), 16, 40)
+    medians = np.array([median for _, _, median in LEAGUE_SHAPES.values()])[league_idx]
+    peak = np.exp(-((age - 26) / 6) ** 2)
+    market_value = np.clip(rng.lognormal(np.log(medians), 0.9) * (0.4 + peak), 25_000, 30_000_000)
+    rating = np.clip(rng.normal(6.8, 0.45, n) + 0.3 * (league_idx == 0), 5.0, 9.5).round(1)
+
+    matches = rng.integers(1, 35, n)
+    minutes = (matches * rng.uniform(25, 90, n)).round()
+    games = minutes / 90
+
+    first = rng.choice(FIRST_NAMES, n)
+    last = rng.choice(LAST_NAMES, n)
+    names = pd.Series(first, dtype=object) + ' ' + pd.Series(last, dtype=object) + ' ' + pd.Series(np.arange(n)).astype(str)
+
+    df = pd.DataFrame({
+        'id': np.arange(1, n + 1),
+        'name': names,
+        'age': age,
+        'position': np.array(positions)[position_idx],
+        'club': clubs[club_idx],
+        'league': np.array(leagues)[league_idx],
+        'nationality': rng.choice(NATIONALITIES, n, p=NATIONALITY_SHARES),
+        'market_value': market_value.round(-3),
+        'rating': rating,
+        'goals': rng.poisson(0.45 * attack ** 2 * games),
+        'assists': rng.poisson(0.25 * attack * games),
+        'matches': matches,
+        'minutes_played': minutes,
+        'pass_accuracy': np.clip(rng.normal(74 + 8 * defend, 5), 45, 96).round(),
+        'shots_per_game': rng.gamma(2, 0.9 * attack + 0.05).round(1),
+        'key_passes': rng.gamma(2, 0.6 * attack + 0.1).round(1),
+        'dribbles': rng.gamma(2, 0.8 * attack + 0.05).round(1),
+        'aerial_duels': rng.gamma(2, 1.2 * defend + 0.2).round(1),
+        'tackles': rng.gamma(2, 0.9 * defend + 0.1).round(1),
+        'interceptions': rng.gamma(2, 0.7 * defend + 0.1).round(1),
+        'clearances': rng.gamma(2, 1.5 * defend ** 2 + 0.05).round(1),
+        'sources': rng.integers(1, 2 ** len(SOURCE_BITS), n),
+    })
+    return compact_players(df)
@@ -1,10 +1,22 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+from collections import deque
+from dataclasses import replace
 from datetime import datetime
+from functools import wraps
 import json
 
+from scout_core.charts import radar_figure, team_value_figure, trend_figure
+from scout_core.dataset import build_player_index, open_store
+from scout_core.export import EXPORT_FORMATS, ExportCache, export_chunks
+from scout_core.instrumentation import CACHE_STATS, RunProfile
+from scout_core.jobs import JobQueue, spawn_worker
+from scout_core.query import PlayerQuery
+from scout_core.schema import MISSING, SOURCE_LABELS, has_source, missing_as_nan
+from scout_core.stats import percentile_column
+from scout_core.store import player_filter
+from scout_core.watchlist import Watchlist, WatchlistStore
+
 # Page configuration
 st.set_page_config(
     page_title="Swarm Scout Pro",
@@ -13,6 +25,9 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Stage timings of this run (shown in the sidebar debug panel)
+app_profile = st.session_state.app_profile = RunProfile('app')
+
 # Custom CSS for better styling
 st.markdown("""
 <style>
@@ -50,360 +65,104 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Initialize session state
-if 'watchlist' not in st.session_state:
-    st.session_state.watchlist = []
-
-# Mock data
-@st.cache_data
-def load_players_data():
-    players = [
-        {
-            'id': 1,
-            'name': 'Diego Rossi',
-            'age': 26,
-            'position': 'FW',
-            'club': 'Columbus Crew',
-            'league': 'MLS',
-            'nationality': 'Uruguay',
-            'market_value': 8500000,
-            'rating': 8.2,
-            'goals': 15,
-            'assists': 8,
-            'matches': 28,
-            'minutes_played': 2340,
-            'pass_accuracy': 82,
-            'shots_per_game': 3.2,
-            'key_passes': 2.1,
-            'dribbles': 2.8,
-            'aerial_duels': 1.2,
-            'tackles': 0.8,
-            'interceptions': 0.4,
-            'clearances': 0.3,
-            'fbref': True,
-            'transfermarkt': True,
-            'asa': True,
-            'sofascore': True
-        },
-        {
-            'id': 2,
-            'name': 'Tyler Adams',
-            'age': 25,
-            'position': 'CDM',
-            'club': 'AFC Bournemouth',
-            'league': 'MLS',
-            'nationality': 'USA',
-            'market_value': 25000000,
-            'rating': 8.5,
-            'goals': 2,
-            'assists': 4,
-            'matches': 30,
-            'minutes_played': 2567,
-            'pass_accuracy': 88,
-            'shots_per_game': 0.8,
-            'key_passes': 1.5,
-            'dribbles': 1.2,
-            'aerial_duels': 2.1,
-            'tackles': 3.2,
-            'interceptions': 2.8,
-            'clearances': 1.9,
-            'fbref': True,
-            'transfermarkt': True,
-            'asa': True,
-            'sofascore': True
-        },
-        {
-            'id': 3,
-            'name': 'Ricardo Pepi',
-            'age': 21,
-            'position': 'ST',
-            'club': 'PSV Eindhoven',
-            'league': 'MLS',
-            'nationality': 'USA',
-            'market_value': 15000000,
-            'rating': 7.8,
-            'goals': 12,
-            'assists': 3,
-            'matches': 25,
-            'minutes_played': 1890,
-            'pass_accuracy': 76,
-            'shots_per_game': 3.8,
-            'key_passes': 1.2,
-            'dribbles': 1.8,
-            'aerial_duels': 2.5,
-            'tackles': 0.3,
-            'interceptions': 0.2,
-            'clearances': 0.4,
-            'fbref': True,
-            'transfermarkt': True,
-            'asa': False,
-            'sofascore': True
-        },
-        {
-            'id': 4,
-            'name': 'Emiliano Rigoni',
-            'age': 31,
-            'position': 'RW',
-            'club': 'Austin FC',
-            'league': 'MLS',
-            'nationality': 'Argentina',
-            'market_value': 3500000,
-            'rating': 7.5,
-            'goals': 8,
-            'assists': 11,
-            'matches': 32,
-            'minutes_played': 2456,
-            'pass_accuracy': 84,
-            'shots_per_game': 2.4,
-            'key_passes': 2.8,
-            'dribbles': 3.1,
-            'aerial_duels': 0.8,
-            'tackles': 0.9,
-            'interceptions': 0.6,
-            'clearances': 0.2,
-            'fbref': True,
-            'transfermarkt': True,
-            'asa': True,
-            'sofascore': True
-        },
-        {
-            'id': 5,
-            'name': 'Tanner Tessmann',
-            'age': 23,
-            'position': 'CM',
-            'club': 'Venezia FC',
-            'league': 'USL Championship',
-            'nationality': 'USA',
-            'market_value': 4000000,
-            'rating': 7.6,
-            'goals': 5,
-            'assists': 7,
-            'matches': 29,
-            'minutes_played': 2234,
-            'pass_accuracy': 85,
-            'shots_per_game': 1.3,
-            'key_passes': 2.0,
-            'dribbles': 1.5,
-            'aerial_duels': 1.8,
-            'tackles': 2.4,
-            'interceptions': 1.9,
-            'clearances': 1.2,
-            'fbref': True,
-            'transfermarkt': True,
-            'asa': False,
-            'sofascore': True
-        },
-        {
-            'id': 6,
-            'name': 'Nick Lima',
-            'age': 29,
-            'position': 'RB',
-            'club': 'New England Revolution',
-            'league': 'MLS',
-            'nationality': 'USA',
-            'market_value': 2500000,
-            'rating': 7.2,
-            'goals': 1,
-            'assists': 6,
-            'matches': 28,
-            'minutes_played': 2320,
-            'pass_accuracy': 81,
-            'shots_per_game': 0.6,
-            'key_passes': 1.4,
-            'dribbles': 1.9,
-            'aerial_duels': 1.5,
-            'tackles': 2.8,
-            'interceptions': 2.1,
-            'clearances': 2.5,
-            'fbref': True,
-            'transfermarkt': True,
-            'asa': True,
-            'sofascore': True
-        },
-        {
-            'id': 7,
-            'name': 'Jonathan Lewis',
-            'age': 26,
-            'position': 'LW',
-            'club': 'Colorado Rapids',
-            'league': 'MLS',
-            'nationality': 'USA',
-            'market_value': 3000000,
-            'rating': 7.3,
-            'goals': 9,
-            'assists': 5,
-            'matches': 26,
-            'minutes_played': 1856,
-            'pass_accuracy': 79,
-            'shots_per_game': 2.6,
-            'key_passes': 1.7,
-            'dribbles': 3.4,
-            'aerial_duels': 0.6,
-            'tackles': 0.7,
-            'interceptions': 0.4,
-            'clearances': 0.1,
-            'fbref': True,
-            'transfermarkt': False,
-            'asa': True,
-            'sofascore': True
-        },
-        {
-            'id': 8,
-            'name': 'Hadji Barry',
-            'age': 31,
-            'position': 'ST',
-            'club': 'Colorado Springs',
-            'league': 'USL Championship',
-            'nationality': 'Guinea',
-            'market_value': 800000,
-            'rating': 7.0,
-            'goals': 18,
-            'assists': 4,
-            'matches': 30,
-            'minutes_played': 2456,
-            'pass_accuracy': 72,
-            'shots_per_game': 3.9,
-            'key_passes': 1.0,
-            'dribbles': 1.3,
-            'aerial_duels': 3.2,
-            'tackles': 0.4,
-            'interceptions': 0.3,
-            'clearances': 0.5,
-            'fbref': True,
-            'transfermarkt': True,
-            'asa': False,
-            'sofascore': False
-        },
-        {
-            'id': 9,
-            'name': 'Milan Iloski',
-            'age': 24,
-            'position': 'CAM',
-            'club': 'Charleston Battery',
-            'league': 'USL Championship',
-            'nationality': 'North Macedonia',
-            'market_value': 1200000,
-            'rating': 7.1,
-            'goals': 7,
-            'assists': 9,
-            'matches': 28,
-            'minutes_played': 2134,
-            'pass_accuracy': 83,
-            'shots_per_game': 2.1,
-            'key_passes': 2.9,
-            'dribbles': 2.2,
-            'aerial_duels': 0.9,
-            'tackles': 1.1,
-            'interceptions': 0.8,
-            'clearances': 0.3,
-            'fbref': True,
-            'transfermarkt': False,
-            'asa': False,
-            'sofascore': True
-        },
-        {
-            'id': 10,
-            'name': 'Arturo Rodriguez',
-            'age': 22,
-            'position': 'CM',
-            'club': 'FC Tulsa',
-            'league': 'USL Championship',
-            'nationality': 'USA',
-            'market_value': 900000,
-            'rating': 6.9,
-            'goals': 3,
-            'assists': 6,
-            'matches': 31,
-            'minutes_played': 2567,
-            'pass_accuracy': 86,
-            'shots_per_game': 1.0,
-            'key_passes': 1.8,
-            'dribbles': 1.4,
-            'aerial_duels': 1.6,
-            'tackles': 2.6,
-            'interceptions': 2.2,
-            'clearances': 1.4,
-            'fbref': True,
-            'transfermarkt': True,
-            'asa': False,
-            'sofascore': True
-        },
-        {
-            'id': 11,
-            'name': 'Dariusz Formella',
-            'age': 28,
-            'position': 'RW',
-            'club': 'Union Omaha',
-            'league': 'USL League One',
-            'nationality': 'Poland',
-            'market_value': 600000,
-            'rating': 6.8,
-            'goals': 11,
-            'assists': 8,
-            'matches': 27,
-            'minutes_played': 2234,
-            'pass_accuracy': 80,
-            'shots_per_game': 2.8,
-            'key_passes': 2.3,
-            'dribbles': 2.9,
-            'aerial_duels': 0.7,
-            'tackles': 0.8,
-            'interceptions': 0.5,
-            'clearances': 0.2,
-            'fbref': False,
-            'transfermarkt': True,
-            'asa': False,
-            'sofascore': False
-        },
-        {
-            'id': 12,
-            'name': 'Greg Hurst',
-            'age': 27,
-            'position': 'ST',
-            'club': 'Chattanooga Red Wolves',
-            'league': 'USL League One',
-            'nationality': 'USA',
-            'market_value': 450000,
-            'rating': 6.7,
-            'goals': 14,
-            'assists': 3,
-            'matches': 29,
-            'minutes_played': 2345,
-            'pass_accuracy': 74,
-            'shots_per_game': 3.4,
-            'key_passes': 0.9,
-            'dribbles': 1.1,
-            'aerial_duels': 2.8,
-            'tackles': 0.3,
-            'interceptions': 0.2,
-            'clearances': 0.4,
-            'fbref': False,
-            'transfermarkt': False,
-            'asa': False,
-            'sofascore': True
-        }
-    ]
-    return pd.DataFrame(players)
-
-@st.cache_data
-def load_teams_data():
-    teams = [
-        {'id': 1, 'name': 'LA Galaxy', 'league': 'MLS', 'avg_age': 26.3, 'market_value': 45200000, 'players': 28},
-        {'id': 2, 'name': 'Inter Miami CF', 'league': 'MLS', 'avg_age': 27.1, 'market_value': 52300000, 'players': 30},
-        {'id': 3, 'name': 'Phoenix Rising FC', 'league': 'USL Championship', 'avg_age': 24.8, 'market_value': 8900000, 'players': 26},
-        {'id': 4, 'name': 'Louisville City FC', 'league': 'USL Championship', 'avg_age': 25.5, 'market_value': 7200000, 'players': 27},
-        {'id': 5, 'name': 'Union Omaha', 'league': 'USL League One', 'avg_age': 23.9, 'market_value': 3100000, 'players': 24},
-        {'id': 6, 'name': 'Richmond Kickers', 'league': 'USL League One', 'avg_age': 24.2, 'market_value': 2800000, 'players': 25}
-    ]
-    return pd.DataFrame(teams)
+# Data store (seeded with the sample data until the first sync)
+@CACHE_STATS.counted('store')
+@st.cache_resource
+def get_store():
+    CACHE_STATS.miss('store')
+    return open_store()
+
+# Cached per store version so every worker reloads after a sync rewrites the data;
+# per-90 and percentile stats are computed once per load
+@CACHE_STATS.counted('player_index')
+@st.cache_resource(max_entries=1)
+def load_player_index(version):
+    CACHE_STATS.miss('player_index')
+    return build_player_index(get_store().load_players())
+
+# Team aggregates are precomputed in the store; one entry per Teams league option
+@CACHE_STATS.counted('teams')
+@st.cache_resource(max_entries=4)
+def load_teams_data(version, league=None):
+    CACHE_STATS.miss('teams')
+    return get_store().load_teams(player_filter(league=league))
+
+@CACHE_STATS.counted('watchlist_store')
+@st.cache_resource
+def get_watchlist_store():
+    CACHE_STATS.miss('watchlist_store')
+    return WatchlistStore()
+
+@CACHE_STATS.counted('sync_jobs')
+@st.cache_resource
+def get_sync_jobs():
+    CACHE_STATS.miss('sync_jobs')
+    return JobQueue()
+
+@st.cache_resource
+def get_export_cache():
+    return ExportCache()
+
+# Chart figures, shared by every session: radars per (data version, players)
+# since percentiles change with each load, the team chart per league option
+@CACHE_STATS.counted('radar_figure')
+@st.cache_resource(max_entries=256)
+def load_radar_figure(version, player_ids, _player_index):
+    CACHE_STATS.miss('radar_figure')
+    return radar_figure(_player_index.df.iloc[_player_index.rows_for_ids(player_ids)])
+
+# Rating/value trend of one player; None until the history has two snapshots of them
+@CACHE_STATS.counted('trend_figure')
+@st.cache_resource(max_entries=256)
+def load_trend_figure(history_version, player_id):
+    CACHE_STATS.miss('trend_figure')
+    history = get_store().history.player_history(player_id)
+    return trend_figure(history) if len(history) > 1 else None
+
+@CACHE_STATS.counted('team_figure')
+@st.cache_resource(max_entries=4)
+def load_team_figure(version, league=None):
+    CACHE_STATS.miss('team_figure')
+    return team_value_figure(load_teams_data(version, league))
+
+# Sidebar slider extents; a slider left at its full extent doesn't filter,
+# so players whose age or value no source reported stay listed
+AGE_BOUNDS = (16, 40)
+VALUE_BOUNDS = (0, 30000000)
+
+# Players grid paging
+PAGE_SIZE_OPTIONS = [10, 25, 50, 100]
+
+# Matches listed by "Find similar"
+SIMILAR_PLAYERS = 10
+
+# Players overlaid in the comparison radar
+MAX_COMPARED = 5
+
+# The Watchlist tab polls for edits made in the Players tab or other sessions
+WATCHLIST_REFRESH_SECONDS = 5
+
+# The sidebar polls the sync queue for progress and for data written by finished syncs
+SYNC_POLL_SECONDS = 2
+
+# Run profiles kept per session for the debug panel
+PROFILE_HISTORY = 50
 
 # Helper functions
+def is_missing(value):
+    return pd.isna(value) or value == MISSING
+
+def format_stat(value, spec=''):
+    return "–" if is_missing(value) else format(value, spec)
+
 def format_value(value):
+    if is_missing(value):
+        return "–"
     if value >= 1000000:
         return f"${value/1000000:.1f}M"
     elif value >= 1000:
         return f"${value/1000:.0f}K"
-    return f"${value}"
+    return f"${value:.0f}"
 
 def get_position_color(position):
     colors = {
@@ -430,16 +189,141 @@ def get_rating_color(rating):
         return '#f97316'
     return '#dc2626'
 
+def format_per90(player, stat):
+    if is_missing(player[stat]):
+        return "–"
+    return f"{player[stat]:.2f} (P{player[percentile_column(stat)]:.0f})"
+
+def show_similar(player_id):
+    st.session_state.similar_to = int(player_id)
+
+def clear_similar():
+    st.session_state.pop('similar_to', None)
+
+def toggle_compare(player_id):
+    compared = st.session_state.setdefault('compared', [])
+    if player_id in compared:
+        compared.remove(player_id)
+    elif len(compared) < MAX_COMPARED:
+        compared.append(player_id)
+
+def clear_compare():
+    st.session_state.compared = []
+
+def download_export(path, fmt, label, file_stem, key):
+    extension, mime = EXPORT_FORMATS[fmt]
+    with open(path, 'rb') as f:
+        st.download_button(
+            label=label,
+            data=f,
+            file_name=f"{file_stem}_{datetime.now().strftime('%Y%m%d')}.{extension}",
+            mime=mime,
+            key=key
+        )
+
+def finish_profile(profile):
+    profile.finish()
+    st.session_state.setdefault('profiles', deque(maxlen=PROFILE_HISTORY)).append(profile.as_dict())
+
+def profiled(scope):
+    """Pass a tab the profile to record into: the app run's during a full
+    run, or one of its own (finished here) when the tab reruns as a fragment."""
+    def decorate(render):
+        @wraps(render)
+        def run(*args):
+            profile = st.session_state.get('app_profile')
+            if profile is not None and not profile.finished:
+                return render(profile, *args)
+            profile = RunProfile(scope)
+            try:
+                return render(profile, *args)
+            finally:
+                finish_profile(profile)
+        return run
+    return decorate
+
+def render_debug_panel(profile):
+    st.markdown("### Debug")
+    st.caption(f"Last full run: {profile.total * 1000:.0f} ms")
+    st.dataframe(pd.DataFrame({
+        'Stage': list(profile.stages),
+        'ms': [round(seconds * 1000, 1) for seconds in profile.stages.values()],
+    }), hide_index=True, use_container_width=True)
+
+    profiles = list(st.session_state.get('profiles', []))
+    st.markdown("**Recent runs**")
+    st.dataframe(pd.DataFrame({
+        'Scope': [run['scope'] for run in profiles[::-1]],
+        'ms': [run['total_ms'] for run in profiles[::-1]],
+        'Started': [datetime.fromtimestamp(run['started_at']).strftime('%H:%M:%S') for run in profiles[::-1]],
+    }), hide_index=True, use_container_width=True)
+
+    cache_stats = CACHE_STATS.snapshot()
+    st.markdown("**Loader caches**")
+    st.dataframe(pd.DataFrame({
+        'Loader': list(cache_stats),
+        'Hits': [counts['hits'] for counts in cache_stats.values()],
+        'Misses': [counts['misses'] for counts in cache_stats.values()],
+    }), hide_index=True, use_container_width=True)
+
+    st.download_button(
+        "Download profiles (JSON)",
+        data=json.dumps({'runs': profiles, 'caches': cache_stats}, indent=2),
+        file_name=f"scout_profiles_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+        mime="application/json"
+    )
+
+@st.fragment(run_every=SYNC_POLL_SECONDS)
+def sync_status(sync_jobs, players_version):
+    """Last sync and in-flight progress; reruns the app once a sync has rewritten the players."""
+    if get_store().version('players') != players_version:
+        st.rerun()
+
+    job = sync_jobs.active()
+    if job is not None:
+        done, total = job.progress
+        if job.status == 'queued':
+            st.progress(0.0, text="Sync queued...")
+        else:
+            st.progress(done / total if total else 0.0, text=f"Syncing... {done} of {total} pages")
+            for source, (source_done, source_total) in job.sources.items():
+                st.caption(f"{SOURCE_LABELS.get(source, source)}: {source_done}/{source_total} pages")
+
+    last_sync = sync_jobs.last_finished()
+    if last_sync is None:
+        return
+    finished = datetime.fromtimestamp(last_sync.finished_at).strftime('%Y-%m-%d %H:%M')
+    if last_sync.status == 'failed':
+        st.error(f"Sync failed at {finished}: {last_sync.message}")
+    elif last_sync.coverage:
+        st.success("Synced " + ", ".join(
+            f"{SOURCE_LABELS.get(source, source)}: {count}" for source, count in last_sync.coverage.items()
+        ))
+        st.caption(
+            f"Last sync: {finished} · {last_sync.pages - last_sync.unchanged} of {last_sync.pages} "
+            f"pages changed, {last_sync.changed} players updated"
+        )
+    else:
+        st.error(f"Sync at {finished} failed: no source returned any data")
+    if last_sync.errors:
+        with st.expander(f"{len(last_sync.errors)} pages failed"):
+            for error in last_sync.errors:
+                st.caption(error)
+
 # Load data
-players_df = load_players_data()
-teams_df = load_teams_data()
+with app_profile.stage("load"):
+    store = get_store()
+    player_index = load_player_index(store.version('players'))
+    players_df = player_index.df
 
 # Header
 st.title("Swarm Scout Pro")
 st.markdown("**Multi-source scouting data from USL League One, USL Championship, and MLS**")
 
 # Sidebar
-with st.sidebar:
+with st.sidebar, app_profile.stage("sidebar"):
+    scout_name = st.text_input("Scout", value="shared", help="Everyone using the same scout name shares a watchlist")
+    
     st.header("Filters")
     
     # League filter
@@ -457,17 +341,17 @@ with st.sidebar:
     # Age range
     age_range = st.slider(
         "Age Range",
-        min_value=16,
-        max_value=40,
-        value=(16, 40)
+        min_value=AGE_BOUNDS[0],
+        max_value=AGE_BOUNDS[1],
+        value=AGE_BOUNDS
     )
     
     # Market value range
     value_range = st.slider(
         "Market Value Range",
-        min_value=0,
-        max_value=30000000,
-        value=(0, 30000000),
+        min_value=VALUE_BOUNDS[0],
+        max_value=VALUE_BOUNDS[1],
+        value=VALUE_BOUNDS,
         step=100000,
         format="$%d"
     )
@@ -475,7 +359,7 @@ with st.sidebar:
     # Sort options
     sort_by = st.selectbox(
         "Sort By",
-        ["rating", "age", "market_value", "goals", "assists"]
+        ["rating", "age", "market_value", "goals", "assists", "goals_per90", "assists_per90"]
     )
     
     sort_order = st.radio(
@@ -485,143 +369,237 @@ with st.sidebar:
     
     st.divider()
     
-    # Sync button
+    # Sync button (queues a sync of the selected league, or all of them, for the background worker)
     if st.button("Sync Data", use_container_width=True):
-        st.info("Data sync functionality would connect to FBref, Transfermarkt, ASA, and Sofascore APIs")
+        sync_jobs = get_sync_jobs()
+        sync_jobs.submit(None if league_filter == "All Leagues" else [league_filter])
+        if not sync_jobs.worker_alive():
+            spawn_worker()
+    sync_status(get_sync_jobs(), store.version('players'))
+    
+    st.divider()
+    show_debug = st.toggle("Debug panel", key="debug_panel", help="Stage timings and cache counters of recent runs")
+    debug_panel = st.container()
 
-# Main content
-tab1, tab2, tab3 = st.tabs(["Players", "Teams", "Watchlist"])
+# Watchlist for the current scout, shared with their other sessions
+if st.session_state.get('watchlist_owner') != scout_name:
+    st.session_state.watchlist = Watchlist(get_watchlist_store(), scout_name)
+    st.session_state.watchlist_owner = scout_name
+watchlist = st.session_state.watchlist
+
+# Sidebar filters (search is added by the Players tab)
+sidebar_query = PlayerQuery(
+    league=None if league_filter == "All Leagues" else league_filter,
+    position=None if position_filter == "All Positions" else position_filter,
+    age_range=None if age_range == AGE_BOUNDS else age_range,
+    value_range=None if value_range == VALUE_BOUNDS else value_range,
+    sort_by=sort_by,
+    ascending=sort_order == "Ascending"
+)
+
+# Each tab is a fragment: its own widgets rerun only that tab, while sidebar
+# changes (and syncs) rerun the whole script with fresh arguments.
 
 # Players Tab
-with tab1:
+@st.fragment
+@profiled('players')
+def players_tab(profile, player_index, players_version, sidebar_query, watchlist):
+    watchlist.refresh()
+
     # Search bar
-    search_query = st.text_input("Search players or clubs...", placeholder="Enter player or club name")
-    
-    # Apply filters
-    filtered_df = players_df.copy()
-    
-    if league_filter != "All Leagues":
-        filtered_df = filtered_df[filtered_df['league'] == league_filter]
-    
-    if position_filter != "All Positions":
-        filtered_df = filtered_df[filtered_df['position'] == position_filter]
-    
-    filtered_df = filtered_df[
-        (filtered_df['age'] >= age_range[0]) & 
-        (filtered_df['age'] <= age_range[1])
-    ]
+    search_col, fuzzy_col = st.columns([5, 1])
+    with search_col:
+        search_query = st.text_input("Search players or clubs...", placeholder="Enter player, club or nationality")
+    with fuzzy_col:
+        fuzzy_search = st.checkbox("Fuzzy match", help="Also match misspelled names")
+
+    # Apply filters and sort through the prebuilt index (no full-frame copy)
+    player_query = replace(sidebar_query, search=search_query, fuzzy=fuzzy_search)
+    with profile.stage("players.filter"):
+        mask = player_index.mask(player_query)
+    with profile.stage("players.sort"):
+        rows = player_index.order(mask, player_query.sort_by, player_query.ascending)
+        filtered_df = player_index.df.iloc[rows]
+
+    # Players similar to the one picked with "Find similar" (sidebar filters
+    # apply, the search box doesn't)
+    with profile.stage("players.similar"):
+        similar_rows = player_index.rows_for_ids([st.session_state.get('similar_to', -1)])
+        if len(similar_rows):
+            target = player_index.df.iloc[similar_rows[0]]
+            with st.container(border=True):
+                title_col, option_col, clear_col = st.columns([4, 2, 1])
+                with title_col:
+                    st.markdown(f"### Players similar to {target['name']}")
+                with option_col:
+                    same_position = st.checkbox("Same position only", value=True, key="similar_same_position")
+                with clear_col:
+                    st.button("Clear", key="similar_clear", on_click=clear_similar)
+
+                positions, distances = player_index.similarity_index.similar(
+                    similar_rows[0],
+                    k=SIMILAR_PLAYERS,
+                    candidates=player_index.select(sidebar_query),
+                    same_position=same_position
+                )
+                if len(positions) == 0:
+                    st.info("No similar players match the current filters.")
+                else:
+                    similar_df = player_index.df.iloc[positions]
+                    st.dataframe(pd.DataFrame({
+                        'Player': similar_df['name'].to_numpy(),
+                        'Position': similar_df['position'].to_numpy(),
+                        'Club': similar_df['club'].to_numpy(),
+                        'League': similar_df['league'].to_numpy(),
+                        'Age': similar_df['age'].map(format_stat).to_numpy(),
+                        'Value': similar_df['market_value'].map(format_value).to_numpy(),
+                        'Rating': similar_df['rating'].round(1).to_numpy(),
+                        'Distance': distances.round(2),
+                    }), hide_index=True, use_container_width=True)
+
+    # Players picked with "Compare", overlaid in one radar
+    compared = tuple(st.session_state.get('compared', ()))
+    if compared:
+        with st.container(border=True):
+            title_col, clear_col = st.columns([6, 1])
+            with title_col:
+                st.markdown(f"### Comparing {len(compared)} of up to {MAX_COMPARED} players")
+            with clear_col:
+                st.button("Clear", key="compare_clear", on_click=clear_compare)
+            with profile.stage("players.chart"):
+                st.plotly_chart(load_radar_figure(players_version, compared, player_index),
+                                use_container_width=True, key="compare_radar")
     
-    filtered_df = filtered_df[
-        (filtered_df['market_value'] >= value_range[0]) & 
-        (filtered_df['market_value'] <= value_range[1])
-    ]
+    # Display metrics
+    with profile.stage("players.metrics"):
+        known = missing_as_nan(filtered_df[['age', 'rating', 'goals']])
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Total Players", len(filtered_df))
+        with col2:
+            st.metric("Avg Age", format_stat(known['age'].mean(), '.1f'))
+        with col3:
+            st.metric("Avg Rating", format_stat(known['rating'].mean(), '.1f'))
+        with col4:
+            st.metric("Total Goals", int(known['goals'].sum()))
     
-    if search_query:
-        filtered_df = filtered_df[
-            filtered_df['name'].str.contains(search_query, case=False) |
-            filtered_df['club'].str.contains(search_query, case=False)
-        ]
+    # Export every matching player, with derived stats (cached on disk per
+    # data version and filter state)
+    if st.toggle("Export results", key="players_export"):
+        format_col, download_col = st.columns([1, 3])
+        with format_col:
+            export_format = st.selectbox("Export format", list(EXPORT_FORMATS), key="players_export_format",
+                                         label_visibility="collapsed")
+        with download_col, profile.stage("players.export"):
+            export_path = get_export_cache().get(
+                ('players', players_version, player_query), export_format,
+                lambda: export_chunks(player_index.df, rows)
+            )
+            download_export(export_path, export_format, f"Download {len(rows)} players",
+                            "soccer_scout_players", key="players_export_download")
     
-    # Sort
-    ascending = sort_order == "Ascending"
-    filtered_df = filtered_df.sort_values(by=sort_by, ascending=ascending)
+    st.divider()
     
-    # Display metrics
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.metric("Total Players", len(filtered_df))
-    with col2:
-        st.metric("Avg Age", f"{filtered_df['age'].mean():.1f}")
-    with col3:
-        st.metric("Avg Rating", f"{filtered_df['rating'].mean():.1f}")
-    with col4:
-        st.metric("Total Goals", filtered_df['goals'].sum())
+    # Players grid (paged: only the visible page of players is rendered)
+    total_players = len(filtered_df)
+    page_size = st.session_state.get('players_page_size', PAGE_SIZE_OPTIONS[0])
+    num_pages = max(1, -(-total_players // page_size))
+    if st.session_state.get('players_page', 1) > num_pages:
+        st.session_state.players_page = num_pages
     
-    st.divider()
+    page_col1, page_col2, page_col3 = st.columns([1, 1, 2])
+    with page_col1:
+        page = st.number_input("Page", min_value=1, max_value=num_pages, step=1, key="players_page")
+    with page_col2:
+        st.selectbox("Players per page", PAGE_SIZE_OPTIONS, key="players_page_size")
+    start = (page - 1) * page_size
+    page_df = filtered_df.iloc[start:start + page_size]
+    with page_col3:
+        if total_players > 0:
+            st.caption(f"Showing {start + 1}-{start + len(page_df)} of {total_players} players")
     
-    # Players grid
-    for idx, player in filtered_df.iterrows():
-        with st.expander(f"**{player['name']}** - {player['position']} | {player['club']} | Rating: {player['rating']}", expanded=False):
-            col1, col2, col3 = st.columns([2, 2, 1])
+    with profile.stage("players.render"):
+        for idx, player in page_df.iterrows():
+            with st.expander(f"**{player['name']}** - {player['position']} | {player['club']} | Rating: {format_stat(player['rating'], 'g')}", expanded=False):
+                col1, col2, col3 = st.columns([2, 2, 1])
             
-            with col1:
-                st.markdown("### Player Info")
-                st.write(f"**Age:** {player['age']}")
-                st.write(f"**Nationality:** {player['nationality']}")
-                st.write(f"**Market Value:** {format_value(player['market_value'])}")
-                st.write(f"**League:** {player['league']}")
+                with col1:
+                    st.markdown("### Player Info")
+                    st.write(f"**Age:** {format_stat(player['age'])}")
+                    st.write(f"**Nationality:** {player['nationality']}")
+                    st.write(f"**Market Value:** {format_value(player['market_value'])}")
+                    st.write(f"**League:** {player['league']}")
                 
-                # Add to watchlist button
-                if st.button(f"{'Remove from' if player['id'] in st.session_state.watchlist else 'Add to'} Watchlist", 
-                           key=f"watchlist_{player['id']}"):
-                    if player['id'] in st.session_state.watchlist:
-                        st.session_state.watchlist.remove(player['id'])
-                    else:
-                        st.session_state.watchlist.append(player['id'])
-                    st.rerun()
+                    # Add to watchlist button (toggled in a callback, before the rerun renders)
+                    st.button(f"{'Remove from' if player['id'] in watchlist else 'Add to'} Watchlist", 
+                              key=f"watchlist_{player['id']}",
+                              on_click=watchlist.toggle, args=(player['id'],))
+                    st.button("Find similar", key=f"similar_{player['id']}",
+                              on_click=show_similar, args=(player['id'],))
+                    compared = player['id'] in st.session_state.get('compared', ())
+                    st.button("Remove from comparison" if compared else "Compare",
+                              key=f"compare_{player['id']}",
+                              disabled=not compared and len(st.session_state.get('compared', ())) >= MAX_COMPARED,
+                              on_click=toggle_compare, args=(player['id'],))
             
-            with col2:
-                st.markdown("### Performance Stats")
-                stats_col1, stats_col2 = st.columns(2)
-                with stats_col1:
-                    st.write(f"**Goals:** {player['goals']}")
-                    st.write(f"**Assists:** {player['assists']}")
-                    st.write(f"**Matches:** {player['matches']}")
-                    st.write(f"**Minutes:** {player['minutes_played']}")
-                with stats_col2:
-                    st.write(f"**Shots/Game:** {player['shots_per_game']}")
-                    st.write(f"**Key Passes:** {player['key_passes']}")
-                    st.write(f"**Pass Acc:** {player['pass_accuracy']}%")
-                    st.write(f"**Dribbles:** {player['dribbles']}")
+                with col2:
+                    st.markdown("### Performance Stats")
+                    stats_col1, stats_col2 = st.columns(2)
+                    with stats_col1:
+                        st.write(f"**Goals:** {format_stat(player['goals'])}")
+                        st.write(f"**Assists:** {format_stat(player['assists'])}")
+                        st.write(f"**Matches:** {format_stat(player['matches'])}")
+                        st.write(f"**Minutes:** {format_stat(player['minutes_played'])}")
+                    with stats_col2:
+                        st.write(f"**Shots/Game:** {player['shots_per_game']:g}")
+                        st.write(f"**Key Passes:** {player['key_passes']:g}")
+                        st.write(f"**Pass Acc:** {player['pass_accuracy']:g}%")
+                        st.write(f"**Dribbles:** {player['dribbles']:g}")
+                    st.markdown("### Per 90")
+                    per90_col1, per90_col2 = st.columns(2)
+                    with per90_col1:
+                        st.write(f"**Goals:** {format_per90(player, 'goals_per90')}")
+                        st.write(f"**Assists:** {format_per90(player, 'assists_per90')}")
+                        st.write(f"**Shots:** {format_per90(player, 'shots_per90')}")
+                    with per90_col2:
+                        st.write(f"**Key Passes:** {format_per90(player, 'key_passes_per90')}")
+                        st.write(f"**Dribbles:** {format_per90(player, 'dribbles_per90')}")
+                        st.write(f"**Tackles:** {format_per90(player, 'tackles_per90')}")
+                    st.caption("P = percentile among players of the same position group in the league")
             
-            with col3:
-                st.markdown("### Data Sources")
-                sources = {
-                    'FBref': player['fbref'],
-                    'Transfermarkt': player['transfermarkt'],
-                    'ASA': player['asa'],
-                    'Sofascore': player['sofascore']
-                }
-                for source, available in sources.items():
-                    if available:
-                        st.success(f"✓ {source}")
-                    else:
-                        st.error(f"✗ {source}")
-            
-            # Advanced stats visualization
-            st.markdown("### Performance Breakdown")
-            
-            # Create radar chart
-            categories = ['Goals', 'Assists', 'Pass Acc', 'Dribbles', 'Tackles', 'Interceptions']
-            values = [
-                player['goals'] / filtered_df['goals'].max() * 100,
-                player['assists'] / filtered_df['assists'].max() * 100,
-                player['pass_accuracy'],
-                player['dribbles'] / filtered_df['dribbles'].max() * 100,
-                player['tackles'] / filtered_df['tackles'].max() * 100,
-                player['interceptions'] / filtered_df['interceptions'].max() * 100
-            ]
+                with col3:
+                    st.markdown("### Data Sources")
+                    for source, label in SOURCE_LABELS.items():
+                        if has_source(player['sources'], source):
+                            st.success(f"✓ {label}")
+                        else:
+                            st.error(f"✗ {label}")
             
-            fig = go.Figure(data=go.Scatterpolar(
-                r=values,
-                theta=categories,
-                fill='toself'
-            ))
+                # Advanced stats visualization (built only when requested)
+                if st.toggle("Show performance breakdown", key=f"radar_{player['id']}"):
+                    st.markdown("### Performance Breakdown")
             
-            fig.update_layout(
-                polar=dict(
-                    radialaxis=dict(
-                        visible=True,
-                        range=[0, 100]
-                    )),
-                showlegend=False,
-                height=300
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
+                    # Percentiles within the player's league and position group
+                    with profile.stage("players.chart"):
+                        st.plotly_chart(load_radar_figure(players_version, (int(player['id']),), player_index),
+                                        use_container_width=True, key=f"radar_chart_{player['id']}")
+
+                # Rating and market value across past syncs (read from the snapshot history)
+                if st.toggle("Show rating & value trend", key=f"trend_{player['id']}"):
+                    with profile.stage("players.chart"):
+                        fig = load_trend_figure(get_store().history.version(), int(player['id']))
+                    if fig is None:
+                        st.info("No trend yet: history builds up as syncs change this player's stats.")
+                    else:
+                        st.plotly_chart(fig, use_container_width=True, key=f"trend_chart_{player['id']}")
+
+    # Persist this run's watchlist edits in one write
+    watchlist.flush()
 
 # Teams Tab
-with tab2:
+@st.fragment
+@profiled('teams')
+def teams_tab(profile, teams_version):
     # Filter teams by league
     teams_league_filter = st.selectbox(
         "Filter by League",
@@ -629,87 +607,122 @@ with tab2:
         key="teams_league"
     )
     
-    filtered_teams = teams_df.copy()
-    if teams_league_filter != "All Leagues":
-        filtered_teams = filtered_teams[filtered_teams['league'] == teams_league_filter]
+    teams_league = None if teams_league_filter == "All Leagues" else teams_league_filter
+    with profile.stage("teams.load"):
+        filtered_teams = load_teams_data(teams_version, teams_league)
     
     # Display teams
-    for idx, team in filtered_teams.iterrows():
-        with st.container():
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.markdown(f"### {team['name']}")
-                st.write(f"League: {team['league']}")
-            with col2:
-                st.metric("Squad Size", team['players'])
-            with col3:
-                st.metric("Avg Age", f"{team['avg_age']:.1f}")
-            with col4:
-                st.metric("Total Value", format_value(team['market_value']))
-            st.divider()
+    with profile.stage("teams.render"):
+        for idx, team in filtered_teams.iterrows():
+            with st.container():
+                col1, col2, col3, col4, col5, col6 = st.columns([2, 1, 1, 1, 1, 1])
+                with col1:
+                    st.markdown(f"### {team['name']}")
+                    st.write(f"League: {team['league']}")
+                with col2:
+                    st.metric("Squad Size", team['players'])
+                with col3:
+                    st.metric("Avg Age", format_stat(team['avg_age'], '.1f'))
+                with col4:
+                    st.metric("Total Value", format_value(team['market_value']),
+                              help=f"Median player value: {format_value(team['median_value'])}")
+                with col5:
+                    st.metric("Avg Rating", format_stat(team['avg_rating'], '.1f'))
+                with col6:
+                    st.metric("Goals", team['goals'])
+                st.divider()
     
     # Team comparison chart
     if len(filtered_teams) > 0:
         st.markdown("### Team Market Value Comparison")
-        fig = px.bar(
-            filtered_teams,
-            x='name',
-            y='market_value',
-            color='league',
-            title="Market Value by Team",
-            labels={'market_value': 'Market Value ($)', 'name': 'Team'}
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        with profile.stage("teams.chart"):
+            st.plotly_chart(load_team_figure(teams_version, teams_league), use_container_width=True)
 
 # Watchlist Tab
-with tab3:
-    if len(st.session_state.watchlist) == 0:
-        st.info("Your watchlist is empty. Add players from the Players tab to track them here.")
-    else:
-        watchlist_players = players_df[players_df['id'].isin(st.session_state.watchlist)]
-        
-        st.markdown(f"### Tracking {len(watchlist_players)} Players")
-        
-        # Watchlist summary metrics
-        col1, col2, col3, col4 = st.columns(4)
-        with col1:
-            st.metric("Total Value", format_value(watchlist_players['market_value'].sum()))
-        with col2:
-            st.metric("Avg Rating", f"{watchlist_players['rating'].mean():.1f}")
-        with col3:
-            st.metric("Total Goals", watchlist_players['goals'].sum())
-        with col4:
-            st.metric("Total Assists", watchlist_players['assists'].sum())
+@st.fragment(run_every=WATCHLIST_REFRESH_SECONDS)
+@profiled('watchlist')
+def watchlist_tab(profile, player_index, players_version, watchlist):
+    watchlist.refresh()
+    players_df = player_index.df
+
+    with profile.stage("watchlist.render"):
+        if len(watchlist) == 0:
+            st.info("Your watchlist is empty. Add players from the Players tab to track them here.")
+        else:
+            watchlist_rows = player_index.rows_for_ids(watchlist)
+            watchlist_players = players_df.iloc[watchlist_rows]
         
-        st.divider()
+            st.markdown(f"### Tracking {len(watchlist_players)} Players")
         
-        # Display watchlist players
-        for idx, player in watchlist_players.iterrows():
-            col1, col2, col3, col4, col5 = st.columns([3, 2, 2, 2, 1])
+            # Watchlist summary metrics
+            known = missing_as_nan(watchlist_players[['market_value', 'rating', 'goals', 'assists']])
+            col1, col2, col3, col4 = st.columns(4)
             with col1:
-                st.write(f"**{player['name']}**")
-                st.write(f"{player['position']} | {player['club']}")
+                st.metric("Total Value", format_value(known['market_value'].sum()))
             with col2:
-                st.write(f"Rating: **{player['rating']}**")
+                st.metric("Avg Rating", format_stat(known['rating'].mean(), '.1f'))
             with col3:
-                st.write(f"Value: {format_value(player['market_value'])}")
+                st.metric("Total Goals", int(known['goals'].sum()))
             with col4:
-                st.write(f"G: {player['goals']} | A: {player['assists']}")
-            with col5:
-                if st.button("Remove", key=f"remove_{player['id']}"):
-                    st.session_state.watchlist.remove(player['id'])
-                    st.rerun()
+                st.metric("Total Assists", int(known['assists'].sum()))
+        
             st.divider()
         
-        # Export watchlist
-        if st.button("Export Watchlist to CSV"):
-            csv = watchlist_players.to_csv(index=False)
-            st.download_button(
-                label="Download CSV",
-                data=csv,
-                file_name=f"soccer_scout_watchlist_{datetime.now().strftime('%Y%m%d')}.csv",
-                mime="text/csv"
-            )
+            # Search within the watchlist using the shared player search index
+            watchlist_search = st.text_input("Search watchlist...", placeholder="Enter player, club or nationality", key="watchlist_search")
+            shown_players = watchlist_players
+            if watchlist_search:
+                matches = player_index.search_index.search(watchlist_search, fuzzy=True)
+                shown_players = watchlist_players[watchlist_players.index.isin(players_df.index[matches])]
+        
+            # Display watchlist players
+            for idx, player in shown_players.iterrows():
+                col1, col2, col3, col4, col5 = st.columns([3, 2, 2, 2, 1])
+                with col1:
+                    st.write(f"**{player['name']}**")
+                    st.write(f"{player['position']} | {player['club']}")
+                with col2:
+                    st.write(f"Rating: **{format_stat(player['rating'], 'g')}**")
+                with col3:
+                    st.write(f"Value: {format_value(player['market_value'])}")
+                with col4:
+                    st.write(f"G: {format_stat(player['goals'])} | A: {format_stat(player['assists'])}")
+                with col5:
+                    st.button("Remove", key=f"remove_{player['id']}",
+                              on_click=watchlist.remove, args=(player['id'],))
+                st.divider()
+        
+            # Export watchlist (cached on disk per data version and watchlist
+            # contents); only built while the toggle is on, not on every refresh
+            if st.toggle("Export watchlist", key="watchlist_export"):
+                format_col, download_col = st.columns([1, 3])
+                with format_col:
+                    export_format = st.selectbox("Export format", list(EXPORT_FORMATS), key="watchlist_export_format",
+                                                 label_visibility="collapsed")
+                with download_col, profile.stage("watchlist.export"):
+                    export_path = get_export_cache().get(
+                        ('watchlist', players_version, tuple(watchlist)), export_format,
+                        lambda: export_chunks(players_df, watchlist_rows)
+                    )
+                    download_export(export_path, export_format, f"Download {len(watchlist_rows)} players",
+                                    "soccer_scout_watchlist", key="watchlist_export_download")
+
+    # Persist this run's watchlist edits in one write
+    watchlist.flush()
+
+# Main content
+tab1, tab2, tab3 = st.tabs(["Players", "Teams", "Watchlist"])
+with tab1:
+    players_tab(player_index, store.version('players'), sidebar_query, watchlist)
+with tab2:
+    teams_tab(store.version('teams'))
+with tab3:
+    watchlist_tab(player_index, store.version('players'), watchlist)
+
+finish_profile(app_profile)
+if show_debug:
+    with debug_panel:
+        render_debug_panel(app_profile)
 
 # Footer
 st.divider()
@@ -0,0 +1 @@
+"""Data layer for Swarm Scout Pro, importable without Streamlit."""
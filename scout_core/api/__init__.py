@@ -0,0 +1,4 @@
+"""HTTP/JSON API serving the dashboard's players, teams and watchlists."""
+from scout_core.api.app import ApiError, create_app
+
+__all__ = ['ApiError', 'create_app']
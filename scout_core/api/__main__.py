@@ -0,0 +1,29 @@
+"""Serve the HTTP API.
+
+    python -m scout_core.api --port 8080
+    python -m scout_core.api --store /srv/scout/store
+
+Reads the same data directory as the dashboard (``SCOUT_DATA_DIR``), so a
+sync written by either is picked up by the other on the next request.
+"""
+import argparse
+
+from aiohttp import web
+
+from scout_core.api import create_app
+from scout_core.dataset import open_store
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the scouting data over HTTP")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--store', metavar='DIR', help="serve this store instead of the default data directory")
+    args = parser.parse_args(argv)
+
+    web.run_app(create_app(open_store(args.store)), host=args.host, port=args.port)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
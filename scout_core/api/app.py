@@ -0,0 +1,309 @@
+"""Async HTTP/JSON API over the dashboard's data and query engine.
+
+Endpoints:
+
+    GET    /players                      filtered, sorted pages of players
+    GET    /players/{id}
+    GET    /players/{id}/similar         nearest players by playing style
+    GET    /teams                        team aggregates (?league=)
+    GET    /watchlists/{user}
+    PUT    /watchlists/{user}/{player_id}
+    DELETE /watchlists/{user}/{player_id}
+
+``/players`` takes the sidebar filters as query parameters (``league``,
+``position``, ``age_min``/``age_max``, ``value_min``/``value_max``,
+``rating_min``/``rating_max``, ``search``, ``fuzzy``, ``sort``, ``order``)
+plus ``limit`` and ``cursor``.
+A page carries ``next_cursor`` while rows remain; cursors are tied to the
+data version, so paging across a sync fails with 409 instead of skipping
+or repeating rows.
+
+Index rebuilds and queries run on worker threads, keeping the event loop
+free for concurrent requests. Selections are cached by (data version,
+query) and rendered pages by (data version, query, page); responses carry
+an ETag and honour ``If-None-Match``.
+"""
+import asyncio
+import base64
+import binascii
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from functools import partial
+
+import numpy as np
+from aiohttp import web
+
+from scout_core.dataset import Dataset, open_store
+from scout_core.query import SORT_COLUMNS, PlayerQuery
+from scout_core.schema import PLAYER_DTYPES, expand_players, missing_as_null
+from scout_core.watchlist import WatchlistStore
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+DEFAULT_SIMILAR = 10
+SELECTION_CACHE_SIZE = 64
+RESPONSE_CACHE_SIZE = 512
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class LRUCache:
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+def _flag(params, name):
+    return params.get(name, '').lower() in ('1', 'true', 'yes')
+
+
+def _number(params, name, kind=float):
+    value = params.get(name)
+    if value is None or value == '':
+        return None
+    try:
+        return kind(value)
+    except ValueError:
+        raise ApiError(400, f"{name} must be a number")
+
+
+def _range(params, low, high):
+    bounds = _number(params, low), _number(params, high)
+    if bounds == (None, None):
+        return None
+    return (
+        bounds[0] if bounds[0] is not None else float('-inf'),
+        bounds[1] if bounds[1] is not None else float('inf'),
+    )
+
+
+def parse_query(params):
+    """``PlayerQuery`` from request parameters (the sidebar filters plus search)."""
+    sort_by = params.get('sort', 'rating')
+    if sort_by not in SORT_COLUMNS:
+        raise ApiError(400, f"sort must be one of {', '.join(SORT_COLUMNS)}")
+    order = params.get('order', 'desc')
+    if order not in ('asc', 'desc'):
+        raise ApiError(400, "order must be asc or desc")
+    return PlayerQuery(
+        league=params.get('league') or None,
+        position=params.get('position') or None,
+        age_range=_range(params, 'age_min', 'age_max'),
+        value_range=_range(params, 'value_min', 'value_max'),
+        rating_range=_range(params, 'rating_min', 'rating_max'),
+        search=params.get('search', ''),
+        fuzzy=_flag(params, 'fuzzy'),
+        sort_by=sort_by,
+        ascending=order == 'asc',
+    )
+
+
+def parse_limit(params, default=DEFAULT_LIMIT):
+    limit = _number(params, 'limit', int)
+    if limit is None:
+        return default
+    if not 1 <= limit <= MAX_LIMIT:
+        raise ApiError(400, f"limit must be between 1 and {MAX_LIMIT}")
+    return limit
+
+
+def parse_player_id(request):
+    """The ``player_id`` path segment; ids the player table can't hold don't exist."""
+    player_id = int(request.match_info['player_id'])
+    if player_id > np.iinfo(PLAYER_DTYPES['id']).max:
+        raise ApiError(404, f"no player with id {player_id}")
+    return player_id
+
+
+def encode_cursor(version, offset):
+    payload = json.dumps({'v': version, 'o': offset}, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """``(data version, offset)`` of a cursor from ``encode_cursor``."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        version, offset = int(payload['v']), int(payload['o'])
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ApiError(400, "invalid cursor")
+    if offset < 0:
+        raise ApiError(400, "invalid cursor")
+    return version, offset
+
+
+def player_records(df):
+    """Plain JSON records (the export layout) for the rows of ``df``."""
+    return json.loads(expand_players(missing_as_null(df)).to_json(orient='records', double_precision=6))
+
+
+class ScoutApi:
+    def __init__(self, dataset, watchlists):
+        self.dataset = dataset
+        self.watchlists = watchlists
+        self._selections = LRUCache(SELECTION_CACHE_SIZE)
+        self._responses = LRUCache(RESPONSE_CACHE_SIZE)
+
+    async def run(self, fn, *args):
+        """Run blocking work (index builds, queries, SQLite) on a worker thread."""
+        return await asyncio.get_running_loop().run_in_executor(None, partial(fn, *args))
+
+    async def respond(self, request, key, build):
+        """JSON response for ``key``, built by ``build()`` on a cache miss."""
+        cached = self._responses.get(key)
+        if cached is None:
+            body = await self.run(lambda: json.dumps(build(), separators=(',', ':')).encode())
+            cached = (f'"{hashlib.sha1(body).hexdigest()[:20]}"', body)
+            self._responses.put(key, cached)
+        etag, body = cached
+        if request.headers.get('If-None-Match') == etag:
+            return web.Response(status=304, headers={'ETag': etag})
+        return web.Response(body=body, content_type='application/json', headers={'ETag': etag})
+
+    def select(self, version, index, query):
+        key = (version, query)
+        rows = self._selections.get(key)
+        if rows is None:
+            rows = index.select(query)
+            self._selections.put(key, rows)
+        return rows
+
+    def row_of(self, index, player_id):
+        rows = index.rows_for_ids([player_id])
+        if len(rows) == 0:
+            raise ApiError(404, f"no player with id {player_id}")
+        return rows[0]
+
+    # Handlers
+
+    async def list_players(self, request):
+        query = parse_query(request.query)
+        limit = parse_limit(request.query)
+        version, index = await self.run(self.dataset.player_index)
+        offset = 0
+        if request.query.get('cursor'):
+            cursor_version, offset = decode_cursor(request.query['cursor'])
+            if cursor_version != version:
+                raise ApiError(409, "the data changed since this cursor was issued; start from the first page")
+
+        def build():
+            rows = self.select(version, index, query)
+            page = rows[offset:offset + limit]
+            end = offset + len(page)
+            return {
+                'version': version,
+                'total': len(rows),
+                'offset': offset,
+                'players': player_records(index.df.iloc[page]),
+                'next_cursor': encode_cursor(version, end) if end < len(rows) else None,
+            }
+        return await self.respond(request, ('players', version, query, offset, limit), build)
+
+    async def get_player(self, request):
+        player_id = parse_player_id(request)
+        version, index = await self.run(self.dataset.player_index)
+        row = self.row_of(index, player_id)
+        return await self.respond(
+            request, ('player', version, player_id),
+            lambda: {'version': version, 'player': player_records(index.df.iloc[[row]])[0]},
+        )
+
+    async def similar_players(self, request):
+        player_id = parse_player_id(request)
+        query = parse_query(request.query)
+        limit = parse_limit(request.query, DEFAULT_SIMILAR)
+        same_position = _flag(request.query, 'same_position')
+        version, index = await self.run(self.dataset.player_index)
+        row = self.row_of(index, player_id)
+
+        def build():
+            positions, distances = index.similarity_index.similar(
+                row, k=limit, candidates=self.select(version, index, query), same_position=same_position
+            )
+            players = player_records(index.df.iloc[positions])
+            for player, distance in zip(players, distances):
+                player['distance'] = round(float(distance), 4)
+            return {'version': version, 'player_id': player_id, 'players': players}
+        return await self.respond(
+            request, ('similar', version, player_id, query, limit, same_position), build
+        )
+
+    async def list_teams(self, request):
+        league = request.query.get('league') or None
+        version, teams = await self.run(self.dataset.teams, league)
+        return await self.respond(
+            request, ('teams', version, league),
+            lambda: {'version': version, 'teams': json.loads(teams.to_json(orient='records', double_precision=6))},
+        )
+
+    async def get_watchlist(self, request):
+        user = request.match_info['user']
+        ids, revision = await self.run(self.watchlists.load, user)
+        version, index = await self.run(self.dataset.player_index)
+
+        def build():
+            return {
+                'user': user,
+                'revision': revision,
+                'players': player_records(index.df.iloc[index.rows_for_ids(ids)]),
+            }
+        return await self.respond(request, ('watchlist', version, user, revision), build)
+
+    async def edit_watchlist(self, request):
+        user = request.match_info['user']
+        player_id = parse_player_id(request)
+        if request.method == 'PUT':
+            _, index = await self.run(self.dataset.player_index)
+            self.row_of(index, player_id)
+            revision = await self.run(partial(self.watchlists.apply, user, added=[player_id]))
+        else:
+            revision = await self.run(partial(self.watchlists.apply, user, removed=[player_id]))
+        return web.json_response({'user': user, 'revision': revision})
+
+
+@web.middleware
+async def json_errors(request, handler):
+    try:
+        return await handler(request)
+    except ApiError as error:
+        return web.json_response({'error': error.message}, status=error.status)
+
+
+API = web.AppKey('api', ScoutApi)
+
+
+def create_app(store=None, watchlists=None):
+    """The API application; defaults to the same data directory as the dashboard."""
+    api = ScoutApi(Dataset(store or open_store()), watchlists or WatchlistStore())
+    app = web.Application(middlewares=[json_errors])
+    app[API] = api
+    app.router.add_get('/players', api.list_players)
+    app.router.add_get(r'/players/{player_id:\d+}', api.get_player)
+    app.router.add_get(r'/players/{player_id:\d+}/similar', api.similar_players)
+    app.router.add_get('/teams', api.list_teams)
+    app.router.add_get('/watchlists/{user}', api.get_watchlist)
+    app.router.add_put(r'/watchlists/{user}/{player_id:\d+}', api.edit_watchlist)
+    app.router.add_delete(r'/watchlists/{user}/{player_id:\d+}', api.edit_watchlist)
+    return app
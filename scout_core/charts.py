@@ -0,0 +1,74 @@
+"""Plotly figures for the dashboard, built on one shared layout template.
+
+Figures are built with ``graph_objects`` only (``plotly.express`` costs tens
+of milliseconds per call in argument processing) and reference
+``SCOUT_TEMPLATE`` instead of the process-wide default template, so the
+serialized chart spec carries a few hundred bytes of layout rather than a
+full template copy. Callers cache the figures; nothing here mutates a
+figure after it is returned.
+"""
+import plotly.graph_objects as go
+
+from scout_core.stats import RADAR_CATEGORIES, RADAR_COLUMNS
+
+SCOUT_TEMPLATE = go.layout.Template(
+    layout=dict(
+        margin=dict(l=40, r=40, t=40, b=40),
+        polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
+        legend=dict(orientation='h', yanchor='bottom', y=-0.2),
+    )
+)
+RADAR_HEIGHT = 300
+COMPARISON_HEIGHT = 420
+TREND_HEIGHT = 300
+
+
+def radar_figure(players_df):
+    """Percentile radar of the ``RADAR_STATS`` with one trace per row of ``players_df``.
+
+    A single player is drawn without a legend, like the per-player
+    breakdown; several players are overlaid in one comparison figure.
+    """
+    theta = RADAR_CATEGORIES + RADAR_CATEGORIES[:1]  # close the outline
+    traces = []
+    for values, name in zip(players_df[RADAR_COLUMNS].to_numpy().tolist(), players_df['name']):
+        traces.append(go.Scatterpolar(r=values + values[:1], theta=theta, name=name, fill='toself'))
+    comparison = len(traces) > 1
+    return go.Figure(data=traces, layout=dict(
+        template=SCOUT_TEMPLATE,
+        showlegend=comparison,
+        height=COMPARISON_HEIGHT if comparison else RADAR_HEIGHT,
+    ))
+
+
+def trend_figure(history_df):
+    """Rating (left axis) and market value (right axis) over time, from ``SnapshotStore.player_history``."""
+    return go.Figure(
+        data=[
+            go.Scatter(x=history_df.index, y=history_df['rating'], name="Rating",
+                       mode='lines+markers', line_shape='hv'),
+            go.Scatter(x=history_df.index, y=history_df['market_value'], name="Market Value",
+                       mode='lines+markers', line_shape='hv', yaxis='y2'),
+        ],
+        layout=dict(
+            template=SCOUT_TEMPLATE,
+            height=TREND_HEIGHT,
+            yaxis=dict(title="Rating"),
+            yaxis2=dict(title="Market Value ($)", overlaying='y', side='right', showgrid=False),
+        ),
+    )
+
+
+def team_value_figure(teams_df):
+    """Market value per team, one bar trace per league."""
+    traces = [
+        go.Bar(x=league_teams['name'], y=league_teams['market_value'], name=str(league))
+        for league, league_teams in teams_df.groupby('league', observed=True, sort=False)
+    ]
+    return go.Figure(data=traces, layout=dict(
+        template=SCOUT_TEMPLATE,
+        title="Market Value by Team",
+        xaxis_title="Team",
+        yaxis_title="Market Value ($)",
+        legend_title="League",
+    ))
@@ -0,0 +1,14 @@
+"""Filesystem locations for local data (override with SCOUT_DATA_DIR) and logs."""
+import os
+from pathlib import Path
+
+DATA_DIR = Path(os.environ.get('SCOUT_DATA_DIR', Path(__file__).resolve().parent.parent / 'data'))
+
+# JSON lines log of run profiles (see scout_core.instrumentation); off when unset
+PROFILE_LOG = os.environ.get('SCOUT_PROFILE_LOG')
+
+
+def data_path(name):
+    """Path of ``name`` inside the data directory, creating the directory."""
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    return DATA_DIR / name
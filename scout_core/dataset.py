@@ -0,0 +1,56 @@
+"""Loading the player and team tables the way the dashboard sees them.
+
+``open_store`` and ``build_player_index`` are the load path shared by
+``scout.py`` and the HTTP API. ``Dataset`` is the Streamlit-free cache on
+top: it holds one ``PlayerIndex`` and rebuilds it when another process
+rewrites the store (e.g. after a sync), like ``load_player_index`` does
+with the store version as its cache key.
+"""
+import threading
+
+import pandas as pd
+
+from scout_core.query import PlayerIndex
+from scout_core.sample_data import SAMPLE_PLAYERS
+from scout_core.stats import attach_player_stats
+from scout_core.store import Store, player_filter
+
+
+def open_store(directory=None):
+    """The data store, seeded with the sample data until the first sync."""
+    store = Store(directory)
+    store.seed(pd.DataFrame(SAMPLE_PLAYERS))
+    return store
+
+
+def build_player_index(players_df):
+    """Index ``players_df`` with its per-90 and percentile stats attached."""
+    return PlayerIndex(attach_player_stats(players_df))
+
+
+class Dataset:
+    def __init__(self, store):
+        self.store = store
+        self._lock = threading.Lock()
+        self._version = None
+        self._index = None
+        self._teams = {}
+
+    def player_index(self):
+        """``(version, PlayerIndex)`` for the current store contents."""
+        version = self.store.version('players')
+        with self._lock:
+            if version != self._version:
+                self._index = build_player_index(self.store.load_players())
+                self._version = version
+            return self._version, self._index
+
+    def teams(self, league=None):
+        """``(version, team aggregates)``, optionally for one league."""
+        version = self.store.version('teams')
+        with self._lock:
+            key = (version, league)
+            if key not in self._teams:
+                self._teams = {k: v for k, v in self._teams.items() if k[0] == version}
+                self._teams[key] = self.store.load_teams(player_filter(league=league))
+            return version, self._teams[key]
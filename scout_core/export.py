@@ -0,0 +1,102 @@
+"""Chunked export of player tables to CSV, Parquet and JSON Lines.
+
+Rows are converted to the wide export layout (plain strings, one flag per
+source, derived stats included, missing stats empty) a chunk at a time and appended to the
+output file, so peak memory is one chunk rather than the whole payload.
+``ExportCache`` keeps the generated files on disk keyed by what was
+exported (data version, filter state, format): downloading the same
+selection again, from any session, reuses the file.
+"""
+import hashlib
+import os
+import uuid
+
+import numpy as np
+import pyarrow as pa
+
+from scout_core.config import data_path
+from scout_core.schema import expand_players, missing_as_null
+
+# label -> (file extension, MIME type)
+EXPORT_FORMATS = {
+    'CSV': ('csv', 'text/csv'),
+    'Parquet': ('parquet', 'application/vnd.apache.parquet'),
+    'JSON Lines': ('jsonl', 'application/jsonl'),
+}
+CHUNK_ROWS = 10_000
+MAX_CACHED_EXPORTS = 32
+
+
+def export_chunks(df, rows=None, chunk_rows=CHUNK_ROWS):
+    """Yield ``df`` (or its row positions ``rows``) in the export layout, chunk by chunk."""
+    rows = np.arange(len(df)) if rows is None else np.asarray(rows)
+    yield expand_players(missing_as_null(df.iloc[rows[:chunk_rows]]))
+    for start in range(chunk_rows, len(rows), chunk_rows):
+        yield expand_players(missing_as_null(df.iloc[rows[start:start + chunk_rows]]))
+
+
+def write_export(chunks, fmt, path):
+    """Write ``chunks`` (from ``export_chunks``) to ``path`` as ``fmt`` (a key of ``EXPORT_FORMATS``)."""
+    extension, _ = EXPORT_FORMATS[fmt]
+    if extension == 'csv':
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            for i, chunk in enumerate(chunks):
+                chunk.to_csv(f, header=i == 0, index=False)
+    elif extension == 'jsonl':
+        with open(path, 'w', encoding='utf-8') as f:
+            for chunk in chunks:
+                if len(chunk):
+                    # 6 decimals: float32 stats print as stored (7.8, not 7.8000001907)
+                    chunk.to_json(f, orient='records', lines=True, force_ascii=False, double_precision=6)
+    else:
+        import pyarrow.parquet as pq  # only Parquet exports need it; keeps it off app startup
+
+        writer = None
+        try:
+            for chunk in chunks:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table.cast(writer.schema))
+        finally:
+            if writer is not None:
+                writer.close()
+
+
+class ExportCache:
+    def __init__(self, directory=None, max_files=MAX_CACHED_EXPORTS):
+        self.directory = directory or data_path('exports')
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_files = max_files
+
+    def path(self, key, fmt):
+        extension, _ = EXPORT_FORMATS[fmt]
+        digest = hashlib.sha1(repr((key, fmt)).encode()).hexdigest()[:20]
+        return self.directory / f"{digest}.{extension}"
+
+    def get(self, key, fmt, chunks):
+        """Path of the export for ``key``, writing it from ``chunks()`` on a miss.
+
+        ``key`` must identify the exported rows (e.g. store version and
+        query); ``chunks`` is only called when the file isn't cached yet.
+        """
+        path = self.path(key, fmt)
+        if path.exists():
+            os.utime(path)  # most recently used survives pruning
+            return path
+        staging = path.with_name(f".{path.name}.{uuid.uuid4().hex}")
+        try:
+            write_export(chunks(), fmt, staging)
+            os.replace(staging, path)
+        finally:
+            staging.unlink(missing_ok=True)
+        self._prune()
+        return path
+
+    def _prune(self):
+        files = sorted(
+            (p for p in self.directory.iterdir() if not p.name.startswith('.')),
+            key=lambda p: p.stat().st_mtime,
+        )
+        for stale in files[:-self.max_files]:
+            stale.unlink(missing_ok=True)
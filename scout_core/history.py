@@ -0,0 +1,170 @@
+"""Historical snapshots of the player stats, stored as deltas.
+
+Each sync that changes the player table is recorded as one Arrow IPC file
+in the store's ``history`` directory. A delta file holds only what changed
+since the previous table, in long form: one ``(id, column, value)`` row per
+changed stat, plus every stat of players that are new. Every
+``KEYFRAME_INTERVAL`` records (and for the very first one) a keyframe with
+the full stat columns is written instead, so rebuilding any date reads one
+keyframe and at most that many small deltas.
+
+Files are read through memory maps and filtered by player id before
+anything is converted to pandas, so a single player's trend never loads a
+whole table.
+"""
+import os
+import time
+import uuid
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from scout_core.schema import missing_as_nan
+
+# Stats tracked over time (all numeric columns of the player table)
+HISTORY_COLUMNS = (
+    'age', 'market_value', 'rating', 'goals', 'assists', 'matches', 'minutes_played',
+    'pass_accuracy', 'shots_per_game', 'key_passes', 'dribbles', 'aerial_duels',
+    'tackles', 'interceptions', 'clearances',
+)
+KEYFRAME_INTERVAL = 20
+
+DELTA_SCHEMA = pa.schema([
+    ('id', pa.int32()),
+    ('column', pa.dictionary(pa.int8(), pa.string())),
+    ('value', pa.float64()),
+])
+
+
+def _to_ns(when):
+    return pd.Timestamp(when).value if not isinstance(when, int) else when
+
+
+def stat_changes(previous, current):
+    """Delta table of the stats of ``current`` that differ from ``previous`` (by id)."""
+    columns = list(HISTORY_COLUMNS)
+    before = previous.set_index('id')[columns]
+    after = current.set_index('id')[columns]
+    common = after.index.intersection(before.index)
+    old = before.loc[common].to_numpy(dtype=np.float64)
+    new = after.loc[common].to_numpy(dtype=np.float64)
+    rows, cols = np.nonzero((old != new) & ~(np.isnan(old) & np.isnan(new)))
+    ids = [common.to_numpy()[rows]]
+    col_codes = [cols]
+    values = [new[rows, cols]]
+
+    added = after.index.difference(before.index)
+    if len(added):
+        added_values = after.loc[added].to_numpy(dtype=np.float64)
+        ids.append(np.repeat(added.to_numpy(), len(columns)))
+        col_codes.append(np.tile(np.arange(len(columns)), len(added)))
+        values.append(added_values.ravel())
+
+    return pa.table({
+        'id': pa.array(np.concatenate(ids), pa.int32()),
+        'column': pa.DictionaryArray.from_arrays(
+            pa.array(np.concatenate(col_codes), pa.int8()), pa.array(columns)
+        ),
+        'value': pa.array(np.concatenate(values), pa.float64()),
+    }, schema=DELTA_SCHEMA)
+
+
+def _delta_frame(table):
+    """Wide frame (index id, stat columns) of a delta table; NaN where unchanged."""
+    if table.num_rows == 0:
+        return pd.DataFrame(columns=list(HISTORY_COLUMNS), dtype=np.float64)
+    long = table.to_pandas()
+    long['column'] = long['column'].astype(str)
+    return long.pivot(index='id', columns='column', values='value')
+
+
+class SnapshotStore:
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def version(self):
+        """Changes whenever a snapshot is recorded."""
+        return self.directory.stat().st_mtime_ns
+
+    def snapshots(self):
+        """``(timestamp ns, kind, path)`` of every snapshot, oldest first."""
+        found = []
+        for path in self.directory.glob('*.arrow'):
+            timestamp, kind, _ = path.stem.split('-', 2)
+            found.append((int(timestamp), kind, path))
+        return sorted(found)
+
+    def record(self, current, previous=None, timestamp=None):
+        """Record the player table ``current``; returns the snapshot path (``None`` if unchanged).
+
+        ``previous`` is the table ``current`` replaces; without it (or when a
+        keyframe is due) the full stats are written. Missing stats are
+        recorded as NaN.
+        """
+        current = missing_as_nan(current)
+        previous = missing_as_nan(previous) if previous is not None else None
+        snapshots = self.snapshots()
+        since_keyframe = 0
+        for _, kind, _ in reversed(snapshots):
+            if kind == 'key':
+                break
+            since_keyframe += 1
+        if previous is None or not snapshots or since_keyframe + 1 >= KEYFRAME_INTERVAL:
+            kind = 'key'
+            table = pa.Table.from_pandas(
+                current[['id', *HISTORY_COLUMNS]].reset_index(drop=True), preserve_index=False
+            )
+        else:
+            kind = 'delta'
+            table = stat_changes(previous, current)
+            if table.num_rows == 0:
+                return None
+        timestamp = _to_ns(timestamp) if timestamp is not None else time.time_ns()
+        path = self.directory / f"{timestamp:020d}-{kind}-{uuid.uuid4().hex[:8]}.arrow"
+        staging = self.directory / f".{path.name}"
+        with pa.OSFile(str(staging), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(staging, path)
+        return path
+
+    def _read(self, path, player_id=None):
+        table = pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+        if player_id is not None:
+            table = table.filter(pc.equal(table['id'], player_id))
+        return table
+
+    def as_of(self, when):
+        """Stats of every player as recorded at ``when`` (index id; empty before the first snapshot)."""
+        until = _to_ns(when)
+        snapshots = [snapshot for snapshot in self.snapshots() if snapshot[0] <= until]
+        keyframes = [i for i, (_, kind, _) in enumerate(snapshots) if kind == 'key']
+        if not keyframes:
+            return pd.DataFrame(columns=list(HISTORY_COLUMNS), dtype=np.float64).rename_axis('id')
+        state = self._read(snapshots[keyframes[-1]][2]).to_pandas().set_index('id').astype(np.float64)
+        for _, _, path in snapshots[keyframes[-1] + 1:]:
+            state = _delta_frame(self._read(path)).combine_first(state)
+        return state[list(HISTORY_COLUMNS)]
+
+    def player_history(self, player_id, columns=('rating', 'market_value')):
+        """``columns`` of one player after each snapshot that includes them (index: time)."""
+        columns = list(columns)
+        state = None
+        times, rows = [], []
+        for timestamp, kind, path in self.snapshots():
+            table = self._read(path, player_id)
+            if kind == 'key':
+                frame = table.to_pandas()
+                state = frame[columns].iloc[0].astype(np.float64) if len(frame) else None
+            elif table.num_rows:
+                changes = _delta_frame(table).iloc[0]
+                base = state if state is not None else pd.Series(np.nan, index=columns)
+                state = changes.reindex(columns).combine_first(base)
+            if state is not None:
+                times.append(timestamp)
+                rows.append(state.to_numpy())
+        return pd.DataFrame(rows, columns=columns, index=pd.to_datetime(times).rename('time'))
@@ -0,0 +1,93 @@
+"""Stage timings and loader cache counters for the dashboard.
+
+A ``RunProfile`` times the stages of one script run (or one fragment
+rerun); ``CACHE_STATS`` counts calls and misses of the cached data loaders
+across every session of the process. Finished profiles are logged as one
+JSON object per line on the ``scout_core.instrumentation`` logger, which
+writes to ``SCOUT_PROFILE_LOG`` when that is set.
+"""
+import json
+import logging
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from functools import wraps
+
+from scout_core.config import PROFILE_LOG
+
+logger = logging.getLogger(__name__)
+if PROFILE_LOG and not logger.handlers:
+    _handler = logging.FileHandler(PROFILE_LOG)
+    _handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+class RunProfile:
+    def __init__(self, scope):
+        self.scope = scope
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        self.stages = {}
+        self.total = None
+
+    @contextmanager
+    def stage(self, name):
+        """Time the enclosed block; repeated stages (e.g. one per chart) add up."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - start
+
+    @property
+    def finished(self):
+        return self.total is not None
+
+    def finish(self):
+        """Stop the clock and log the profile."""
+        self.total = time.perf_counter() - self._start
+        logger.info(json.dumps(self.as_dict()))
+
+    def as_dict(self):
+        return {
+            'scope': self.scope,
+            'started_at': self.started_at,
+            'total_ms': None if self.total is None else round(self.total * 1000, 3),
+            'stages_ms': {name: round(seconds * 1000, 3) for name, seconds in self.stages.items()},
+        }
+
+
+class CacheStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = Counter()
+        self._misses = Counter()
+
+    def counted(self, name):
+        """Decorator counting calls of a cached loader (apply outside the cache)."""
+        def decorate(loader):
+            @wraps(loader)
+            def call(*args, **kwargs):
+                with self._lock:
+                    self._calls[name] += 1
+                return loader(*args, **kwargs)
+            return call
+        return decorate
+
+    def miss(self, name):
+        """Record a miss; call from inside the cached function body."""
+        with self._lock:
+            self._misses[name] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                name: {'hits': max(calls - self._misses[name], 0), 'misses': self._misses[name]}
+                for name, calls in self._calls.items()
+            }
+
+
+CACHE_STATS = CacheStats()
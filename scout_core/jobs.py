@@ -0,0 +1,278 @@
+"""Persistent queue of sync jobs, shared by the dashboard and the background worker (SQLite).
+
+The dashboard never syncs in its own process: "Sync Data" submits a job
+and the worker (``scout_core.sync.worker``) runs it. Jobs, per-source page
+progress and worker heartbeats all live in one SQLite file, so any session
+can show what is in flight with a couple of indexed reads.
+
+Concurrent requests are deduplicated: submitting while a job for the same
+leagues (or for all leagues) is queued or running returns that job. Only
+one job runs at a time; a running job whose heartbeat stops (its worker
+died) is queued again on the next claim.
+
+This module only needs the standard library (it lives outside
+``scout_core.sync`` for that reason), so the dashboard can import it at
+startup.
+"""
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from scout_core.config import data_path
+
+# A worker or running job silent for longer than this is considered dead
+STALE_SECONDS = 60
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sync_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    leagues TEXT NOT NULL,
+    status TEXT NOT NULL,
+    requested_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    heartbeat_at REAL,
+    pages INTEGER,
+    unchanged INTEGER,
+    changed INTEGER,
+    coverage TEXT,
+    errors TEXT,
+    message TEXT
+);
+CREATE INDEX IF NOT EXISTS sync_jobs_status ON sync_jobs (status, id);
+CREATE TABLE IF NOT EXISTS sync_job_sources (
+    job_id INTEGER NOT NULL,
+    source TEXT NOT NULL,
+    done INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    PRIMARY KEY (job_id, source)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS sync_workers (
+    pid INTEGER PRIMARY KEY,
+    heartbeat_at REAL NOT NULL
+);
+"""
+
+JOB_COLUMNS = (
+    "id, leagues, status, requested_at, started_at, finished_at,"
+    " pages, unchanged, changed, coverage, errors, message"
+)
+
+
+@dataclass
+class SyncJob:
+    id: int
+    # Empty for all leagues
+    leagues: list
+    status: str  # queued | running | done | failed
+    requested_at: float
+    started_at: float = None
+    finished_at: float = None
+    pages: int = None
+    unchanged: int = None
+    changed: int = None
+    coverage: dict = field(default_factory=dict)
+    errors: list = field(default_factory=list)
+    message: str = None
+    # source -> (pages done, pages total), while the job runs
+    sources: dict = field(default_factory=dict)
+
+    @property
+    def finished(self):
+        return self.status in ('done', 'failed')
+
+    @property
+    def progress(self):
+        """``(pages done, pages total)`` over all sources."""
+        return (sum(done for done, _ in self.sources.values()),
+                sum(total for _, total in self.sources.values()))
+
+
+def _leagues_key(leagues):
+    return json.dumps(sorted(leagues or []))
+
+
+class JobQueue:
+    def __init__(self, path=None):
+        self.path = path or data_path('sync_jobs.sqlite')
+        # Autocommit mode, with explicit BEGIN IMMEDIATE where reads and writes must be atomic
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _job(self, row, with_sources=False):
+        if row is None:
+            return None
+        job = SyncJob(
+            *row[:9],
+            coverage=json.loads(row[9]) if row[9] else {},
+            errors=json.loads(row[10]) if row[10] else [],
+            message=row[11],
+        )
+        job.leagues = json.loads(job.leagues)
+        if with_sources:
+            job.sources = {
+                source: (done, total) for source, done, total in self._conn.execute(
+                    "SELECT source, done, total FROM sync_job_sources WHERE job_id = ? ORDER BY source",
+                    (job.id,),
+                )
+            }
+        return job
+
+    def submit(self, leagues=None):
+        """Queue a sync of ``leagues`` (all when empty), or return the queued/running job that covers it."""
+        key = _leagues_key(leagues)
+        with self._transaction() as conn:
+            row = conn.execute(
+                f"SELECT {JOB_COLUMNS} FROM sync_jobs WHERE status IN ('queued', 'running')"
+                " AND leagues IN (?, '[]') ORDER BY id LIMIT 1",
+                (key,),
+            ).fetchone()
+            if row is None:
+                job_id = conn.execute(
+                    "INSERT INTO sync_jobs (leagues, status, requested_at) VALUES (?, 'queued', ?)",
+                    (key, time.time()),
+                ).lastrowid
+                row = conn.execute(f"SELECT {JOB_COLUMNS} FROM sync_jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._job(row)
+
+    def claim(self):
+        """Start the oldest queued job; ``None`` if there is none or another job is running.
+
+        Running jobs whose heartbeat is older than ``STALE_SECONDS`` are
+        queued again first.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE sync_jobs SET status = 'queued', started_at = NULL"
+                " WHERE status = 'running' AND heartbeat_at < ?",
+                (now - STALE_SECONDS,),
+            )
+            if conn.execute("SELECT 1 FROM sync_jobs WHERE status = 'running'").fetchone():
+                return None
+            row = conn.execute(
+                f"SELECT {JOB_COLUMNS} FROM sync_jobs WHERE status = 'queued' ORDER BY id LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute("DELETE FROM sync_job_sources WHERE job_id = ?", (row[0],))
+            conn.execute(
+                "UPDATE sync_jobs SET status = 'running', started_at = ?, heartbeat_at = ? WHERE id = ?",
+                (now, now, row[0]),
+            )
+        job = self._job(row)
+        job.status, job.started_at = 'running', now
+        return job
+
+    def report(self, job_id, source, done, total):
+        """Record page progress of one source of a running job (also a job heartbeat)."""
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute("INSERT OR REPLACE INTO sync_job_sources VALUES (?, ?, ?, ?)", (job_id, source, done, total))
+            conn.execute("UPDATE sync_jobs SET heartbeat_at = ? WHERE id = ?", (now, job_id))
+
+    def finish(self, job_id, result):
+        """Mark a job done with the counts of its ``SyncResult``."""
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE sync_jobs SET status = 'done', finished_at = ?, pages = ?, unchanged = ?,"
+                " changed = ?, coverage = ?, errors = ? WHERE id = ?",
+                (time.time(), result.pages, result.unchanged, len(result.changed_ids),
+                 json.dumps(result.coverage), json.dumps(result.errors), job_id),
+            )
+
+    def fail(self, job_id, message, errors=()):
+        """Mark a job failed with ``message``, keeping the page ``errors`` that led to it."""
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE sync_jobs SET status = 'failed', finished_at = ?, message = ?, errors = ? WHERE id = ?",
+                (time.time(), message, json.dumps(list(errors)), job_id),
+            )
+
+    def get(self, job_id):
+        with self._lock:
+            return self._job(self._conn.execute(
+                f"SELECT {JOB_COLUMNS} FROM sync_jobs WHERE id = ?", (job_id,)
+            ).fetchone(), with_sources=True)
+
+    def active(self):
+        """The running job, else the oldest queued one, else ``None`` (with per-source progress)."""
+        with self._lock:
+            return self._job(self._conn.execute(
+                f"SELECT {JOB_COLUMNS} FROM sync_jobs WHERE status IN ('queued', 'running')"
+                " ORDER BY status = 'running' DESC, id LIMIT 1"
+            ).fetchone(), with_sources=True)
+
+    def last_finished(self):
+        with self._lock:
+            return self._job(self._conn.execute(
+                f"SELECT {JOB_COLUMNS} FROM sync_jobs WHERE status IN ('done', 'failed')"
+                " ORDER BY finished_at DESC LIMIT 1"
+            ).fetchone())
+
+    def heartbeat(self, pid, job_id=None):
+        """Mark worker ``pid`` (and the job it runs) alive."""
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute("INSERT OR REPLACE INTO sync_workers VALUES (?, ?)", (pid, now))
+            if job_id is not None:
+                conn.execute("UPDATE sync_jobs SET heartbeat_at = ? WHERE id = ?", (now, job_id))
+
+    def retire(self, pid):
+        """Unregister idle worker ``pid`` unless a job is waiting; returns whether it may exit.
+
+        Done in one transaction with the queue check, so a job submitted
+        concurrently either sees the worker gone (and starts another) or is
+        picked up by it.
+        """
+        with self._transaction() as conn:
+            if conn.execute("SELECT 1 FROM sync_jobs WHERE status = 'queued'").fetchone():
+                return False
+            conn.execute("DELETE FROM sync_workers WHERE pid = ?", (pid,))
+        return True
+
+    def worker_alive(self):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM sync_workers WHERE heartbeat_at >= ?", (time.time() - STALE_SECONDS,)
+            ).fetchone() is not None
+
+
+def spawn_worker(idle_exit=60):
+    """Start a detached worker process that exits after ``idle_exit`` idle seconds.
+
+    It inherits the environment (so ``SCOUT_DATA_DIR``) and logs to
+    ``sync_worker.log`` in the data directory.
+    """
+    root = Path(__file__).resolve().parent.parent
+    with open(data_path('sync_worker.log'), 'ab') as log:
+        return subprocess.Popen(
+            [sys.executable, '-m', 'scout_core.sync.worker', '--idle-exit', str(idle_exit)],
+            cwd=root, env=os.environ.copy(), stdin=subprocess.DEVNULL, stdout=log,
+            stderr=subprocess.STDOUT, start_new_session=True,
+        )
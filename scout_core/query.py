@@ -0,0 +1,153 @@
+"""Indexed filter and sort engine for the player table.
+
+``PlayerIndex`` is built once per dataset load and answers the sidebar
+filters without copying or rescanning the full frame: categorical filters
+are lookups into per-value row sets, range filters are binary searches over
+pre-sorted columns and every sort option has a pre-computed ordering.
+"""
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from scout_core.schema import stat_values
+from scout_core.search import SearchIndex
+from scout_core.similar import SimilarityIndex
+
+CATEGORY_FILTERS = ('league', 'position')
+RANGE_FILTERS = ('age', 'market_value', 'rating')
+SORT_COLUMNS = ('rating', 'age', 'market_value', 'goals', 'assists', 'goals_per90', 'assists_per90')
+
+
+@dataclass(frozen=True)
+class PlayerQuery:
+    """Filter and sort state for the player table (hashable, usable as a cache key)."""
+    league: Optional[str] = None
+    position: Optional[str] = None
+    age_range: Optional[Tuple[float, float]] = None
+    value_range: Optional[Tuple[float, float]] = None
+    rating_range: Optional[Tuple[float, float]] = None
+    search: str = ''
+    fuzzy: bool = False
+    sort_by: str = 'rating'
+    ascending: bool = False
+
+
+class PlayerIndex:
+    def __init__(self, df):
+        self.df = df
+        self._size = len(df)
+
+        # Per-value row sets for categorical filters
+        self._categories = {}
+        for column in CATEGORY_FILTERS:
+            codes, uniques = pd.factorize(df[column])
+            order = np.argsort(codes, kind='stable')
+            bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+            self._categories[column] = {
+                value: order[bounds[i]:bounds[i + 1]] for i, value in enumerate(uniques)
+            }
+
+        # Sorted values + positions for range filters (missing stats sort
+        # last as NaN and fall outside every range)
+        self._ranges = {}
+        for column in RANGE_FILTERS:
+            values = stat_values(df, column)
+            order = np.argsort(values, kind='stable')
+            self._ranges[column] = (values[order], order)
+
+        # Pre-sorted orderings for each sort option (per-90 columns are
+        # present once scout_core.stats has been attached)
+        self._orderings = {}
+        for column in SORT_COLUMNS:
+            if column not in df:
+                continue
+            self._ordering(column, True)
+            self._ordering(column, False)
+
+        # id -> row position lookups (watchlist joins)
+        ids = df['id'].to_numpy()
+        self._id_order = np.argsort(ids, kind='stable')
+        self._sorted_ids = ids[self._id_order]
+
+        # Name/club/nationality search
+        self.search_index = SearchIndex(df)
+
+        # Nearest neighbours on playing-style stats
+        self.similarity_index = SimilarityIndex(df)
+
+    def __len__(self):
+        return self._size
+
+    def _ordering(self, column, ascending):
+        key = (column, ascending)
+        if key not in self._orderings:
+            values = stat_values(self.df, column)
+            self._orderings[key] = np.argsort(values if ascending else -values, kind='stable')
+        return self._orderings[key]
+
+    def rows_for_value(self, column, value):
+        """Row positions where ``column == value`` (empty if the value is unknown)."""
+        return self._categories[column].get(value, np.empty(0, dtype=np.intp))
+
+    def rows_for_ids(self, ids):
+        """Row positions of the players with ``ids``, in the given order (unknown ids skipped)."""
+        # Ids outside the id dtype's range can't match (and wouldn't cast)
+        bounds = np.iinfo(self._sorted_ids.dtype)
+        ids = np.asarray([i for i in ids if bounds.min <= i <= bounds.max], dtype=self._sorted_ids.dtype)
+        if len(ids) == 0 or self._size == 0:
+            return np.empty(0, dtype=np.intp)
+        found = np.searchsorted(self._sorted_ids, ids)
+        found = np.minimum(found, self._size - 1)
+        valid = self._sorted_ids[found] == ids
+        return self._id_order[found[valid]]
+
+    def rows_in_range(self, column, low, high):
+        """Row positions with ``low <= column <= high`` via binary search."""
+        values, order = self._ranges[column]
+        start = np.searchsorted(values, low, side='left')
+        stop = np.searchsorted(values, high, side='right')
+        return order[start:stop]
+
+    def _candidate_sets(self, query):
+        if query.league is not None:
+            yield self.rows_for_value('league', query.league)
+        if query.position is not None:
+            yield self.rows_for_value('position', query.position)
+        for column, bounds in (
+            ('age', query.age_range),
+            ('market_value', query.value_range),
+            ('rating', query.rating_range),
+        ):
+            if bounds is not None:
+                yield self.rows_in_range(column, *bounds)
+        if query.search:
+            yield self.search_index.search(query.search, fuzzy=query.fuzzy)
+
+    def mask(self, query):
+        """Boolean row mask of the filters in ``query`` (``None`` if nothing is filtered)."""
+        mask = None
+        for rows in self._candidate_sets(query):
+            hits = np.zeros(self._size, dtype=bool)
+            hits[rows] = True
+            if mask is None:
+                mask = hits
+            else:
+                mask &= hits
+        return mask
+
+    def order(self, mask, sort_by, ascending=False):
+        """Row positions selected by ``mask``, sorted by ``sort_by``."""
+        order = self._ordering(sort_by, ascending)
+        if mask is not None:
+            order = order[mask[order]]
+        return order
+
+    def select(self, query):
+        """Return the row positions matching ``query``, in sort order."""
+        return self.order(self.mask(query), query.sort_by, query.ascending)
+
+    def query(self, query):
+        """Return the filtered, sorted slice of the player frame."""
+        return self.df.iloc[self.select(query)]
@@ -0,0 +1,328 @@
+"""Sample players used until a real sync has populated the data."""
+
+SAMPLE_PLAYERS = [
+    {
+        'id': 1,
+        'name': 'Diego Rossi',
+        'age': 26,
+        'position': 'FW',
+        'club': 'Columbus Crew',
+        'league': 'MLS',
+        'nationality': 'Uruguay',
+        'market_value': 8500000,
+        'rating': 8.2,
+        'goals': 15,
+        'assists': 8,
+        'matches': 28,
+        'minutes_played': 2340,
+        'pass_accuracy': 82,
+        'shots_per_game': 3.2,
+        'key_passes': 2.1,
+        'dribbles': 2.8,
+        'aerial_duels': 1.2,
+        'tackles': 0.8,
+        'interceptions': 0.4,
+        'clearances': 0.3,
+        'fbref': True,
+        'transfermarkt': True,
+        'asa': True,
+        'sofascore': True
+    },
+    {
+        'id': 2,
+        'name': 'Tyler Adams',
+        'age': 25,
+        'position': 'CDM',
+        'club': 'AFC Bournemouth',
+        'league': 'MLS',
+        'nationality': 'USA',
+        'market_value': 25000000,
+        'rating': 8.5,
+        'goals': 2,
+        'assists': 4,
+        'matches': 30,
+        'minutes_played': 2567,
+        'pass_accuracy': 88,
+        'shots_per_game': 0.8,
+        'key_passes': 1.5,
+        'dribbles': 1.2,
+        'aerial_duels': 2.1,
+        'tackles': 3.2,
+        'interceptions': 2.8,
+        'clearances': 1.9,
+        'fbref': True,
+        'transfermarkt': True,
+        'asa': True,
+        'sofascore': True
+    },
+    {
+        'id': 3,
+        'name': 'Ricardo Pepi',
+        'age': 21,
+        'position': 'ST',
+        'club': 'PSV Eindhoven',
+        'league': 'MLS',
+        'nationality': 'USA',
+        'market_value': 15000000,
+        'rating': 7.8,
+        'goals': 12,
+        'assists': 3,
+        'matches': 25,
+        'minutes_played': 1890,
+        'pass_accuracy': 76,
+        'shots_per_game': 3.8,
+        'key_passes': 1.2,
+        'dribbles': 1.8,
+        'aerial_duels': 2.5,
+        'tackles': 0.3,
+        'interceptions': 0.2,
+        'clearances': 0.4,
+        'fbref': True,
+        'transfermarkt': True,
+        'asa': False,
+        'sofascore': True
+    },
+    {
+        'id': 4,
+        'name': 'Emiliano Rigoni',
+        'age': 31,
+        'position': 'RW',
+        'club': 'Austin FC',
+        'league': 'MLS',
+        'nationality': 'Argentina',
+        'market_value': 3500000,
+        'rating': 7.5,
+        'goals': 8,
+        'assists': 11,
+        'matches': 32,
+        'minutes_played': 2456,
+        'pass_accuracy': 84,
+        'shots_per_game': 2.4,
+        'key_passes': 2.8,
+        'dribbles': 3.1,
+        'aerial_duels': 0.8,
+        'tackles': 0.9,
+        'interceptions': 0.6,
+        'clearances': 0.2,
+        'fbref': True,
+        'transfermarkt': True,
+        'asa': True,
+        'sofascore': True
+    },
+    {
+        'id': 5,
+        'name': 'Tanner Tessmann',
+        'age': 23,
+        'position': 'CM',
+        'club': 'Venezia FC',
+        'league': 'USL Championship',
+        'nationality': 'USA',
+        'market_value': 4000000,
+        'rating': 7.6,
+        'goals': 5,
+        'assists': 7,
+        'matches': 29,
+        'minutes_played': 2234,
+        'pass_accuracy': 85,
+        'shots_per_game': 1.3,
+        'key_passes': 2.0,
+        'dribbles': 1.5,
+        'aerial_duels': 1.8,
+        'tackles': 2.4,
+        'interceptions': 1.9,
+        'clearances': 1.2,
+        'fbref': True,
+        'transfermarkt': True,
+        'asa': False,
+        'sofascore': True
+    },
+    {
+        'id': 6,
+        'name': 'Nick Lima',
+        'age': 29,
+        'position': 'RB',
+        'club': 'New England Revolution',
+        'league': 'MLS',
+        'nationality': 'USA',
+        'market_value': 2500000,
+        'rating': 7.2,
+        'goals': 1,
+        'assists': 6,
+        'matches': 28,
+        'minutes_played': 2320,
+        'pass_accuracy': 81,
+        'shots_per_game': 0.6,
+        'key_passes': 1.4,
+        'dribbles': 1.9,
+        'aerial_duels': 1.5,
+        'tackles': 2.8,
+        'interceptions': 2.1,
+        'clearances': 2.5,
+        'fbref': True,
+        'transfermarkt': True,
+        'asa': True,
+        'sofascore': True
+    },
+    {
+        'id': 7,
+        'name': 'Jonathan Lewis',
+        'age': 26,
+        'position': 'LW',
+        'club': 'Colorado Rapids',
+        'league': 'MLS',
+        'nationality': 'USA',
+        'market_value': 3000000,
+        'rating': 7.3,
+        'goals': 9,
+        'assists': 5,
+        'matches': 26,
+        'minutes_played': 1856,
+        'pass_accuracy': 79,
+        'shots_per_game': 2.6,
+        'key_passes': 1.7,
+        'dribbles': 3.4,
+        'aerial_duels': 0.6,
+        'tackles': 0.7,
+        'interceptions': 0.4,
+        'clearances': 0.1,
+        'fbref': True,
+        'transfermarkt': False,
+        'asa': True,
+        'sofascore': True
+    },
+    {
+        'id': 8,
+        'name': 'Hadji Barry',
+        'age': 31,
+        'position': 'ST',
+        'club': 'Colorado Springs',
+        'league': 'USL Championship',
+        'nationality': 'Guinea',
+        'market_value': 800000,
+        'rating': 7.0,
+        'goals': 18,
+        'assists': 4,
+        'matches': 30,
+        'minutes_played': 2456,
+        'pass_accuracy': 72,
+        'shots_per_game': 3.9,
+        'key_passes': 1.0,
+        'dribbles': 1.3,
+        'aerial_duels': 3.2,
+        'tackles': 0.4,
+        'interceptions': 0.3,
+        'clearances': 0.5,
+        'fbref': True,
+        'transfermarkt': True,
+        'asa': False,
+        'sofascore': False
+    },
+    {
+        'id': 9,
+        'name': 'Milan Iloski',
+        'age': 24,
+        'position': 'CAM',
+        'club': 'Charleston Battery',
+        'league': 'USL Championship',
+        'nationality': 'North Macedonia',
+        'market_value': 1200000,
+        'rating': 7.1,
+        'goals': 7,
+        'assists': 9,
+        'matches': 28,
+        'minutes_played': 2134,
+        'pass_accuracy': 83,
+        'shots_per_game': 2.1,
+        'key_passes': 2.9,
+        'dribbles': 2.2,
+        'aerial_duels': 0.9,
+        'tackles': 1.1,
+        'interceptions': 0.8,
+        'clearances': 0.3,
+        'fbref': True,
+        'transfermarkt': False,
+        'asa': False,
+        'sofascore': True
+    },
+    {
+        'id': 10,
+        'name': 'Arturo Rodriguez',
+        'age': 22,
+        'position': 'CM',
+        'club': 'FC Tulsa',
+        'league': 'USL Championship',
+        'nationality': 'USA',
+        'market_value': 900000,
+        'rating': 6.9,
+        'goals': 3,
+        'assists': 6,
+        'matches': 31,
+        'minutes_played': 2567,
+        'pass_accuracy': 86,
+        'shots_per_game': 1.0,
+        'key_passes': 1.8,
+        'dribbles': 1.4,
+        'aerial_duels': 1.6,
+        'tackles': 2.6,
+        'interceptions': 2.2,
+        'clearances': 1.4,
+        'fbref': True,
+        'transfermarkt': True,
+        'asa': False,
+        'sofascore': True
+    },
+    {
+        'id': 11,
+        'name': 'Dariusz Formella',
+        'age': 28,
+        'position': 'RW',
+        'club': 'Union Omaha',
+        'league': 'USL League One',
+        'nationality': 'Poland',
+        'market_value': 600000,
+        'rating': 6.8,
+        'goals': 11,
+        'assists': 8,
+        'matches': 27,
+        'minutes_played': 2234,
+        'pass_accuracy': 80,
+        'shots_per_game': 2.8,
+        'key_passes': 2.3,
+        'dribbles': 2.9,
+        'aerial_duels': 0.7,
+        'tackles': 0.8,
+        'interceptions': 0.5,
+        'clearances': 0.2,
+        'fbref': False,
+        'transfermarkt': True,
+        'asa': False,
+        'sofascore': False
+    },
+    {
+        'id': 12,
+        'name': 'Greg Hurst',
+        'age': 27,
+        'position': 'ST',
+        'club': 'Chattanooga Red Wolves',
+        'league': 'USL League One',
+        'nationality': 'USA',
+        'market_value': 450000,
+        'rating': 6.7,
+        'goals': 14,
+        'assists': 3,
+        'matches': 29,
+        'minutes_played': 2345,
+        'pass_accuracy': 74,
+        'shots_per_game': 3.4,
+        'key_passes': 0.9,
+        'dribbles': 1.1,
+        'aerial_duels': 2.8,
+        'tackles': 0.3,
+        'interceptions': 0.2,
+        'clearances': 0.4,
+        'fbref': False,
+        'transfermarkt': False,
+        'asa': False,
+        'sofascore': True
+    }
+]
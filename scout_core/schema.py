@@ -0,0 +1,118 @@
+"""Compact in-memory schema for the player table.
+
+Repeated strings (position, league, club, nationality) are categoricals,
+counters are downcast to the smallest integer type that holds them, per-game
+rates are float32 and the four data-source flags are packed into a single
+``sources`` bitmask. ``expand_players`` restores the wide layout (plain
+strings, one boolean per source) for code that edits rows, such as sync.
+
+A stat none of a player's sources reported (the market value of a player
+only FBref covers, say) is NaN in the float columns and ``MISSING`` in the
+integer ones. ``stat_values`` and ``missing_as_nan`` read both as NaN, so
+aggregates and percentiles skip them instead of counting a zero;
+``missing_as_null`` turns them into nulls for exports.
+"""
+import numpy as np
+
+SOURCE_BITS = {'fbref': 1, 'transfermarkt': 2, 'asa': 4, 'sofascore': 8}
+SOURCE_LABELS = {'fbref': 'FBref', 'transfermarkt': 'Transfermarkt', 'asa': 'ASA', 'sofascore': 'Sofascore'}
+
+CATEGORY_COLUMNS = ('position', 'club', 'league', 'nationality')
+
+PLAYER_DTYPES = {
+    'id': 'int32',
+    'name': 'object',
+    'age': 'int8',
+    'position': 'category',
+    'club': 'category',
+    'league': 'category',
+    'nationality': 'category',
+    'market_value': 'int32',
+    'rating': 'float32',
+    'goals': 'int16',
+    'assists': 'int16',
+    'matches': 'int16',
+    'minutes_played': 'int32',
+    'pass_accuracy': 'float32',
+    'shots_per_game': 'float32',
+    'key_passes': 'float32',
+    'dribbles': 'float32',
+    'aerial_duels': 'float32',
+    'tackles': 'float32',
+    'interceptions': 'float32',
+    'clearances': 'float32',
+    'sources': 'uint8',
+}
+
+# Stored in the integer stat columns where the stat is unknown
+MISSING = -1
+INT_STAT_COLUMNS = ('age', 'market_value', 'goals', 'assists', 'matches', 'minutes_played')
+
+
+def pack_sources(df):
+    """Bitmask of the boolean source columns of ``df``."""
+    packed = np.zeros(len(df), dtype=np.uint8)
+    for source, bit in SOURCE_BITS.items():
+        if source in df:
+            packed |= np.where(df[source].to_numpy(dtype=bool), bit, 0).astype(np.uint8)
+    return packed
+
+
+def has_source(sources, source):
+    """Whether a ``sources`` bitmask (scalar or array) includes ``source``."""
+    return (sources & SOURCE_BITS[source]) != 0
+
+
+def compact_players(df):
+    """Return ``df`` in the compact schema (no-op for columns already compact)."""
+    if 'sources' not in df:
+        df = df.drop(columns=[s for s in SOURCE_BITS if s in df]).assign(sources=pack_sources(df))
+    dtypes = {
+        column: dtype for column, dtype in PLAYER_DTYPES.items()
+        if column in df and str(df[column].dtype) != dtype
+    }
+    return df.astype(dtypes) if dtypes else df
+
+
+def expand_players(df):
+    """Return ``df`` in the wide layout: plain strings and one flag per source."""
+    df = df.astype({c: 'object' for c in CATEGORY_COLUMNS if c in df})
+    if 'sources' in df:
+        sources = df['sources'].to_numpy()
+        df = df.drop(columns=['sources']).assign(
+            **{source: has_source(sources, source) for source in SOURCE_BITS}
+        )
+    return df
+
+
+def stat_values(df, column):
+    """``df[column]`` as a float64 array, NaN where the stat is missing."""
+    values = df[column].to_numpy(dtype=np.float64, copy=True)
+    if column in INT_STAT_COLUMNS:
+        values[values == MISSING] = np.nan
+    return values
+
+
+def missing_as_nan(df):
+    """``df`` with its missing integer stats as NaN (columns with any become floats)."""
+    missing = {
+        column: df[column] != MISSING for column in INT_STAT_COLUMNS
+        if column in df and (df[column] == MISSING).any()
+    }
+    if not missing:
+        return df
+    return df.assign(**{column: df[column].where(present) for column, present in missing.items()})
+
+
+def missing_as_null(df):
+    """``df`` with nullable integer stat columns, null where missing (for exports and JSON)."""
+    columns = [column for column in INT_STAT_COLUMNS if column in df]
+    return df.assign(**{
+        column: df[column].astype(str(df[column].dtype).capitalize()).mask(df[column] == MISSING)
+        for column in columns
+    })
+
+
+def memory_footprint(df):
+    """Deep memory usage of ``df`` in bytes."""
+    return int(df.memory_usage(deep=True).sum())
@@ -0,0 +1,122 @@
+"""Trigram/prefix search index over player names, clubs and nationalities.
+
+Text is lowercased and accent-folded ("Rodríguez" matches "rodriguez").
+Queries of three or more characters behave like a substring search and are
+answered from trigram posting lists; shorter queries match word prefixes.
+Optional fuzzy matching ranks indexed terms by trigram overlap so that
+misspelled names ("Diego Rosi") still find the player.
+"""
+import bisect
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+SEARCH_FIELDS = ('name', 'club', 'nationality')
+FUZZY_THRESHOLD = 0.45
+
+_EMPTY = np.empty(0, dtype=np.intp)
+
+
+def normalize_text(text):
+    """Lowercase, strip accents and collapse whitespace."""
+    decomposed = unicodedata.normalize('NFKD', str(text))
+    folded = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return ' '.join(folded.casefold().split())
+
+
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class SearchIndex:
+    def __init__(self, df, fields=SEARCH_FIELDS):
+        self._size = len(df)
+
+        # Distinct normalized terms across all fields; clubs and nationalities
+        # repeat heavily, so each is indexed once however many rows use it.
+        term_ids = {}
+        row_parts = []
+        term_parts = []
+        for field in fields:
+            codes, uniques = pd.factorize(df[field])
+            mapping = np.empty(len(uniques), dtype=np.intp)
+            for i, value in enumerate(uniques):
+                mapping[i] = term_ids.setdefault(normalize_text(value), len(term_ids))
+            valid = codes >= 0
+            row_parts.append(np.flatnonzero(valid))
+            term_parts.append(mapping[codes[valid]])
+        self._terms = list(term_ids)
+
+        # term id -> row positions
+        rows = np.concatenate(row_parts) if row_parts else _EMPTY
+        terms = np.concatenate(term_parts) if term_parts else _EMPTY
+        order = np.lexsort((rows, terms))
+        self._term_rows = rows[order]
+        self._term_bounds = np.searchsorted(terms[order], np.arange(len(self._terms) + 1))
+
+        # trigram -> term ids, and sorted (word, term id) pairs for prefixes
+        postings = {}
+        words = []
+        self._gram_counts = np.zeros(len(self._terms), dtype=np.intp)
+        for term_id, term in enumerate(self._terms):
+            grams = trigrams(term)
+            self._gram_counts[term_id] = len(grams)
+            for gram in grams:
+                postings.setdefault(gram, []).append(term_id)
+            words.extend((word, term_id) for word in set(term.split()))
+        self._postings = {gram: np.array(ids, dtype=np.intp) for gram, ids in postings.items()}
+        words.sort()
+        self._words = [word for word, _ in words]
+        self._word_terms = np.array([term_id for _, term_id in words], dtype=np.intp)
+
+    def __len__(self):
+        return self._size
+
+    def _rows_for_terms(self, term_ids):
+        if len(term_ids) == 0:
+            return _EMPTY
+        parts = [
+            self._term_rows[self._term_bounds[t]:self._term_bounds[t + 1]] for t in term_ids
+        ]
+        return np.unique(np.concatenate(parts))
+
+    def _substring_terms(self, needle):
+        grams = sorted(trigrams(needle), key=lambda g: len(self._postings.get(g, _EMPTY)))
+        candidates = self._postings.get(grams[0], _EMPTY)
+        for gram in grams[1:]:
+            if len(candidates) == 0:
+                break
+            candidates = np.intersect1d(candidates, self._postings.get(gram, _EMPTY), assume_unique=True)
+        return [t for t in candidates if needle in self._terms[t]]
+
+    def _prefix_terms(self, needle):
+        start = bisect.bisect_left(self._words, needle)
+        stop = bisect.bisect_left(self._words, needle + '\uffff')
+        return np.unique(self._word_terms[start:stop])
+
+    def _fuzzy_terms(self, needle, threshold):
+        grams = trigrams(needle)
+        hits = [self._postings[g] for g in grams if g in self._postings]
+        if not hits:
+            return _EMPTY
+        shared = np.bincount(np.concatenate(hits), minlength=len(self._terms))
+        candidates = np.flatnonzero(shared)
+        # Dice coefficient; terms longer than the query are scored against
+        # the query length so "rosi" still finds "diego rossi".
+        denominator = len(grams) + np.minimum(self._gram_counts[candidates], len(grams))
+        scores = 2 * shared[candidates] / denominator
+        return candidates[scores >= threshold]
+
+    def search(self, query, fuzzy=False, threshold=FUZZY_THRESHOLD):
+        """Return the sorted row positions matching ``query``."""
+        needle = normalize_text(query)
+        if not needle:
+            return np.arange(self._size)
+        if len(needle) < 3:
+            return self._rows_for_terms(self._prefix_terms(needle))
+        terms = self._substring_terms(needle)
+        if fuzzy:
+            terms = np.union1d(np.asarray(terms, dtype=np.intp), self._fuzzy_terms(needle, threshold))
+        return self._rows_for_terms(terms)
+
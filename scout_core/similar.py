@@ -0,0 +1,70 @@
+"""Similar-player search over standardized per-game stats.
+
+``SimilarityIndex`` is built once per dataset load, next to the filter and
+search indexes: the style stats are z-scored into a float32 matrix with
+pre-computed squared norms, so a query is a single matrix-vector product
+against the candidate rows followed by a partial sort. Rows are also
+partitioned by position, letting a same-position query touch only that
+position's rows.
+"""
+import numpy as np
+import pandas as pd
+
+SIMILARITY_FEATURES = (
+    'shots_per_game', 'key_passes', 'dribbles', 'aerial_duels',
+    'tackles', 'interceptions', 'clearances', 'pass_accuracy',
+)
+
+
+class SimilarityIndex:
+    def __init__(self, df, features=SIMILARITY_FEATURES):
+        self.features = tuple(features)
+        self._size = len(df)
+
+        values = df[list(self.features)].to_numpy(dtype=np.float64)
+        if self._size:
+            mean = np.nanmean(values, axis=0)
+            std = np.nanstd(values, axis=0)
+            std[~(std > 0)] = 1.0
+            values = (values - mean) / std
+        self._matrix = np.nan_to_num(values).astype(np.float32)
+        self._norms = np.einsum('ij,ij->i', self._matrix, self._matrix)
+
+        # Row positions per position, for same-position queries
+        self._position_codes, _ = pd.factorize(df['position'])
+        order = np.argsort(self._position_codes, kind='stable')
+        bounds = np.searchsorted(self._position_codes[order], np.arange(self._position_codes.max(initial=-1) + 2))
+        self._partitions = [order[bounds[i]:bounds[i + 1]] for i in range(len(bounds) - 1)]
+
+    def __len__(self):
+        return self._size
+
+    def _pool(self, row, candidates, same_position):
+        pool = self._partitions[self._position_codes[row]] if same_position else None
+        if candidates is not None:
+            allowed = np.zeros(self._size, dtype=bool)
+            allowed[candidates] = True
+            pool = np.flatnonzero(allowed) if pool is None else pool[allowed[pool]]
+        if pool is None:
+            pool = np.arange(self._size)
+        return pool[pool != row]
+
+    def similar(self, row, k=10, candidates=None, same_position=False):
+        """The ``k`` players closest to row position ``row``.
+
+        ``candidates`` (row positions, e.g. from ``PlayerIndex.select``)
+        restricts the matches; ``same_position`` keeps only players with the
+        same position. Returns ``(positions, distances)``, nearest first.
+        """
+        pool = self._pool(row, candidates, same_position)
+        if len(pool) == 0 or k <= 0:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)
+
+        target = self._matrix[row]
+        distances = self._norms[pool] - 2 * (self._matrix[pool] @ target) + self._norms[row]
+        if k < len(pool):
+            nearest = np.argpartition(distances, k - 1)[:k]
+        else:
+            nearest = np.arange(len(pool))
+        nearest = nearest[np.argsort(distances[nearest], kind='stable')]
+        return pool[nearest], np.sqrt(np.maximum(distances[nearest], 0))
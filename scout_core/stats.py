@@ -0,0 +1,93 @@
+"""Vectorized stat computations shared by the dashboard tabs.
+
+``player_stats`` derives, for every player of a data load in one pass,
+per-90 rates from ``minutes_played`` and percentile ranks against the
+players of the same position group in the same league. The Players grid,
+radar chart, sort options and exports all read these columns.
+
+Stats a player's sources didn't report stay out of the rankings: their
+per-90 values are NaN and the other players are ranked as if they weren't
+there.
+"""
+import numpy as np
+import pandas as pd
+
+from scout_core.schema import stat_values
+
+POSITION_GROUPS = {
+    'GK': 'GK',
+    'CB': 'DEF', 'LB': 'DEF', 'RB': 'DEF',
+    'CDM': 'MID', 'CM': 'MID', 'CAM': 'MID',
+    'LW': 'FWD', 'RW': 'FWD', 'ST': 'FWD', 'FW': 'FWD',
+}
+
+# Season totals and per-game rates, converted to per-90 values
+TOTAL_STATS = {'goals': 'goals_per90', 'assists': 'assists_per90'}
+PER_GAME_STATS = {
+    'shots_per_game': 'shots_per90',
+    'key_passes': 'key_passes_per90',
+    'dribbles': 'dribbles_per90',
+    'aerial_duels': 'aerial_duels_per90',
+    'tackles': 'tackles_per90',
+    'interceptions': 'interceptions_per90',
+    'clearances': 'clearances_per90',
+}
+PER90_COLUMNS = list(TOTAL_STATS.values()) + list(PER_GAME_STATS.values())
+
+# Stats ranked within (league, position group)
+PERCENTILE_STATS = PER90_COLUMNS + ['pass_accuracy', 'rating']
+
+
+def percentile_column(stat):
+    return f"{stat}_pct"
+
+
+PERCENTILE_COLUMNS = [percentile_column(stat) for stat in PERCENTILE_STATS]
+STAT_COLUMNS = PER90_COLUMNS + PERCENTILE_COLUMNS
+
+# Radar chart axes: (label, stat); plotted as percentiles
+RADAR_STATS = [
+    ('Goals', 'goals_per90'),
+    ('Assists', 'assists_per90'),
+    ('Pass Acc', 'pass_accuracy'),
+    ('Dribbles', 'dribbles_per90'),
+    ('Tackles', 'tackles_per90'),
+    ('Interceptions', 'interceptions_per90'),
+]
+RADAR_CATEGORIES = [label for label, _ in RADAR_STATS]
+RADAR_COLUMNS = [percentile_column(stat) for _, stat in RADAR_STATS]
+
+
+def per90_values(df):
+    """Per-90 matrix for every row of ``df`` (NaN for players without minutes or the stat)."""
+    minutes = stat_values(df, 'minutes_played')
+    matches = stat_values(df, 'matches')
+    totals = np.column_stack([stat_values(df, column) for column in TOTAL_STATS])
+    rates = df[list(PER_GAME_STATS)].to_numpy(dtype=float) * matches[:, None]
+    values = np.hstack([totals, rates])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        values = np.where(minutes[:, None] > 0, values * 90 / minutes[:, None], np.nan)
+    return pd.DataFrame(values.astype(np.float32), index=df.index, columns=PER90_COLUMNS)
+
+
+def player_stats(df):
+    """Per-90 rates and 0-100 percentiles for every row of ``df``.
+
+    Percentiles rank each stat against players in the same league and
+    position group (GK/DEF/MID/FWD); ties share the average rank. A
+    missing stat isn't ranked and gets percentile 0.
+    """
+    per90 = per90_values(df)
+    ranked = pd.concat([per90, df[['pass_accuracy', 'rating']]], axis=1)
+    league_codes, _ = pd.factorize(df['league'])
+    group_codes, group_names = pd.factorize(df['position'].astype(object).map(POSITION_GROUPS).fillna('Other'))
+    cohorts = league_codes * len(group_names) + group_codes
+    percentiles = ranked[PERCENTILE_STATS].groupby(cohorts, sort=False).rank(pct=True) * 100
+    percentiles = percentiles.fillna(0).astype(np.float32)
+    percentiles.columns = PERCENTILE_COLUMNS
+    return pd.concat([per90, percentiles], axis=1)
+
+
+def attach_player_stats(df):
+    """Return ``df`` with the per-90 and percentile columns attached."""
+    return pd.concat([df.drop(columns=[c for c in STAT_COLUMNS if c in df]), player_stats(df)], axis=1)
@@ -0,0 +1,209 @@
+"""Persistent columnar store for the player and team tables.
+
+Tables are kept as uncompressed Arrow IPC files, partitioned by league
+(``.players-<version>/league=MLS/part-0.arrow``), and read through memory
+maps so that every worker process shares the same pages of the OS cache
+instead of unpickling its own copy. Every write goes to a new version
+directory; a pointer file (``players.current``) names the current one and
+is replaced atomically, so readers never see a table missing or half
+written. Filters are pushed down into the scan: a league
+predicate skips whole partitions and the remaining predicates are evaluated
+on the mapped record batches before anything is converted to pandas.
+
+``Store.history`` keeps the stat snapshots of past syncs next to the
+tables (see ``scout_core.history``).
+"""
+import os
+import shutil
+import time
+import uuid
+from pathlib import Path
+from urllib.parse import quote
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+from pyarrow import fs
+
+from scout_core.config import data_path
+from scout_core.history import SnapshotStore
+from scout_core.schema import compact_players
+from scout_core.teams import team_aggregates
+
+_STRINGS = pa.dictionary(pa.int32(), pa.string())
+
+# Compact player schema (see scout_core.schema); league is the partition key
+PLAYER_SCHEMA = pa.schema([
+    ('id', pa.int32()),
+    ('name', pa.string()),
+    ('age', pa.int8()),
+    ('position', _STRINGS),
+    ('club', _STRINGS),
+    ('league', pa.string()),
+    ('nationality', _STRINGS),
+    ('market_value', pa.int32()),
+    ('rating', pa.float32()),
+    ('goals', pa.int16()),
+    ('assists', pa.int16()),
+    ('matches', pa.int16()),
+    ('minutes_played', pa.int32()),
+    ('pass_accuracy', pa.float32()),
+    ('shots_per_game', pa.float32()),
+    ('key_passes', pa.float32()),
+    ('dribbles', pa.float32()),
+    ('aerial_duels', pa.float32()),
+    ('tackles', pa.float32()),
+    ('interceptions', pa.float32()),
+    ('clearances', pa.float32()),
+    ('sources', pa.uint8()),
+])
+
+# Derived from the player table (see scout_core.teams)
+TEAM_SCHEMA = pa.schema([
+    ('name', pa.string()),
+    ('league', pa.string()),
+    ('players', pa.int64()),
+    ('avg_age', pa.float64()),
+    ('market_value', pa.int64()),
+    ('median_value', pa.float64()),
+    ('avg_rating', pa.float64()),
+    ('goals', pa.int64()),
+])
+
+PARTITION_SCHEMA = pa.schema([('league', pa.string())])
+
+
+def player_filter(league=None, position=None, age_range=None, value_range=None, ids=None):
+    """Build a pushdown predicate from the sidebar-style filters.
+
+    Only ``league`` applies to the team table as well.
+    """
+    predicate = None
+    clauses = []
+    if league is not None:
+        clauses.append(pc.field('league') == league)
+    if position is not None:
+        clauses.append(pc.field('position') == position)
+    if age_range is not None:
+        clauses.append((pc.field('age') >= age_range[0]) & (pc.field('age') <= age_range[1]))
+    if value_range is not None:
+        clauses.append(
+            (pc.field('market_value') >= value_range[0]) & (pc.field('market_value') <= value_range[1])
+        )
+    if ids is not None:
+        clauses.append(pc.field('id').isin(list(ids)))
+    for clause in clauses:
+        predicate = clause if predicate is None else predicate & clause
+    return predicate
+
+
+def _written_at(path):
+    """Write time (ns) in the name of a table version directory (``.players-<ns>-<id>``)."""
+    try:
+        return int(path.name.split('-')[1])
+    except (IndexError, ValueError):
+        return None
+
+
+class Store:
+    def __init__(self, directory=None):
+        self.directory = Path(directory) if directory else data_path('store')
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._filesystem = fs.LocalFileSystem(use_mmap=True)
+        self.history = SnapshotStore(self.directory / 'history')
+
+    def _pointer(self, table):
+        return self.directory / f"{table}.current"
+
+    def _current(self, table):
+        """Directory of the current version of ``table``, or ``None`` if it was never written."""
+        try:
+            name = self._pointer(table).read_text()
+        except FileNotFoundError:
+            legacy = self.directory / table  # written before tables were versioned
+            return legacy if legacy.is_dir() else None
+        return self.directory / name
+
+    def has(self, table):
+        return self._current(table) is not None
+
+    def version(self, table):
+        """Changes whenever ``table`` is rewritten (by any process)."""
+        current = self._current(table)
+        if current is None:
+            return 0
+        return _written_at(current) or current.stat().st_mtime_ns
+
+    def _write(self, table, df, schema):
+        arrow_table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+        previous = self._current(table)
+        target = self.directory / f".{table}-{time.time_ns()}-{uuid.uuid4().hex[:8]}"
+        leagues = pc.unique(arrow_table['league']).to_pylist()
+        for league in leagues:
+            partition = target / f"league={quote(str(league), safe='')}"
+            partition.mkdir(parents=True)
+            rows = arrow_table.filter(pc.equal(arrow_table['league'], league)).drop_columns(['league'])
+            with pa.OSFile(str(partition / 'part-0.arrow'), 'wb') as sink:
+                with pa.ipc.new_file(sink, rows.schema) as writer:
+                    writer.write_table(rows)
+        target.mkdir(exist_ok=True)  # an empty table still gets a directory
+        # Publish the new version by replacing the pointer file in one
+        # rename: readers see either the old directory or the new one, never
+        # neither. The previous version stays on disk for readers that
+        # resolved it just before the swap; older ones are removed.
+        staging = self.directory / f".{table}.current-{uuid.uuid4().hex}"
+        staging.write_text(target.name)
+        os.replace(staging, self._pointer(table))
+        self._prune(table, previous)
+
+    def _prune(self, table, previous):
+        """Remove the versions of ``table`` older than ``previous``."""
+        if previous is None or previous.name == table:
+            return
+        cutoff = _written_at(previous)
+        stale = [self.directory / table]
+        for path in self.directory.glob(f".{table}-*"):
+            written_at = _written_at(path)
+            if written_at is None or written_at < cutoff:
+                stale.append(path)
+        for path in stale:
+            shutil.rmtree(path, ignore_errors=True)
+
+    def _dataset(self, table, schema):
+        return ds.dataset(
+            str(self._current(table)),
+            schema=schema,
+            format='ipc',
+            partitioning=ds.partitioning(PARTITION_SCHEMA, flavor='hive'),
+            filesystem=self._filesystem,
+        )
+
+    def _read(self, table, schema, predicate=None, columns=None, order=('id',)):
+        arrow_table = self._dataset(table, schema).to_table(filter=predicate, columns=columns)
+        keys = [(key, 'ascending') for key in order if key in arrow_table.column_names]
+        if keys:
+            arrow_table = arrow_table.sort_by(keys)
+        return arrow_table.to_pandas()
+
+    def write_players(self, df):
+        self._write('players', compact_players(df), PLAYER_SCHEMA)
+
+    def write_teams(self, df):
+        self._write('teams', df, TEAM_SCHEMA)
+
+    def load_players(self, predicate=None, columns=None):
+        return compact_players(self._read('players', PLAYER_SCHEMA, predicate, columns))
+
+    def load_teams(self, predicate=None, columns=None):
+        return self._read('teams', TEAM_SCHEMA, predicate, columns, order=('league', 'name'))
+
+    def seed(self, players_df):
+        """Write ``players_df`` (and its team aggregates) if the store has no data yet."""
+        if not self.has('players'):
+            # Players last, as in a sync: their version is what readers watch
+            players = compact_players(players_df)
+            self.history.record(players)
+            self.write_teams(team_aggregates(players))
+            self.write_players(players)
+        elif not self.has('teams'):
+            self.write_teams(team_aggregates(self.load_players()))
@@ -0,0 +1,10 @@
+"""Multi-source data sync (FBref, Transfermarkt, ASA, Sofascore)."""
+from scout_core.sync.pipeline import (
+    SourceFetch, SyncResult, fetch_pages, merge_fetched, replay_pages, sync_players, write_sync,
+)
+from scout_core.sync.sources import LEAGUES, SOURCES
+
+__all__ = [
+    'LEAGUES', 'SOURCES', 'SourceFetch', 'SyncResult',
+    'fetch_pages', 'merge_fetched', 'replay_pages', 'sync_players', 'write_sync',
+]
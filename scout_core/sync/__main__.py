@@ -0,0 +1,114 @@
+"""Run a sync from the command line.
+
+    python -m scout_core.sync --league MLS --base-url fbref=http://127.0.0.1:8000/fbref
+    python -m scout_core.sync --league MLS --browsers 4   # render JavaScript pages in Chrome
+    python -m scout_core.sync --cache data/page_cache --store data/store            # keep the raw pages
+    python -m scout_core.sync --cache data/page_cache --store data/store --replay   # re-parse them offline
+
+Base URL overrides make it easy to sync against a local fixture server
+serving recorded pages under the sources' URL paths. ``--replay`` parses
+the pages kept in the page cache instead of fetching anything, which
+rebuilds the player and team tables after a parser change without the
+network.
+"""
+import argparse
+
+import pandas as pd
+
+from scout_core.sample_data import SAMPLE_PLAYERS
+from scout_core.schema import expand_players
+from scout_core.stats import attach_player_stats
+from scout_core.store import Store
+from scout_core.sync import LEAGUES, SOURCES, merge_fetched, replay_pages, sync_players, write_sync
+from scout_core.sync.pagecache import MAX_CACHE_BYTES, PageCache
+from scout_core.sync.parsing import parse_pool
+from scout_core.sync.state import SyncState
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sync player data from the scouting sources")
+    parser.add_argument('--league', action='append', choices=sorted(LEAGUES), help="league to sync (repeatable)")
+    parser.add_argument('--source', action='append', choices=sorted(SOURCES), help="source to sync (repeatable)")
+    parser.add_argument('--base-url', action='append', default=[], metavar='SOURCE=URL',
+                        help="override a source's base URL, e.g. for a fixture server")
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--state', metavar='PATH',
+                        help="track page changes in this SQLite file and sync incrementally")
+    parser.add_argument('--store', metavar='DIR',
+                        help="sync the player table of this store and write the result back")
+    parser.add_argument('--output', help="write the merged player table to this CSV file")
+    parser.add_argument('--browsers', type=int, default=0, metavar='N',
+                        help="render pages that need JavaScript in up to N headless Chrome sessions")
+    parser.add_argument('--browsers-per-source', type=int, default=2, metavar='N',
+                        help="browser sessions one source may use at once")
+    parser.add_argument('--cache', metavar='DIR', help="keep the raw fetched pages in this page cache")
+    parser.add_argument('--cache-size', type=int, default=MAX_CACHE_BYTES // 2**20, metavar='MB',
+                        help="evict least recently used pages beyond this size")
+    parser.add_argument('--replay', action='store_true',
+                        help="parse the pages in --cache instead of fetching them")
+    parser.add_argument('--parse-processes', type=int, default=0, metavar='N',
+                        help="parse pages in a pool of N processes (default: in the fetching process)")
+    args = parser.parse_args(argv)
+    if args.replay and not args.cache:
+        parser.error("--replay needs --cache")
+
+    base_urls = dict(item.split('=', 1) for item in args.base_url)
+    store = Store(args.store) if args.store else None
+    players = store.load_players() if store is not None and store.has('players') else pd.DataFrame(SAMPLE_PLAYERS)
+    state = SyncState(args.state) if args.state else None
+    cache = PageCache(args.cache, max_bytes=args.cache_size * 2**20) if args.cache else None
+    parse_executor = parse_pool(args.parse_processes) if args.parse_processes > 0 else None
+    browser = None
+    if args.browsers > 0:
+        from scout_core.sync.browser import BrowserPool  # selenium is only needed here
+
+        browser = BrowserPool(
+            max_sessions=args.browsers,
+            source_limits={name: args.browsers_per_source for name, source in SOURCES.items() if source.browser},
+            rates={name: source.rate for name, source in SOURCES.items()},
+        )
+    try:
+        if args.replay:
+            fetches = replay_pages(cache, sources=args.source, leagues=args.league, parse_executor=parse_executor)
+            result = merge_fetched(players, list(fetches.values()), args.league, state)
+        else:
+            result = sync_players(
+                players,
+                leagues=args.league,
+                sources=args.source,
+                base_urls=base_urls,
+                max_workers=args.workers,
+                state=state,
+                browser=browser,
+                cache=cache,
+                parse_executor=parse_executor,
+            )
+    finally:
+        if parse_executor is not None:
+            parse_executor.shutdown()
+        if state is not None:
+            state.close()
+        if cache is not None:
+            stats = cache.stats()
+            print(f"Page cache: {stats['pages']} pages, {stats['bytes'] / 2**20:.1f} MB "
+                  f"({stats['stored_bytes'] / 2**20:.1f} MB compressed)")
+            cache.close()
+        if browser is not None:
+            browser.close()
+            print(f"Browser sessions: {browser.started} started, {browser.recycled} recycled")
+    print(f"{'Replayed' if args.replay else 'Fetched'} {result.pages} pages ({result.unchanged} unchanged); "
+          f"players per source: {result.coverage}")
+    print(f"Changed players: {len(result.changed_ids)}")
+    for error in result.errors:
+        print(f"  error: {error}")
+    if store is not None and result.changed_ids:
+        write_sync(store, players, result)
+        print(f"Updated store at {store.directory}")
+    if args.output:
+        expand_players(attach_player_stats(result.players)).to_csv(args.output, index=False)
+        print(f"Wrote {len(result.players)} players to {args.output}")
+    return 1 if result.errors and not result.pages else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
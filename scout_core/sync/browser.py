@@ -0,0 +1,174 @@
+"""Headless-browser fetching for pages that need JavaScript to render.
+
+``BrowserPool`` keeps a small set of headless Chrome sessions and hands
+them out per request, so a league sync pays the browser start-up a few
+times rather than once per page. It mirrors ``HttpClient.get`` and returns
+``FetchResult``s, letting the pipeline use it as a drop-in fallback for
+pages a plain request can't read (see ``Source.browser``).
+
+Sessions are recycled (quit and replaced) after ``max_pages`` pages,
+after ``max_age`` seconds, and after any driver error or page-load
+timeout, which bounds the memory a long-running Chrome accumulates.
+"""
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+from scout_core.sync.http import USER_AGENT, FetchResult, RateLimiter
+
+MAX_SESSIONS = 4
+PAGE_LOAD_TIMEOUT = 30
+MAX_PAGES_PER_SESSION = 50
+MAX_SESSION_AGE = 600
+
+# Returns the raw text for non-HTML documents (JSON APIs render inside a <pre>)
+PAGE_BODY_SCRIPT = """
+return document.contentType.indexOf('html') === -1
+    ? document.body.innerText
+    : document.documentElement.outerHTML;
+"""
+
+
+def chrome_driver(page_load_timeout=PAGE_LOAD_TIMEOUT):
+    """A headless Chrome session that skips images and doesn't wait for subresources."""
+    from selenium.webdriver.chrome.service import Service
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    options = webdriver.ChromeOptions()
+    for argument in ('--headless=new', '--no-sandbox', '--disable-dev-shm-usage',
+                     '--disable-gpu', f'--user-agent={USER_AGENT}'):
+        options.add_argument(argument)
+    options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+    options.page_load_strategy = 'eager'
+    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+    driver.set_page_load_timeout(page_load_timeout)
+    return driver
+
+
+@dataclass
+class _Session:
+    driver: object
+    started: float = field(default_factory=time.monotonic)
+    pages: int = 0
+
+
+class BrowserPool:
+    """Up to ``max_sessions`` reusable browser sessions shared by all threads.
+
+    ``source_limits`` caps how many sessions one source may use at once
+    (default: all of them); ``rates`` are requests per second per source,
+    as for ``HttpClient``. ``driver_factory`` builds a new session and
+    defaults to ``chrome_driver``.
+    """
+
+    def __init__(self, max_sessions=MAX_SESSIONS, source_limits=None, rates=None,
+                 page_load_timeout=PAGE_LOAD_TIMEOUT, max_pages=MAX_PAGES_PER_SESSION,
+                 max_age=MAX_SESSION_AGE, driver_factory=None):
+        self.page_load_timeout = page_load_timeout
+        self.max_pages = max_pages
+        self.max_age = max_age
+        self._factory = driver_factory or (lambda: chrome_driver(page_load_timeout))
+        self._slots = threading.BoundedSemaphore(max_sessions)
+        self._source_slots = {
+            source: threading.BoundedSemaphore(min(limit, max_sessions))
+            for source, limit in (source_limits or {}).items()
+        }
+        self._limiters = {source: RateLimiter(rate) for source, rate in (rates or {}).items()}
+        self._idle = queue.LifoQueue()  # most recently used first, so spare sessions age out
+        self._lock = threading.Lock()
+        self._closed = False
+        self.started = 0
+        self.recycled = 0
+
+    def _checkout(self):
+        while True:
+            try:
+                session = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    self.started += 1
+                return _Session(self._factory())
+            if time.monotonic() - session.started < self.max_age:
+                return session
+            self._recycle(session)
+
+    def _checkin(self, session, broken):
+        session.pages += 1
+        if broken or session.pages >= self.max_pages:
+            self._recycle(session)
+        elif self._closed:
+            self._quit(session)
+        else:
+            self._idle.put(session)
+
+    def _recycle(self, session):
+        with self._lock:
+            self.recycled += 1
+        self._quit(session)
+
+    def _quit(self, session):
+        try:
+            session.driver.quit()
+        except WebDriverException:
+            pass
+
+    def get(self, source, url, wait_for=None):
+        """Render ``url`` and return its document (or raw text for JSON pages).
+
+        ``wait_for`` is an XPath that must match before the page counts as
+        loaded; it is waited for up to the page-load timeout.
+        """
+        source_slots = self._source_slots.get(source)
+        limiter = self._limiters.get(source)
+        if source_slots is not None:
+            source_slots.acquire()
+        try:
+            with self._slots:
+                if limiter is not None:
+                    limiter.wait()
+                return self._render(source, url, wait_for)
+        finally:
+            if source_slots is not None:
+                source_slots.release()
+
+    def _render(self, source, url, wait_for):
+        try:
+            session = self._checkout()
+        except Exception as exc:  # driver download or launch failures aren't all WebDriverExceptions
+            return FetchResult(source, url, 0, error=f"browser failed to start: {exc}")
+        broken = True
+        try:
+            session.driver.get(url)
+            if wait_for:
+                WebDriverWait(session.driver, self.page_load_timeout).until(
+                    lambda driver: driver.find_elements(By.XPATH, wait_for)
+                )
+            body = session.driver.execute_script(PAGE_BODY_SCRIPT)
+            broken = False
+        except TimeoutException:
+            return FetchResult(source, url, 0, error="browser page load timed out")
+        except WebDriverException as exc:
+            return FetchResult(source, url, 0, error=f"browser error: {exc.msg or exc}")
+        finally:
+            self._checkin(session, broken)
+        return FetchResult(source, url, 200, (body or '').encode('utf-8'))
+
+    def close(self):
+        self._closed = True
+        while True:
+            try:
+                self._quit(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,110 @@
+"""Pooled, rate-limited HTTP fetching for the sync sources."""
+import threading
+import time
+from dataclasses import dataclass, field
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+USER_AGENT = "Mozilla/5.0 (compatible; SwarmScoutPro/1.0)"
+DEFAULT_TIMEOUT = 20
+
+
+@dataclass
+class FetchResult:
+    source: str
+    url: str
+    status: int
+    body: bytes = b''
+    headers: dict = field(default_factory=dict)
+    error: str = ''
+
+    @property
+    def ok(self):
+        return not self.error and (200 <= self.status < 300 or self.not_modified)
+
+    @property
+    def not_modified(self):
+        return self.status == 304
+
+
+class RateLimiter:
+    """Allow at most ``rate`` requests per second, shared by all threads."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class HttpClient:
+    """One pooled ``requests.Session`` and rate limiter per source.
+
+    Retries (with backoff, honouring ``Retry-After``) are handled by urllib3
+    for connection errors, 429 and 5xx responses.
+    """
+
+    def __init__(self, rates, pool_size=8, retries=3, backoff=1.0, timeout=DEFAULT_TIMEOUT):
+        self.timeout = timeout
+        self._limiters = {source: RateLimiter(rate) for source, rate in rates.items()}
+        self._sessions = {}
+        self._pool_size = pool_size
+        self._retry = Retry(
+            total=retries,
+            backoff_factor=backoff,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=('GET',),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        self._lock = threading.Lock()
+
+    def _session(self, source):
+        with self._lock:
+            session = self._sessions.get(source)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=self._pool_size,
+                    pool_maxsize=self._pool_size,
+                    max_retries=self._retry,
+                )
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                session.headers['User-Agent'] = USER_AGENT
+                self._sessions[source] = session
+            return session
+
+    def get(self, source, url, headers=None):
+        limiter = self._limiters.get(source)
+        if limiter is not None:
+            limiter.wait()
+        try:
+            response = self._session(source).get(url, headers=headers, timeout=self.timeout)
+        except requests.RequestException as exc:
+            return FetchResult(source, url, 0, error=str(exc))
+        result = FetchResult(source, url, response.status_code, response.content, response.headers)
+        if not (200 <= response.status_code < 300 or response.status_code == 304):
+            result.error = f"HTTP {response.status_code}"
+        return result
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,135 @@
+"""Combine parsed source records and merge them into the player table."""
+import pandas as pd
+import pyarrow as pa
+
+from scout_core.schema import MISSING
+
+SOURCE_FLAGS = ('fbref', 'transfermarkt', 'asa', 'sofascore')
+
+# Which source wins when several report the same column (first non-null)
+COLUMN_PRIORITY = {
+    'market_value': ('transfermarkt',),
+    'rating': ('sofascore',),
+    'position': ('transfermarkt', 'fbref'),
+    'age': ('transfermarkt', 'fbref'),
+    'club': ('transfermarkt', 'fbref', 'sofascore'),
+    'pass_accuracy': ('fbref', 'sofascore'),
+}
+DEFAULT_PRIORITY = ('fbref', 'transfermarkt', 'asa', 'sofascore')
+
+
+def combine_tables(source, tables):
+    """Fold one source's page tables (from ``parse_page``) into a frame indexed by player key.
+
+    Rows of the same key are combined column by column: the source's
+    ``totals`` are summed (a player's stints at several clubs), other
+    columns keep the last non-null value. Then the source's ``finalize``
+    step runs on the frame.
+    """
+    frame = pa.concat_tables(tables, promote_options='permissive').to_pandas()
+    if not len(frame):
+        return pd.DataFrame()
+    rows = frame.groupby('key', sort=False)
+    frame = rows.last()
+    totals = [column for column in source.totals if column in frame]
+    if totals:
+        frame[totals] = rows[totals].sum(min_count=1)
+    if source.finalize is not None:
+        frame = source.finalize(frame)
+    return frame.rename_axis(None)
+
+
+def combine_sources(frames):
+    """Outer-join per-source frames on the player key, column by column."""
+    keys = pd.Index([])
+    for frame in frames.values():
+        keys = keys.union(frame.index)
+    combined = pd.DataFrame(index=keys)
+    columns = {column for frame in frames.values() for column in frame.columns}
+    for column in sorted(columns):
+        priority = COLUMN_PRIORITY.get(column, DEFAULT_PRIORITY)
+        series = None
+        for source in priority + tuple(s for s in DEFAULT_PRIORITY if s not in priority):
+            frame = frames.get(source)
+            if frame is None or column not in frame:
+                continue
+            values = frame[column].reindex(keys)
+            series = values if series is None else series.combine_first(values)
+        combined[column] = series
+    for flag in SOURCE_FLAGS:
+        if flag in frames:
+            combined[flag] = keys.isin(frames[flag].index)
+    return combined
+
+
+def merge_players(players_df, synced, leagues):
+    """Merge ``synced`` rows (indexed by resolved player id) for ``leagues`` into ``players_df``.
+
+    Existing players get every column the sources reported except their
+    name, which stays as first stored; ids not in ``players_df`` are
+    appended as new players, with the stats no source reported missing
+    (NaN, or ``MISSING`` in integer columns) rather than zero. Flags of the sources present in ``synced``
+    reflect real coverage for players in the synced leagues; other sources'
+    flags are untouched.
+
+    Only rows whose values actually change are written. Returns the updated
+    table (``players_df`` itself when nothing changed) and the ids of the
+    changed or added players.
+    """
+    columns = [c for c in synced.columns if c in players_df.columns and c != 'id']
+    keys = players_df['id']
+    new_rows = synced.loc[~synced.index.isin(keys), columns]
+    columns = [c for c in columns if c != 'name']
+    current = players_df[columns]
+    proposed = current.copy()
+
+    flags = [flag for flag in SOURCE_FLAGS if flag in synced.columns]
+    proposed.loc[players_df['league'].isin(leagues), flags] = False
+
+    matched = keys.isin(synced.index)
+    if matched.any():
+        updates = synced.loc[keys[matched], columns]
+        updates.index = players_df.index[matched]
+        for column in columns:
+            present = updates[column].notna()
+            values = updates.loc[present, column]
+            # Compare at the stored precision: a float64 8.2 from a source
+            # is the stored float32 8.2, not a change
+            dtype = players_df[column].dtype
+            if pd.api.types.is_integer_dtype(dtype):
+                values = values.round().astype(dtype)
+            elif pd.api.types.is_float_dtype(dtype):
+                values = values.astype(dtype)
+            proposed.loc[values.index, column] = values
+
+    differs = (proposed != current) & ~(proposed.isna() & current.isna())
+    changed_rows = players_df.index[differs.any(axis=1)]
+
+    if len(changed_rows) == 0 and len(new_rows) == 0:
+        return players_df, []
+
+    players = players_df.copy()
+    if len(changed_rows):
+        players.loc[changed_rows, columns] = proposed.loc[changed_rows]
+    changed_ids = players.loc[changed_rows, 'id'].tolist()
+
+    if len(new_rows):
+        new_rows = new_rows.rename_axis('id').reset_index()
+        for column in players.columns:
+            dtype = players[column].dtype
+            if pd.api.types.is_integer_dtype(dtype):
+                fill = MISSING
+            elif pd.api.types.is_float_dtype(dtype):
+                fill = float('nan')
+            elif pd.api.types.is_bool_dtype(dtype):
+                fill = False
+            else:
+                fill = ''
+            if column not in new_rows:
+                new_rows[column] = fill
+            elif pd.api.types.is_integer_dtype(dtype):
+                new_rows[column] = new_rows[column].fillna(fill).round()
+        new_rows = new_rows[players.columns].astype(players.dtypes.to_dict())
+        players = pd.concat([players, new_rows], ignore_index=True)
+        changed_ids.extend(new_rows['id'].tolist())
+    return players, changed_ids
@@ -0,0 +1,235 @@
+"""Local, content-addressed cache of the raw pages fetched from the sources.
+
+Every page body a sync fetches is stored compressed under its SHA-256
+(``objects/ab/abcdef...``), so identical bodies (an unchanged page fetched
+again, or the same document under two URLs) are stored once. A SQLite
+index maps each URL, with its source and league, to the body it returned
+last, and records the size and last use of every body.
+
+The cache is bounded by ``max_bytes`` (compressed size on disk) and
+``max_age`` (seconds since a body was last stored or read): ``evict()``
+drops expired bodies, then the least recently used ones until the cache
+fits. ``replay_pages`` (``scout_core.sync.pipeline``) parses the cached
+pages instead of fetching them, so parser changes and full rebuilds run
+from disk, without the network.
+
+Bodies are compressed with zstd through pyarrow's codecs when this build
+has it, gzip otherwise; each body records its codec, so a cache written
+with one stays readable.
+"""
+import gzip
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+import pyarrow as pa
+
+from scout_core.config import data_path
+from scout_core.sync.state import content_hash
+
+MAX_CACHE_BYTES = 512 * 1024 * 1024
+MAX_CACHE_AGE = 30 * 24 * 3600
+ZSTD_LEVEL = 9
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    hash TEXT PRIMARY KEY,
+    codec TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    stored_size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS blobs_last_used ON blobs (last_used);
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    league TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS pages_hash ON pages (hash);
+"""
+
+
+def default_codec():
+    return 'zstd' if pa.Codec.is_available('zstd') else 'gzip'
+
+
+def compress(body, codec):
+    if codec == 'gzip':
+        return gzip.compress(body, compresslevel=6)
+    return pa.Codec(codec, compression_level=ZSTD_LEVEL).compress(body, asbytes=True)
+
+
+def decompress(data, codec, size):
+    if codec == 'gzip':
+        return gzip.decompress(data)
+    return pa.Codec(codec).decompress(data, decompressed_size=size, asbytes=True)
+
+
+class PageCache:
+    def __init__(self, directory=None, max_bytes=MAX_CACHE_BYTES, max_age=MAX_CACHE_AGE, codec=None):
+        self.directory = Path(directory or data_path('page_cache'))
+        self.objects = self.directory / 'objects'
+        self.objects.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.codec = codec or default_codec()
+        # Shared by the worker's per-source processes, like SyncState;
+        # writes take the database lock up front (see ``_transaction``)
+        self._conn = sqlite3.connect(
+            self.directory / 'index.sqlite', timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @contextmanager
+    def _transaction(self):
+        """Hold the write lock across processes for the whole block.
+
+        Body files are written and deleted inside it, so a body's file and
+        its ``blobs`` row always change together: no page can end up
+        pointing at a file another process just evicted.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _path(self, digest):
+        return self.objects / digest[:2] / digest
+
+    def _store(self, digest, data):
+        path = self._path(digest)
+        path.parent.mkdir(exist_ok=True)
+        staging = path.with_name(f".{digest}.{uuid.uuid4().hex}")
+        staging.write_bytes(data)
+        os.replace(staging, path)
+
+    def put(self, source, league, url, body, digest=None):
+        """Store ``body`` as the current page at ``url``; returns its hash.
+
+        The body is only written when no identical one is cached; the
+        previous body of ``url`` is deleted once no URL refers to it.
+        """
+        digest = digest or content_hash(body)
+        # Compress before taking the lock, unless the body is already cached
+        with self._lock:
+            known = self._conn.execute("SELECT 1 FROM blobs WHERE hash = ?", (digest,)).fetchone()
+        data = None if known else compress(body, self.codec)
+        now = time.time()
+        with self._transaction() as conn:
+            # Checked again: the body may have been evicted since
+            if conn.execute("SELECT 1 FROM blobs WHERE hash = ?", (digest,)).fetchone():
+                conn.execute("UPDATE blobs SET last_used = ? WHERE hash = ?", (now, digest))
+            else:
+                if data is None:
+                    data = compress(body, self.codec)
+                self._store(digest, data)
+                conn.execute(
+                    "INSERT INTO blobs VALUES (?, ?, ?, ?, ?)", (digest, self.codec, len(body), len(data), now)
+                )
+            previous = conn.execute("SELECT hash FROM pages WHERE url = ?", (url,)).fetchone()
+            conn.execute("INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?)", (url, source, league, digest, now))
+            if previous and previous[0] != digest:
+                self._delete_blobs(self._unreferenced([previous[0]]))
+        return digest
+
+    def has(self, url):
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM pages WHERE url = ?", (url,)).fetchone() is not None
+
+    def touch(self, url):
+        """Mark the body of ``url`` used (e.g. when the source answered ``304 Not Modified``)."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE blobs SET last_used = ? WHERE hash = (SELECT hash FROM pages WHERE url = ?)",
+                (time.time(), url),
+            )
+
+    def get(self, url):
+        """The cached body of ``url``, or ``None``."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT blobs.hash, codec, size FROM pages JOIN blobs USING (hash) WHERE url = ?", (url,)
+            ).fetchone()
+        return self._read(*row) if row is not None else None
+
+    def _read(self, digest, codec, size):
+        try:
+            data = self._path(digest).read_bytes()
+        except FileNotFoundError:  # evicted by another process since the lookup
+            return None
+        with self._lock:
+            self._conn.execute("UPDATE blobs SET last_used = ? WHERE hash = ?", (time.time(), digest))
+        return decompress(data, codec, size)
+
+    def pages(self, sources=None, leagues=None):
+        """``(source, league, url)`` of every cached page, optionally of some sources/leagues only."""
+        with self._lock:
+            rows = self._conn.execute("SELECT source, league, url FROM pages ORDER BY source, league, url").fetchall()
+        return [
+            row for row in rows
+            if (sources is None or row[0] in sources) and (leagues is None or row[1] in leagues)
+        ]
+
+    def stats(self):
+        """Number of pages and bodies, and the raw and compressed bytes of the bodies."""
+        with self._lock:
+            pages = self._conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+            blobs, size, stored = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(stored_size), 0) FROM blobs"
+            ).fetchone()
+        return {'pages': pages, 'blobs': blobs, 'bytes': size, 'stored_bytes': stored}
+
+    def evict(self):
+        """Drop bodies unused for ``max_age``, then least recently used ones down to ``max_bytes``.
+
+        Pages pointing at a dropped body are forgotten with it. Returns the
+        number of bodies removed.
+        """
+        with self._transaction() as conn:
+            rows = conn.execute("SELECT hash, stored_size, last_used FROM blobs ORDER BY last_used").fetchall()
+            total = sum(stored_size for _, stored_size, _ in rows)
+            expired_before = time.time() - self.max_age
+            evicted = []
+            for digest, stored_size, last_used in rows:
+                if last_used >= expired_before and total <= self.max_bytes:
+                    break
+                evicted.append(digest)
+                total -= stored_size
+            conn.executemany("DELETE FROM pages WHERE hash = ?", [(digest,) for digest in evicted])
+            self._delete_blobs(evicted)
+        return len(evicted)
+
+    def _unreferenced(self, hashes):
+        return [
+            digest for digest in hashes
+            if self._conn.execute("SELECT 1 FROM pages WHERE hash = ?", (digest,)).fetchone() is None
+        ]
+
+    def _delete_blobs(self, hashes):
+        """Forget ``hashes`` and delete their files (inside ``_transaction``)."""
+        self._conn.executemany("DELETE FROM blobs WHERE hash = ?", [(digest,) for digest in hashes])
+        for digest in hashes:
+            self._path(digest).unlink(missing_ok=True)
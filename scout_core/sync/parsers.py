@@ -0,0 +1,303 @@
+"""Per-source page parsers.
+
+Each parser takes the raw response body and returns a list of partial
+player records (plain dicts using the player table's column names). Every
+record carries a ``key``: the player's id on that source (FBref's player
+hash, Transfermarkt's and Sofascore's numeric ids, ASA's ``player_id``),
+which combines records of the same player across pages of one source and
+is what the id map (``SyncState.player_ids``) remembers. Two players with
+the same name stay apart. Rows without an id fall back to the normalized
+name, prefixed ``name:``.
+
+A player who moved clubs mid-season has one row per stint; the columns
+listed in ``STINT_TOTALS`` add up over them, the others keep the last
+value. Columns prefixed with ``_`` are intermediate totals that the
+source's ``finalize`` step turns into table columns; it runs on the
+combined frame of all of a source's pages (``combine_tables``).
+"""
+import json
+import re
+
+import pandas as pd
+from lxml import html
+
+from scout_core.search import normalize_text
+
+# Transfermarkt position labels -> dashboard position codes
+TRANSFERMARKT_POSITIONS = {
+    'goalkeeper': 'GK',
+    'centre-back': 'CB',
+    'left-back': 'LB',
+    'right-back': 'RB',
+    'defensive midfield': 'CDM',
+    'central midfield': 'CM',
+    'attacking midfield': 'CAM',
+    'left midfield': 'LW',
+    'right midfield': 'RW',
+    'left winger': 'LW',
+    'right winger': 'RW',
+    'second striker': 'FW',
+    'centre-forward': 'ST',
+}
+
+# FBref only reports broad positions
+FBREF_POSITIONS = {'GK': 'GK', 'DF': 'CB', 'MF': 'CM', 'FW': 'FW'}
+
+# FBref table id -> {data-stat: (column, converter)}
+FBREF_TABLES = {
+    'stats_standard': {
+        'player': ('name', 'text'),
+        'nationality': ('nationality', 'nation'),
+        'position': ('position', 'position'),
+        'team': ('club', 'text'),
+        'age': ('age', 'age'),
+        'birth_year': ('birth_year', 'int'),
+        'games': ('matches', 'int'),
+        'minutes': ('minutes_played', 'int'),
+        'goals': ('goals', 'int'),
+        'assists': ('assists', 'int'),
+    },
+    'stats_shooting': {
+        'player': ('name', 'text'),
+        'shots': ('_shots', 'float'),
+    },
+    'stats_passing': {
+        'player': ('name', 'text'),
+        'passes_pct': ('pass_accuracy', 'float'),
+        'assisted_shots': ('_key_passes', 'float'),
+    },
+    'stats_defense': {
+        'player': ('name', 'text'),
+        'tackles': ('_tackles', 'float'),
+        'interceptions': ('_interceptions', 'float'),
+        'clearances': ('_clearances', 'float'),
+    },
+    'stats_possession': {
+        'player': ('name', 'text'),
+        'take_ons_won': ('_dribbles', 'float'),
+    },
+    'stats_misc': {
+        'player': ('name', 'text'),
+        'aerials_won': ('_aerial_duels', 'float'),
+    },
+}
+
+# Season totals that the dashboard shows per game
+PER_GAME_COLUMNS = {
+    '_shots': 'shots_per_game',
+    '_key_passes': 'key_passes',
+    '_dribbles': 'dribbles',
+    '_aerial_duels': 'aerial_duels',
+    '_tackles': 'tackles',
+    '_interceptions': 'interceptions',
+    '_clearances': 'clearances',
+}
+
+# Columns that add up over a player's stints (rows of one source key).
+# Sofascore has none: its pages are offsets into one season ranking, where a
+# player is a single row that can show up again on the next page if the
+# ranking moves between requests
+STINT_TOTALS = {
+    'fbref': ('matches', 'minutes_played', 'goals', 'assists', *PER_GAME_COLUMNS),
+    'asa': ('minutes_played', 'goals', 'assists'),
+}
+
+_NUMBER = re.compile(r'-?\d+(?:\.\d+)?')
+_FBREF_PLAYER_URL = re.compile(r'/players/([0-9a-f]+)/')
+_TRANSFERMARKT_PLAYER_URL = re.compile(r'/spieler/(\d+)')
+
+# All sources serve UTF-8; without this lxml guesses latin-1 for raw bytes
+_HTML_PARSER = html.HTMLParser(encoding='utf-8')
+
+
+def _key(native_id, name):
+    """Record key: the source's own player id, else the normalized name."""
+    return str(native_id) if native_id else f"name:{normalize_text(name)}"
+
+
+def _to_number(text, kind):
+    text = (text or '').replace(',', '').strip()
+    match = _NUMBER.search(text)
+    if not match:
+        return None
+    return int(float(match.group())) if kind == 'int' else float(match.group())
+
+
+def _convert(text, kind):
+    text = ' '.join((text or '').split())
+    if kind == 'text':
+        return text or None
+    if kind == 'nation':
+        # "us USA" -> "USA"
+        return text.split(' ')[-1] if text else None
+    if kind == 'position':
+        return FBREF_POSITIONS.get(text.split(',')[0]) if text else None
+    if kind == 'age':
+        # "26-123" (years-days)
+        return _to_number(text.split('-')[0], 'int')
+    return _to_number(text, kind)
+
+
+def _find_table(doc, table_id):
+    tables = doc.xpath(f'//table[@id="{table_id}"]')
+    if tables:
+        return tables[0]
+    # FBref ships most stat tables inside HTML comments
+    for comment in doc.xpath('//comment()'):
+        text = comment.text or ''
+        if f'id="{table_id}"' in text:
+            tables = html.fromstring(text).xpath(f'//table[@id="{table_id}"]')
+            if tables:
+                return tables[0]
+    return None
+
+
+def _fbref_player_id(cell):
+    for href in cell.xpath('.//a/@href'):
+        match = _FBREF_PLAYER_URL.search(href)
+        if match:
+            return match.group(1)
+    return None
+
+
+def parse_fbref(body):
+    doc = html.fromstring(body, parser=_HTML_PARSER)
+    records = []
+    for table_id, columns in FBREF_TABLES.items():
+        table = _find_table(doc, table_id)
+        if table is None:
+            continue
+        for row in table.xpath('./tbody/tr[not(contains(@class, "thead"))]'):
+            record = {}
+            player_id = None
+            for cell in row.xpath('./td[@data-stat] | ./th[@data-stat]'):
+                stat = cell.get('data-stat')
+                if stat == 'player':
+                    player_id = cell.get('data-append-csv') or _fbref_player_id(cell)
+                column = columns.get(stat)
+                if column is not None:
+                    value = _convert(cell.text_content(), column[1])
+                    if value is not None:
+                        record[column[0]] = value
+            if record.get('name'):
+                record['key'] = _key(player_id, record['name'])
+                records.append(record)
+    return records
+
+
+def finalize_fbref(frame):
+    matches = pd.to_numeric(frame['matches'], errors='coerce') if 'matches' in frame else None
+    if matches is not None:
+        matches = matches.where(matches != 0)
+    for total, column in PER_GAME_COLUMNS.items():
+        if total in frame:
+            if matches is not None:
+                frame[column] = (pd.to_numeric(frame[total], errors='coerce') / matches).round(1)
+            frame = frame.drop(columns=total)
+    return frame
+
+
+def parse_market_value(text):
+    """'€8.50m' -> 8500000, '€800k' -> 800000, '-' -> None."""
+    text = (text or '').strip().lower().replace(',', '.')
+    match = _NUMBER.search(text)
+    if not match:
+        return None
+    value = float(match.group())
+    suffix = text[match.end():].strip()
+    if suffix.startswith('bn'):
+        value *= 1_000_000_000
+    elif suffix.startswith('m'):
+        value *= 1_000_000
+    elif suffix.startswith(('k', 'th')):
+        value *= 1_000
+    return int(value)
+
+
+def parse_transfermarkt(body):
+    doc = html.fromstring(body, parser=_HTML_PARSER)
+    records = []
+    for row in doc.xpath('//table[contains(@class, "items")]/tbody/tr[td]'):
+        links = row.xpath('.//td[contains(@class, "hauptlink")]/a[text()]')
+        if not links:
+            continue
+        record = {'name': ' '.join(links[0].text.split())}
+        player_id = _TRANSFERMARKT_PLAYER_URL.search(links[0].get('href') or '')
+        position = row.xpath('.//table[contains(@class, "inline-table")]//tr[2]/td/text()')
+        if position:
+            record['position'] = TRANSFERMARKT_POSITIONS.get(position[0].strip().lower())
+        nationality = row.xpath('.//img[contains(@class, "flaggenrahmen")]/@title')
+        if nationality:
+            record['nationality'] = nationality[0]
+        club = row.xpath('.//td[contains(@class, "zentriert")]/a/@title')
+        if club:
+            record['club'] = club[0]
+        for text in row.xpath('./td[contains(@class, "zentriert")]/text()'):
+            if text.strip().isdigit():
+                record['age'] = int(text.strip())
+                break
+        value = row.xpath('./td[contains(@class, "rechts") and contains(@class, "hauptlink")]')
+        if value:
+            record['market_value'] = parse_market_value(value[0].text_content())
+        record = {k: v for k, v in record.items() if v is not None}
+        record['key'] = _key(player_id and player_id.group(1), record['name'])
+        records.append(record)
+    return records
+
+
+def parse_asa(body):
+    """ASA API: ``/players`` (identity) and ``/players/xgoals`` (stats) rows.
+
+    Both endpoints are keyed by ASA's ``player_id``; ``finalize_asa`` drops
+    the players that only have stats once both have been combined.
+    """
+    records = []
+    for row in json.loads(body):
+        record = {'key': str(row['player_id'])}
+        if 'player_name' in row:
+            record['name'] = row['player_name']
+            if row.get('nationality'):
+                record['nationality'] = row['nationality']
+            if row.get('birth_date'):
+                record['birth_year'] = int(str(row['birth_date'])[:4])
+        if 'minutes_played' in row:
+            record['minutes_played'] = int(row['minutes_played'])
+        if 'goals' in row:
+            record['goals'] = int(row['goals'])
+        if 'primary_assists' in row:
+            record['assists'] = int(row['primary_assists'])
+        records.append(record)
+    return records
+
+
+def finalize_asa(frame):
+    # Stats of players missing from /players have no name to resolve by
+    if 'name' not in frame:
+        return frame.iloc[:0]
+    return frame[frame['name'].fillna('') != '']
+
+
+SOFASCORE_FIELDS = {
+    'rating': 'rating',
+    'accuratePassesPercentage': 'pass_accuracy',
+    'appearances': 'matches',
+}
+
+
+def parse_sofascore(body):
+    records = []
+    for row in json.loads(body).get('results', []):
+        player = row.get('player') or {}
+        if not player.get('name'):
+            continue
+        record = {'name': player['name'], 'key': _key(player.get('id'), player['name'])}
+        team = row.get('team') or {}
+        if team.get('name'):
+            record['club'] = team['name']
+        for field_name, column in SOFASCORE_FIELDS.items():
+            if row.get(field_name) is not None:
+                record[column] = row[field_name]
+        if 'rating' in record:
+            record['rating'] = round(float(record['rating']), 1)
+        records.append(record)
+    return records
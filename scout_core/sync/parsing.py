@@ -0,0 +1,65 @@
+"""The parsing stage of a sync: raw page bytes in, Arrow column tables out.
+
+Parsing pages is CPU-bound (lxml tree building, per-cell text
+conversion), so fetching threads hand bodies to this stage instead of
+parsing them under the GIL. ``parse_page`` runs anywhere, including in the
+processes of ``parse_pool()``: it takes the source name, league and raw
+bytes, and returns the page's records as one ``pyarrow.Table`` with a
+column per field (missing values null). Tables pickle as a few flat
+buffers, so sending them back from a worker process costs far less than
+a list of dicts, and the main process folds them into a source frame in
+bulk (``combine_tables``).
+"""
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import get_context
+
+import pyarrow as pa
+
+from scout_core.sync.sources import SOURCES
+
+
+def records_to_table(records):
+    """One column per field of ``records`` (dicts with differing keys), nulls where a record lacks it."""
+    columns = {}
+    for record in records:
+        for column in record:
+            columns.setdefault(column, None)
+    return pa.table({column: pa.array([record.get(column) for record in records]) for column in columns})
+
+
+def table_records(table):
+    """``table`` back as records without their null fields (how ``SyncState`` stores a page)."""
+    return [
+        {column: value for column, value in row.items() if value is not None}
+        for row in table.to_pylist()
+    ]
+
+
+def parse_page(source, league, body):
+    """Parse one page of ``source`` (a name) into a table, tagging every row with ``league``."""
+    records = SOURCES[source].parse(body)
+    for record in records:
+        record['league'] = league
+    return records_to_table(records)
+
+
+def parse_pool(processes):
+    """A process pool for ``submit_parse``.
+
+    Processes are spawned rather than forked: the fetching side runs
+    threads and holds SQLite connections that a forked child must not
+    inherit.
+    """
+    return ProcessPoolExecutor(max_workers=processes, mp_context=get_context('spawn'))
+
+
+def submit_parse(executor, source, league, body):
+    """``parse_page`` as a future: in ``executor``, or right away in this process when it is ``None``."""
+    if executor is not None:
+        return executor.submit(parse_page, source, league, body)
+    future = Future()
+    try:
+        future.set_result(parse_page(source, league, body))
+    except Exception as exc:
+        future.set_exception(exc)
+    return future
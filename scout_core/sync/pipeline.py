@@ -0,0 +1,293 @@
+"""Concurrent multi-source sync: fetch every page, parse, merge into the player table.
+
+The two halves are separate so they can run in different processes:
+``fetch_pages`` fetches and parses pages into per-source column tables,
+and ``merge_fetched`` resolves and merges them. ``sync_players`` runs both
+in one process; the background worker (``scout_core.sync.worker``) fetches
+each source in its own process and merges in the parent. Parsing itself
+is a separate stage (``scout_core.sync.parsing``) that can run in a
+process pool while the fetching threads carry on.
+"""
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+
+import pandas as pd
+from lxml import etree, html
+
+from scout_core.schema import compact_players, expand_players
+from scout_core.sync.http import HttpClient
+from scout_core.sync.merge import combine_sources, combine_tables, merge_players
+from scout_core.sync.parsing import records_to_table, submit_parse, table_records
+from scout_core.sync.resolve import resolve_players
+from scout_core.sync.sources import LEAGUES, SOURCES
+from scout_core.sync.state import content_hash
+from scout_core.teams import team_aggregates, update_team_aggregates
+
+MAX_WORKERS = 8
+
+
+@dataclass
+class SyncResult:
+    players: pd.DataFrame
+    pages: int = 0
+    unchanged: int = 0
+    errors: list = field(default_factory=list)
+    coverage: dict = field(default_factory=dict)
+    changed_ids: list = field(default_factory=list)
+
+
+@dataclass
+class SourceFetch:
+    """Column tables parsed from one source's pages (one per page), and how the fetch went."""
+    source: str
+    tables: list = field(default_factory=list)
+    pages: int = 0
+    unchanged: int = 0
+    errors: list = field(default_factory=list)
+    # Whether any page differs from the copy in the sync state
+    changed: bool = False
+
+
+def _needs_browser(source, fetched):
+    """Whether a plain fetch of a ``source.browser`` page must be redone in a browser."""
+    if not source.browser:
+        return False
+    if fetched.status in (401, 403):  # refused, typically bot protection
+        return True
+    if not fetched.ok or fetched.not_modified or source.rendered_xpath is None:
+        return False
+    try:
+        document = html.fromstring(fetched.body)
+    except etree.ParserError:  # nothing to parse, e.g. an empty 200 from a JavaScript shell
+        return True
+    return not document.xpath(source.rendered_xpath)
+
+
+def _fetch(client, browser, source, url, headers):
+    fetched = client.get(source.name, url, headers)
+    if browser is not None and _needs_browser(source, fetched):
+        fetched = browser.get(source.name, url, wait_for=source.rendered_xpath)
+    return fetched
+
+
+def _unchanged_records(fetched, state, result):
+    """The stored records of a page unchanged since it was last parsed, else ``None``."""
+    if fetched.not_modified:
+        records = state.records(fetched.url)
+        if records is not None:
+            result.unchanged += 1
+            return records
+    if content_hash(fetched.body) == state.known_hash(fetched.url):
+        state.mark_unchanged(fetched.url, fetched.headers)
+        result.unchanged += 1
+        return state.records(fetched.url)
+    return None
+
+
+def _collect_parsed(parsing, fetches, state=None):
+    """Add the tables of finished ``submit_parse`` futures to their ``SourceFetch``es."""
+    for future, (source, url, headers, body) in parsing.items():
+        fetch = fetches[source.name]
+        try:
+            table = future.result()
+        except Exception as exc:
+            fetch.errors.append(f"{source.label}: {url} (parse error: {exc})")
+            continue
+        if state is not None:
+            state.save(url, source.name, headers, content_hash(body), table_records(table))
+        fetch.tables.append(table)
+        fetch.changed = True
+        fetch.pages += 1
+
+
+def fetch_pages(sources=None, leagues=None, base_urls=None, client=None, max_workers=MAX_WORKERS,
+                state=None, browser=None, progress=None, cache=None, parse_executor=None):
+    """Fetch and parse every page of ``sources`` for ``leagues`` concurrently.
+
+    Returns a ``SourceFetch`` per source name. ``progress``, if given, is
+    called as ``progress(source, done, total)`` once per source before the
+    first page and after every page of that source.
+
+    With a ``PageCache`` every fetched body is stored in it (and the cache
+    is evicted down to its limits afterwards). Requests are only made
+    conditional for pages the cache holds, so it always ends up with the
+    body of every page that was fetched.
+
+    Changed pages are parsed as they arrive, in ``parse_executor`` (e.g.
+    ``parse_pool()``) when given, else in this process.
+    """
+    leagues = list(leagues or LEAGUES)
+    selected = [SOURCES[name] for name in (sources or SOURCES)]
+    base_urls = base_urls or {}
+
+    jobs = [
+        (source, league, url)
+        for source in selected
+        for league in leagues
+        for url in source.page_urls(league, base_urls.get(source.name))
+    ]
+    fetches = {source.name: SourceFetch(source.name) for source in selected}
+    totals = {source.name: 0 for source in selected}
+    for source, _, _ in jobs:
+        totals[source.name] += 1
+    done = dict.fromkeys(totals, 0)
+    if progress is not None:
+        for name, total in totals.items():
+            progress(name, 0, total)
+
+    parsing = {}
+    owns_client = client is None
+    if owns_client:
+        client = HttpClient({source.name: source.rate for source in selected}, pool_size=max_workers)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(
+                    _fetch, client, browser, source, url,
+                    state.conditional_headers(url)
+                    if state is not None and (cache is None or cache.has(url)) else None,
+                ): (source, league)
+                for source, league, url in jobs
+            }
+            for future in as_completed(futures):
+                source, league = futures[future]
+                fetch = fetches[source.name]
+                fetched = future.result()
+                done[source.name] += 1
+                if progress is not None:
+                    progress(source.name, done[source.name], totals[source.name])
+                if not fetched.ok:
+                    fetch.errors.append(f"{source.label}: {fetched.url} ({fetched.error})")
+                    continue
+                if cache is not None:
+                    if fetched.not_modified:
+                        cache.touch(fetched.url)
+                    else:
+                        cache.put(source.name, league, fetched.url, fetched.body)
+                records = _unchanged_records(fetched, state, fetch) if state is not None else None
+                if records is not None:
+                    fetch.tables.append(records_to_table(records))
+                    fetch.pages += 1
+                    continue
+                future = submit_parse(parse_executor, source.name, league, fetched.body)
+                parsing[future] = (source, fetched.url, fetched.headers, fetched.body)
+    finally:
+        if owns_client:
+            client.close()
+    _collect_parsed(parsing, fetches, state)
+    if cache is not None:
+        cache.evict()
+    return fetches
+
+
+def replay_pages(cache, sources=None, leagues=None, progress=None, parse_executor=None):
+    """Parse the pages of ``sources`` for ``leagues`` held in ``cache`` (a ``PageCache``), without fetching.
+
+    Returns a ``SourceFetch`` per source name like ``fetch_pages``; every
+    cached page is parsed again (there is no unchanged-page shortcut), so
+    merging the result rebuilds the sources' columns with the current
+    parsers. Pages are parsed in ``parse_executor`` when given.
+    """
+    selected = [SOURCES[name] for name in (sources or SOURCES)]
+    pages = cache.pages([source.name for source in selected], list(leagues) if leagues else None)
+    fetches = {source.name: SourceFetch(source.name) for source in selected}
+    totals = {source.name: 0 for source in selected}
+    for name, _, _ in pages:
+        totals[name] += 1
+    done = dict.fromkeys(totals, 0)
+    if progress is not None:
+        for name, total in totals.items():
+            progress(name, 0, total)
+    parsing = {}
+    for name, league, url in pages:
+        source = SOURCES[name]
+        body = cache.get(url)
+        done[name] += 1
+        if progress is not None:
+            progress(name, done[name], totals[name])
+        if body is None:
+            fetches[name].errors.append(f"{source.label}: {url} (evicted from the page cache)")
+            continue
+        parsing[submit_parse(parse_executor, name, league, body)] = (source, url, None, body)
+    _collect_parsed(parsing, fetches)
+    return fetches
+
+
+def merge_fetched(players_df, fetches, leagues=None, state=None):
+    """Resolve the tables of ``fetches`` (``SourceFetch``es) and merge them into ``players_df``.
+
+    Sources without any usable record leave the existing rows and coverage
+    flags for that source untouched. With a ``SyncState`` its id map is
+    reused and updated. If no page changed the player table is returned as
+    is; otherwise only rows whose values changed are rewritten.
+    """
+    leagues = list(leagues or LEAGUES)
+    result = SyncResult(players_df)
+    for fetch in fetches:
+        result.pages += fetch.pages
+        result.unchanged += fetch.unchanged
+        result.errors.extend(fetch.errors)
+
+    frames = {
+        fetch.source: combine_tables(SOURCES[fetch.source], fetch.tables)
+        for fetch in fetches
+        if fetch.tables
+    }
+    frames = {name: frame for name, frame in frames.items() if len(frame)}
+    result.coverage = {name: len(frame) for name, frame in frames.items()}
+    if frames and any(fetch.changed for fetch in fetches):
+        players = expand_players(players_df)
+        id_maps = {name: state.player_ids(name) for name in frames} if state is not None else None
+        frames, mappings = resolve_players(frames, players, id_maps)
+        players, result.changed_ids = merge_players(players, combine_sources(frames), leagues)
+        if result.changed_ids:
+            result.players = compact_players(players)
+        if state is not None:
+            for name, mapping in mappings.items():
+                state.save_player_ids(name, mapping)
+    return result
+
+
+def sync_players(players_df, leagues=None, sources=None, base_urls=None, client=None,
+                 max_workers=MAX_WORKERS, state=None, browser=None, progress=None, cache=None,
+                 parse_executor=None):
+    """Fetch ``sources`` for ``leagues`` concurrently and merge into ``players_df``.
+
+    ``base_urls`` maps source name -> base URL override (e.g. a local fixture
+    server). Pages that fail to fetch or parse are reported in
+    ``SyncResult.errors``; a source with no usable page leaves the existing
+    rows and coverage flags for that source untouched.
+
+    Source rows are matched to players by ``resolve_players``. With a
+    ``SyncState`` its id map is reused and updated, and requests are
+    conditional, so unchanged pages are not parsed again. If no page
+    changed the player table is returned as is; otherwise only rows whose
+    values changed are rewritten, and their ids are reported in
+    ``SyncResult.changed_ids``.
+
+    With a ``BrowserPool`` as ``browser``, pages of sources marked
+    ``browser`` are fetched with plain requests first and only rendered in
+    a headless browser when that request is refused or returns the page
+    without its data. ``progress``, ``cache`` (a ``PageCache`` keeping
+    the raw pages) and ``parse_executor`` are passed on to ``fetch_pages``.
+    """
+    fetches = fetch_pages(
+        sources, leagues, base_urls, client, max_workers, state, browser, progress, cache, parse_executor
+    )
+    return merge_fetched(players_df, list(fetches.values()), leagues, state)
+
+
+def write_sync(store, previous, result):
+    """Write a ``SyncResult`` that replaced the player table ``previous`` to ``store``.
+
+    Records the history snapshot, updates the team aggregates of the
+    changed players and rewrites the players; does nothing if no player
+    changed. The player table goes last: readers reload when its version
+    changes, and must then find the teams and history that match it.
+    """
+    if not result.changed_ids:
+        return
+    teams = store.load_teams() if store.has('teams') else team_aggregates(previous)
+    store.history.record(result.players, previous=previous)
+    store.write_teams(update_team_aggregates(teams, previous, result.players, result.changed_ids))
+    store.write_players(result.players)
@@ -0,0 +1,232 @@
+"""Entity resolution: map each source's rows to player ids.
+
+Sources spell the same player differently ("Tyler Adams" / "Tyler Shaan
+Adams", accents, suffixes) and disagree on clubs, so rows are not joined
+on names. Instead every source row is resolved to a player id:
+
+1. through the persisted id map (``SyncState``), when this source row was
+   resolved before and its player still looks like the same person;
+2. otherwise against the known players via blocking: candidate pairs must
+   share a blocking key (normalized surname, or first name + birth year)
+   and must not contradict each other's birth year. Pairs are scored in one
+   vectorized pass (trigram Jaccard over fixed-width bit signatures, plus a
+   bonus for an equal nationality) and assigned greedily, best score first,
+   one row per player and source;
+3. rows left over become new players with fresh ids.
+
+Sources are resolved one after another, each seeing the players the
+previous ones created, so a new player reported by several sources gets a
+single id. Cost grows with the number of rows and the size of the blocks,
+not with rows x players.
+"""
+import zlib
+
+import numpy as np
+import pandas as pd
+
+from scout_core.search import normalize_text
+from scout_core.sync.merge import DEFAULT_PRIORITY
+
+MATCH_THRESHOLD = 0.55
+# A remembered mapping is kept unless the names have clearly diverged
+MAPPED_THRESHOLD = 0.3
+NATIONALITY_BONUS = 0.1
+# Ages in the player table are only as fresh as the last sync that set them
+BIRTH_YEAR_TOLERANCE = 1
+SIGNATURE_BITS = 512
+# Blocks with more candidate pairs than this (e.g. a very common first
+# name) are dropped; their rows still meet through their other keys
+MAX_BLOCK_PAIRS = 5_000
+NAME_SUFFIXES = {'jr', 'jr.', 'sr', 'sr.', 'ii', 'iii', 'iv'}
+
+
+def name_tokens(name):
+    tokens = normalize_text(name).replace('-', ' ').split()
+    return [token for token in tokens if token not in NAME_SUFFIXES] or tokens
+
+
+def _normalized(values):
+    """``normalize_text`` of a Series, computed once per distinct value."""
+    values = values.fillna('').astype(str)
+    return values.map({value: normalize_text(value) for value in values.unique()}).to_numpy(dtype=object)
+
+
+def signatures(tokens):
+    """Trigram bit signatures (``SIGNATURE_BITS`` wide) of tokenized names."""
+    size = SIGNATURE_BITS // 8
+    packed = bytearray()
+    for name in tokens:
+        text = f"  {' '.join(name)} "
+        bits = 0
+        for i in range(len(text) - 2):
+            bits |= 1 << (zlib.crc32(text[i:i + 3].encode()) % SIGNATURE_BITS)
+        packed += bits.to_bytes(size, 'little')
+    return np.frombuffer(bytes(packed), dtype='<u8').reshape(len(tokens), SIGNATURE_BITS // 64)
+
+
+def _popcount(words):
+    return np.unpackbits(words.view(np.uint8), axis=1).sum(axis=1)
+
+
+def similarity(left, right):
+    """Jaccard similarity of paired signature rows."""
+    union = _popcount(left | right)
+    return np.divide(_popcount(left & right), union, out=np.zeros(len(union)), where=union > 0)
+
+
+def birth_years(df, year):
+    """``(earliest, latest)`` birth year per row, from ``birth_year`` or ``age``.
+
+    Both bounds are widened by ``BIRTH_YEAR_TOLERANCE``.
+    """
+    low = np.full(len(df), -np.inf)
+    high = np.full(len(df), np.inf)
+    if 'age' in df:
+        age = pd.to_numeric(df['age'], errors='coerce').to_numpy(dtype=float)
+        known = age > 0
+        low[known] = year - age[known] - 1
+        high[known] = year - age[known]
+    if 'birth_year' in df:
+        born = pd.to_numeric(df['birth_year'], errors='coerce').to_numpy(dtype=float)
+        known = ~np.isnan(born)
+        low[known] = born[known]
+        high[known] = born[known]
+    return low - BIRTH_YEAR_TOLERANCE, high + BIRTH_YEAR_TOLERANCE
+
+
+class Entities:
+    """The players rows are resolved against: existing ones plus those created so far."""
+
+    def __init__(self, players_df, year):
+        self.year = year
+        self.ids = players_df['id'].to_numpy(dtype=np.int64)
+        self.tokens = [name_tokens(name) for name in players_df['name'].astype(str)]
+        self.nationality = _normalized(players_df['nationality'])
+        self.low, self.high = birth_years(players_df, year)
+        self.signatures = signatures(self.tokens)
+        self.next_id = int(self.ids.max()) + 1 if len(self.ids) else 1
+        self._positions = {player_id: i for i, player_id in enumerate(self.ids.tolist())}
+        self._keys = None
+
+    def position(self, player_id):
+        return self._positions.get(player_id)
+
+    def blocking_keys(self):
+        """Blocking keys of every entity, built on first use and extended by ``add``."""
+        if self._keys is None:
+            self._keys = blocking_keys(self.tokens, self.low, self.high)
+        return self._keys
+
+    def add(self, tokens, nationality, low, high, row_signatures):
+        """Create new players from resolved-as-new source rows; returns their ids."""
+        ids = np.arange(self.next_id, self.next_id + len(tokens), dtype=np.int64)
+        self.next_id += len(tokens)
+        start = len(self.ids)
+        self.ids = np.concatenate([self.ids, ids])
+        self.tokens.extend(tokens)
+        self.nationality = np.concatenate([self.nationality, nationality])
+        self.low = np.concatenate([self.low, low])
+        self.high = np.concatenate([self.high, high])
+        self.signatures = np.concatenate([self.signatures, row_signatures])
+        self._positions.update({player_id: start + i for i, player_id in enumerate(ids.tolist())})
+        if self._keys is not None:
+            added = blocking_keys(tokens, low, high)
+            added['row'] += start
+            self._keys = pd.concat([self._keys, added], ignore_index=True)
+        return ids
+
+
+def blocking_keys(tokenized, low, high):
+    """``(row, key)`` pairs: the surname, plus first name + year for each possible birth year."""
+    rows, keys = [], []
+    for row, tokens in enumerate(tokenized):
+        if not tokens:
+            continue
+        rows.append(row)
+        keys.append(f"s:{tokens[-1]}")
+        if len(tokens) > 1 and np.isfinite(low[row]) and np.isfinite(high[row]):
+            for year in range(int(low[row]), int(high[row]) + 1):
+                rows.append(row)
+                keys.append(f"f:{tokens[0]}:{year}")
+    return pd.DataFrame({'row': np.array(rows, dtype=np.intp), 'key': keys})
+
+
+def candidate_pairs(source_keys, entity_keys):
+    """Distinct ``(source row, entity position)`` pairs sharing a blocking key."""
+    sizes = source_keys['key'].value_counts().mul(entity_keys['key'].value_counts(), fill_value=0)
+    usable = sizes.index[(sizes > 0) & (sizes <= MAX_BLOCK_PAIRS)]
+    pairs = source_keys[source_keys['key'].isin(usable)].merge(
+        entity_keys[entity_keys['key'].isin(usable)], on='key', suffixes=('', '_entity')
+    )
+    pairs = pairs[['row', 'row_entity']].drop_duplicates()
+    return pairs['row'].to_numpy(), pairs['row_entity'].to_numpy()
+
+
+def resolve_source(frame, source, entities, id_map=None):
+    """Player id for each row of one source's combined ``frame`` (indexed by source key).
+
+    ``id_map`` (source key -> player id) is consulted first; unmatched rows
+    become new players in ``entities``.
+    """
+    tokens = [name_tokens(name) for name in frame['name'].astype(str)]
+    row_signatures = signatures(tokens)
+    low, high = birth_years(frame, entities.year)
+    nationality = _normalized(frame['nationality'] if 'nationality' in frame else pd.Series('', index=frame.index))
+    resolved = np.full(len(frame), -1, dtype=np.int64)
+    taken = set()
+
+    # 1. Remembered mappings
+    if id_map:
+        mapped = [(row, entities.position(id_map.get(key))) for row, key in enumerate(frame.index)]
+        mapped = np.array([pair for pair in mapped if pair[1] is not None], dtype=np.int64).reshape(-1, 2)
+        scores = similarity(row_signatures[mapped[:, 0]], entities.signatures[mapped[:, 1]])
+        for (row, position), score in zip(mapped.tolist(), scores):
+            if score >= MAPPED_THRESHOLD and position not in taken:
+                resolved[row] = entities.ids[position]
+                taken.add(position)
+
+    # 2. Blocked, vectorized matching for the rest
+    pending = np.flatnonzero(resolved < 0)
+    if len(pending) and len(entities.ids):
+        source_keys = blocking_keys([tokens[row] for row in pending], low[pending], high[pending])
+        source_keys['row'] = pending[source_keys['row'].to_numpy()]
+        rows, positions = candidate_pairs(source_keys, entities.blocking_keys())
+        compatible = (low[rows] <= entities.high[positions]) & (entities.low[positions] <= high[rows])
+        rows, positions = rows[compatible], positions[compatible]
+        scores = similarity(row_signatures[rows], entities.signatures[positions])
+        same_nation = (nationality[rows] != '') & (nationality[rows] == entities.nationality[positions])
+        scores = scores + np.where(same_nation, NATIONALITY_BONUS, 0.0)
+        for i in np.argsort(-scores, kind='stable'):
+            if scores[i] < MATCH_THRESHOLD:
+                break
+            row, position = rows[i], positions[i]
+            if resolved[row] >= 0 or position in taken:
+                continue
+            resolved[row] = entities.ids[position]
+            taken.add(position)
+
+    # 3. New players
+    new = np.flatnonzero(resolved < 0)
+    if len(new):
+        resolved[new] = entities.add(
+            [tokens[row] for row in new], nationality[new], low[new], high[new], row_signatures[new]
+        )
+    return pd.Series(resolved, index=frame.index, name=source)
+
+
+def resolve_players(frames, players_df, id_maps=None, year=None):
+    """Resolve every source frame to player ids.
+
+    Returns the frames re-indexed by player id, ready for
+    ``combine_sources``, and per source the mapping (source key -> player
+    id) to persist.
+    """
+    year = year or pd.Timestamp.now().year
+    entities = Entities(players_df, year)
+    resolved_frames, mappings = {}, {}
+    for source in sorted(frames, key=lambda name: DEFAULT_PRIORITY.index(name)):
+        frame = frames[source]
+        mapping = resolve_source(frame, source, entities, (id_maps or {}).get(source))
+        resolved_frames[source] = frame.set_axis(pd.Index(mapping.to_numpy(), name='id'))
+        mappings[source] = mapping
+    return resolved_frames, mappings
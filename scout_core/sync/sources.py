@@ -0,0 +1,109 @@
+"""Sync source definitions: where each source's pages live and how to read them.
+
+Base URLs can be overridden (e.g. to point at a local fixture server); the
+URL paths stay the same, so a directory of recorded pages served with
+``python -m http.server`` is enough to run a sync offline.
+"""
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from scout_core.sync import parsers
+
+# Per-league identifiers on each source
+LEAGUES = {
+    'MLS': {
+        'fbref': (22, 'Major-League-Soccer'),
+        'transfermarkt': ('major-league-soccer', 'MLS1'),
+        'asa': 'mls',
+        'sofascore': (242, 57317),
+    },
+    'USL Championship': {
+        'fbref': (73, 'USL-Championship'),
+        'transfermarkt': ('usl-championship', 'USL'),
+        'asa': 'uslc',
+        'sofascore': (13363, 56818),
+    },
+    'USL League One': {
+        'fbref': (657, 'USL-League-One'),
+        'transfermarkt': ('usl-league-one', 'USC3'),
+        'asa': 'usl1',
+        'sofascore': (18138, 56819),
+    },
+}
+
+FBREF_PAGES = ('stats', 'shooting', 'passing', 'defense', 'possession', 'misc')
+TRANSFERMARKT_PAGES = 4
+SOFASCORE_PAGE_SIZE = 100
+SOFASCORE_PAGES = 6
+
+
+def _fbref_urls(base, league):
+    comp_id, slug = LEAGUES[league]['fbref']
+    return [f"{base}/en/comps/{comp_id}/{page}/{slug}-Stats" for page in FBREF_PAGES]
+
+
+def _transfermarkt_urls(base, league):
+    slug, comp = LEAGUES[league]['transfermarkt']
+    return [
+        f"{base}/{slug}/marktwerte/wettbewerb/{comp}/page/{page}"
+        for page in range(1, TRANSFERMARKT_PAGES + 1)
+    ]
+
+
+def _asa_urls(base, league):
+    code = LEAGUES[league]['asa']
+    return [f"{base}/api/v1/{code}/players", f"{base}/api/v1/{code}/players/xgoals"]
+
+
+def _sofascore_urls(base, league):
+    tournament, season = LEAGUES[league]['sofascore']
+    return [
+        f"{base}/api/v1/unique-tournament/{tournament}/season/{season}/statistics"
+        f"?limit={SOFASCORE_PAGE_SIZE}&offset={page * SOFASCORE_PAGE_SIZE}"
+        f"&order=-rating&accumulation=total"
+        for page in range(SOFASCORE_PAGES)
+    ]
+
+
+@dataclass(frozen=True)
+class Source:
+    name: str
+    label: str
+    base_url: str
+    rate: float
+    urls: Callable
+    parse: Callable
+    finalize: Optional[Callable] = None
+    # Columns summed over a player's rows (stints at several clubs); see parsers
+    totals: tuple = ()
+    # Pages that may need a headless browser: retried in one (when the sync
+    # has a BrowserPool) if a plain request is refused, or if the page comes
+    # back without anything matching ``rendered_xpath`` (rendered by JavaScript)
+    browser: bool = False
+    rendered_xpath: Optional[str] = None
+
+    def page_urls(self, league, base_url=None):
+        return self.urls((base_url or self.base_url).rstrip('/'), league)
+
+
+SOURCES = {
+    'fbref': Source(
+        'fbref', 'FBref', 'https://fbref.com', 0.3,
+        _fbref_urls, parsers.parse_fbref, parsers.finalize_fbref,
+        totals=parsers.STINT_TOTALS['fbref'],
+    ),
+    'transfermarkt': Source(
+        'transfermarkt', 'Transfermarkt', 'https://www.transfermarkt.com', 0.5,
+        _transfermarkt_urls, parsers.parse_transfermarkt,
+        browser=True, rendered_xpath='//table[contains(@class, "items")]',
+    ),
+    'asa': Source(
+        'asa', 'ASA', 'https://app.americansocceranalysis.com', 2.0,
+        _asa_urls, parsers.parse_asa, parsers.finalize_asa,
+        totals=parsers.STINT_TOTALS['asa'],
+    ),
+    'sofascore': Source(
+        'sofascore', 'Sofascore', 'https://api.sofascore.com', 1.0,
+        _sofascore_urls, parsers.parse_sofascore, browser=True,
+    ),
+}
@@ -0,0 +1,122 @@
+"""Per-URL change tracking for incremental syncs.
+
+For every fetched page we keep the validators the server sent (``ETag``,
+``Last-Modified``), a hash of the body and the records parsed from it. The
+next sync sends conditional requests; a ``304`` or an identical body reuses
+the stored records instead of parsing the page again.
+
+The state also keeps the entity-resolution id map: which player id each
+source's row was resolved to, so re-syncs resolve known rows by lookup.
+"""
+import hashlib
+import json
+import sqlite3
+import time
+
+from scout_core.config import data_path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    content_hash TEXT NOT NULL,
+    records TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    changed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS player_ids (
+    source TEXT NOT NULL,
+    source_key TEXT NOT NULL,
+    player_id INTEGER NOT NULL,
+    PRIMARY KEY (source, source_key)
+);
+"""
+
+# Bumped when parsed records change shape: the stored records and id map of
+# an older version are dropped, so the next sync parses and resolves afresh
+# (2: records keyed by the sources' own player ids instead of names)
+RECORDS_VERSION = 2
+
+
+def content_hash(body):
+    return hashlib.sha256(body).hexdigest()
+
+
+class SyncState:
+    def __init__(self, path=None):
+        self.path = path or data_path('sync_state.sqlite')
+        # The background worker's per-source processes share this file
+        self._conn = sqlite3.connect(self.path, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] < RECORDS_VERSION:
+            with self._conn:
+                self._conn.execute("DELETE FROM pages")
+                self._conn.execute("DELETE FROM player_ids")
+            self._conn.execute(f"PRAGMA user_version = {RECORDS_VERSION}")
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _row(self, url):
+        return self._conn.execute(
+            "SELECT etag, last_modified, content_hash, records FROM pages WHERE url = ?", (url,)
+        ).fetchone()
+
+    def conditional_headers(self, url):
+        row = self._row(url)
+        headers = {}
+        if row is not None:
+            if row[0]:
+                headers['If-None-Match'] = row[0]
+            if row[1]:
+                headers['If-Modified-Since'] = row[1]
+        return headers
+
+    def known_hash(self, url):
+        row = self._row(url)
+        return row[2] if row is not None else None
+
+    def records(self, url):
+        row = self._row(url)
+        return json.loads(row[3]) if row is not None else None
+
+    def mark_unchanged(self, url, headers):
+        """Refresh validators and fetch time for a page whose content is unchanged."""
+        with self._conn:
+            self._conn.execute(
+                "UPDATE pages SET etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified),"
+                " fetched_at = ? WHERE url = ?",
+                (headers.get('ETag'), headers.get('Last-Modified'), time.time(), url),
+            )
+
+    def save(self, url, source, headers, digest, records):
+        now = time.time()
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, source, headers.get('ETag'), headers.get('Last-Modified'),
+                 digest, json.dumps(records), now, now),
+            )
+
+    def player_ids(self, source):
+        """The id map of ``source``: source key -> player id."""
+        return dict(self._conn.execute(
+            "SELECT source_key, player_id FROM player_ids WHERE source = ?", (source,)
+        ))
+
+    def save_player_ids(self, source, mapping):
+        """Record resolved ``mapping`` (source key -> player id) for ``source``."""
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO player_ids VALUES (?, ?, ?)",
+                [(source, str(key), int(player_id)) for key, player_id in mapping.items()],
+            )
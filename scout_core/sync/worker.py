@@ -0,0 +1,175 @@
+"""Background sync worker: runs the jobs of the sync queue (``scout_core.jobs``).
+
+    python -m scout_core.sync.worker                     # run until stopped
+    python -m scout_core.sync.worker --idle-exit 60      # as started by the dashboard
+    python -m scout_core.sync.worker --processes 4 --base-url fbref=http://127.0.0.1:8000/fbref
+
+Each job fetches and parses every source in its own process of a process
+pool (page parsing is CPU-bound, and one slow source doesn't hold up the
+others); the worker then resolves and merges the records and writes the
+store. Sources report page progress to the queue as they go, so the
+dashboard can show it, and keep the raw pages in the page cache
+(``scout_core.sync.pagecache``) for offline replays.
+"""
+import argparse
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import get_context
+
+from scout_core.dataset import open_store
+from scout_core.jobs import JobQueue
+from scout_core.sync.pagecache import PageCache
+from scout_core.sync.pipeline import MAX_WORKERS, SourceFetch, fetch_pages, merge_fetched, write_sync
+from scout_core.sync.sources import SOURCES
+from scout_core.sync.state import SyncState
+
+HEARTBEAT_SECONDS = 5
+POLL_SECONDS = 1.0
+# Progress writes per source are throttled to one per interval (plus the last page)
+PROGRESS_INTERVAL = 0.5
+NO_DATA_MESSAGE = "no source returned any data"
+
+
+class _ProgressReporter:
+    def __init__(self, queue, job_id):
+        self.queue = queue
+        self.job_id = job_id
+        self._reported = {}
+
+    def __call__(self, source, done, total):
+        now = time.monotonic()
+        if done in (0, total) or now - self._reported.get(source, 0) >= PROGRESS_INTERVAL:
+            self._reported[source] = now
+            self.queue.report(self.job_id, source, done, total)
+
+
+def fetch_source(source, leagues, base_url, max_workers, state_path, queue_path, job_id, browsers=0,
+                 cache_dir=None):
+    """Fetch one source for a job; runs in a pool process with its own connections."""
+    queue = JobQueue(queue_path)
+    cache = PageCache(cache_dir)
+    browser = None
+    if browsers > 0 and SOURCES[source].browser:
+        from scout_core.sync.browser import BrowserPool  # selenium is only needed here
+
+        browser = BrowserPool(max_sessions=browsers, rates={source: SOURCES[source].rate})
+    try:
+        with SyncState(state_path) as state:
+            return fetch_pages(
+                [source], leagues, {source: base_url} if base_url else None,
+                max_workers=max_workers, state=state, browser=browser,
+                progress=_ProgressReporter(queue, job_id), cache=cache,
+            )[source]
+    finally:
+        cache.close()
+        if browser is not None:
+            browser.close()
+        queue.close()
+
+
+def run_job(job, queue, store, pool, state_path, base_urls=None, max_workers=MAX_WORKERS, browsers=0,
+            cache_dir=None):
+    """Run one claimed job: fetch each source in ``pool``, then merge and write ``store``.
+
+    The job fails, with the page errors kept, when no source returned any
+    record.
+    """
+    leagues = job.leagues or None
+    previous = store.load_players()
+    futures = {
+        pool.submit(
+            fetch_source, name, leagues, (base_urls or {}).get(name), max_workers,
+            state_path, queue.path, job.id, browsers, cache_dir,
+        ): name
+        for name in SOURCES
+    }
+    pending = set(futures)
+    while pending:
+        _, pending = wait(pending, timeout=HEARTBEAT_SECONDS, return_when=FIRST_COMPLETED)
+        queue.heartbeat(os.getpid(), job.id)
+
+    fetches = []
+    for future, name in futures.items():
+        try:
+            fetches.append(future.result())
+        except Exception as exc:
+            fetches.append(SourceFetch(name, errors=[f"{SOURCES[name].label}: {exc}"]))
+    with SyncState(state_path) as state:
+        result = merge_fetched(previous, fetches, leagues, state)
+    if not result.coverage:
+        # No source returned a usable record: nothing to write, and not a sync
+        queue.fail(job.id, NO_DATA_MESSAGE, result.errors)
+        return result
+    write_sync(store, previous, result)
+    queue.finish(job.id, result)
+    return result
+
+
+def run_worker(queue, store, processes=None, state_path=None, base_urls=None, max_workers=MAX_WORKERS,
+               browsers=0, cache_dir=None, idle_exit=None, poll=POLL_SECONDS):
+    """Claim and run jobs until stopped, or until idle for ``idle_exit`` seconds."""
+    pid = os.getpid()
+    # Spawned, not forked: pool processes must not inherit this process's SQLite connections
+    with ProcessPoolExecutor(max_workers=processes or len(SOURCES), mp_context=get_context('spawn')) as pool:
+        idle_since = time.monotonic()
+        while True:
+            queue.heartbeat(pid)
+            job = queue.claim()
+            if job is None:
+                if idle_exit is not None and time.monotonic() - idle_since >= idle_exit and queue.retire(pid):
+                    return
+                time.sleep(poll)
+                continue
+            print(f"Running sync job {job.id} (leagues: {', '.join(job.leagues) or 'all'})", flush=True)
+            try:
+                result = run_job(job, queue, store, pool, state_path, base_urls, max_workers, browsers, cache_dir)
+            except Exception as exc:
+                queue.fail(job.id, str(exc))
+                print(f"Sync job {job.id} failed: {exc}", flush=True)
+            else:
+                if result.coverage:
+                    print(f"Sync job {job.id} done: {result.pages} pages, "
+                          f"{len(result.changed_ids)} players changed", flush=True)
+                else:
+                    print(f"Sync job {job.id} failed: {NO_DATA_MESSAGE}", flush=True)
+            idle_since = time.monotonic()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run queued sync jobs in the background")
+    parser.add_argument('--processes', type=int, help="pool processes (default: one per source)")
+    parser.add_argument('--workers', type=int, default=MAX_WORKERS, help="fetch threads per source process")
+    parser.add_argument('--store', metavar='DIR', help="store to sync (default: the data directory's)")
+    parser.add_argument('--state', metavar='PATH', help="SyncState file (default: the data directory's)")
+    parser.add_argument('--queue', metavar='PATH', help="job queue file (default: the data directory's)")
+    parser.add_argument('--cache', metavar='DIR', help="raw page cache (default: the data directory's)")
+    parser.add_argument('--base-url', action='append', default=[], metavar='SOURCE=URL',
+                        help="override a source's base URL, e.g. for a fixture server")
+    parser.add_argument('--browsers', type=int, default=0, metavar='N',
+                        help="render pages that need JavaScript in up to N headless Chrome sessions per source")
+    parser.add_argument('--idle-exit', type=float, metavar='SECONDS',
+                        help="exit after this long without a job")
+    args = parser.parse_args(argv)
+
+    queue = JobQueue(args.queue)
+    try:
+        run_worker(
+            queue, open_store(args.store),
+            processes=args.processes,
+            state_path=args.state,
+            base_urls=dict(item.split('=', 1) for item in args.base_url),
+            max_workers=args.workers,
+            browsers=args.browsers,
+            cache_dir=args.cache,
+            idle_exit=args.idle_exit,
+        )
+    except KeyboardInterrupt:
+        queue.retire(os.getpid())
+    finally:
+        queue.close()
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
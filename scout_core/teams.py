@@ -0,0 +1,59 @@
+"""Team aggregates derived from the player table.
+
+Every team row is computed from its players in one grouped pass, keyed on
+(league, club) so a club that changed league between seasons stays two
+teams. After a sync only the teams that gained, lost or changed a player
+are recomputed and spliced back into the existing table. Stats a player's
+sources didn't report are left out of the averages, medians and sums.
+"""
+import pandas as pd
+
+from scout_core.schema import missing_as_nan
+
+TEAM_COLUMNS = ('name', 'league', 'players', 'avg_age', 'market_value', 'median_value', 'avg_rating', 'goals')
+
+
+def team_aggregates(players_df):
+    """One row per (league, club) of ``players_df``."""
+    teams = missing_as_nan(players_df).groupby(['league', 'club'], observed=True, sort=False).agg(
+        players=('id', 'size'),
+        avg_age=('age', 'mean'),
+        market_value=('market_value', 'sum'),
+        median_value=('market_value', 'median'),
+        avg_rating=('rating', 'mean'),
+        goals=('goals', 'sum'),
+    )
+    teams = teams.reset_index().rename(columns={'club': 'name'})
+    teams = teams.astype({
+        'name': 'object', 'league': 'object', 'players': 'int64',
+        'avg_age': 'float64', 'market_value': 'int64', 'median_value': 'float64',
+        'avg_rating': 'float64', 'goals': 'int64',
+    })
+    return _sorted(teams[list(TEAM_COLUMNS)])
+
+
+def _sorted(teams):
+    return teams.sort_values(['league', 'name'], ignore_index=True)
+
+
+def _team_keys(players_df):
+    return pd.MultiIndex.from_arrays(
+        [players_df['league'].astype(str), players_df['club'].astype(str)]
+    )
+
+
+def update_team_aggregates(teams_df, before, after, changed_ids):
+    """Recompute the teams touched by ``changed_ids`` between two player tables.
+
+    A changed player affects the team it belonged to in ``before`` and the
+    one it belongs to in ``after`` (a transfer touches both); every other
+    row of ``teams_df`` is kept as is.
+    """
+    if not len(changed_ids):
+        return teams_df
+    affected = _team_keys(before[before['id'].isin(changed_ids)]).union(
+        _team_keys(after[after['id'].isin(changed_ids)])
+    )
+    fresh = team_aggregates(after[_team_keys(after).isin(affected)])
+    kept = teams_df[~pd.MultiIndex.from_arrays([teams_df['league'], teams_df['name']]).isin(affected)]
+    return _sorted(pd.concat([kept, fresh], ignore_index=True))
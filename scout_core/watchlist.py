@@ -0,0 +1,139 @@
+"""Persistent watchlists shared across sessions (SQLite).
+
+``WatchlistStore`` is the process-wide backend; ``Watchlist`` is one
+scout's view of it, kept in the Streamlit session. Membership checks hit an
+in-memory set, edits are buffered and written in one transaction by
+``flush()``, and ``refresh()`` only reloads when another session changed the
+same watchlist (tracked by a per-user revision number).
+"""
+import sqlite3
+import threading
+import time
+
+from scout_core.config import data_path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS watchlist (
+    user TEXT NOT NULL,
+    player_id INTEGER NOT NULL,
+    added_at REAL NOT NULL,
+    PRIMARY KEY (user, player_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS watchlist_revisions (
+    user TEXT PRIMARY KEY,
+    revision INTEGER NOT NULL
+);
+"""
+
+
+class WatchlistStore:
+    def __init__(self, path=None):
+        self.path = path or data_path('watchlist.sqlite')
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def revision(self, user):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT revision FROM watchlist_revisions WHERE user = ?", (user,)
+            ).fetchone()
+        return row[0] if row else 0
+
+    def load(self, user):
+        """Player ids on ``user``'s watchlist (oldest first) and its revision."""
+        with self._lock, self._conn:
+            ids = [row[0] for row in self._conn.execute(
+                "SELECT player_id FROM watchlist WHERE user = ? ORDER BY added_at", (user,)
+            )]
+            row = self._conn.execute(
+                "SELECT revision FROM watchlist_revisions WHERE user = ?", (user,)
+            ).fetchone()
+        return ids, row[0] if row else 0
+
+    def apply(self, user, added=(), removed=()):
+        """Write a batch of additions and removals; returns the new revision."""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO watchlist VALUES (?, ?, ?)",
+                [(user, player_id, now) for player_id in added],
+            )
+            self._conn.executemany(
+                "DELETE FROM watchlist WHERE user = ? AND player_id = ?",
+                [(user, player_id) for player_id in removed],
+            )
+            self._conn.execute(
+                "INSERT INTO watchlist_revisions VALUES (?, 1)"
+                " ON CONFLICT(user) DO UPDATE SET revision = revision + 1",
+                (user,),
+            )
+            return self._conn.execute(
+                "SELECT revision FROM watchlist_revisions WHERE user = ?", (user,)
+            ).fetchone()[0]
+
+
+class Watchlist:
+    def __init__(self, store, user):
+        self.store = store
+        self.user = user
+        self._ids = {}
+        self._added = set()
+        self._removed = set()
+        self._revision = None
+        self.refresh()
+
+    def refresh(self):
+        """Reload if the stored watchlist changed since we last read it."""
+        if self.store.revision(self.user) == self._revision:
+            return
+        ids, self._revision = self.store.load(self.user)
+        self._ids = dict.fromkeys(ids)
+        for player_id in self._added:
+            self._ids[player_id] = None
+        for player_id in self._removed:
+            self._ids.pop(player_id, None)
+
+    def __contains__(self, player_id):
+        return int(player_id) in self._ids
+
+    def __iter__(self):
+        return iter(list(self._ids))
+
+    def __len__(self):
+        return len(self._ids)
+
+    def add(self, player_id):
+        player_id = int(player_id)
+        self._ids[player_id] = None
+        self._removed.discard(player_id)
+        self._added.add(player_id)
+
+    def remove(self, player_id):
+        player_id = int(player_id)
+        self._ids.pop(player_id, None)
+        self._added.discard(player_id)
+        self._removed.add(player_id)
+
+    def toggle(self, player_id):
+        if player_id in self:
+            self.remove(player_id)
+        else:
+            self.add(player_id)
+
+    def flush(self):
+        """Persist buffered edits in a single transaction."""
+        if not (self._added or self._removed):
+            return
+        revision = self.store.apply(self.user, self._added, self._removed)
+        # If another session wrote in between, reload on the next refresh
+        expected = (self._revision or 0) + 1
+        self._revision = revision if revision == expected else None
+        self._added.clear()
+        self._removed.clear()
@@ -0,0 +1,11 @@
+from pathlib import Path
+
+import pytest
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+
+@pytest.fixture
+def fixture_page():
+    """Raw bytes of a recorded page under ``tests/fixtures`` (``'fbref/stats.html'``)."""
+    return lambda name: (FIXTURES / name).read_bytes()
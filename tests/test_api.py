@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from scout_core.api import create_app
+from scout_core.api.app import encode_cursor
+from scout_core.dataset import open_store
+from scout_core.watchlist import WatchlistStore
+
+
+@pytest.fixture
+def app(tmp_path):
+    """Builds the API app over one store and watchlist file (an app serves a single server)."""
+    store = open_store(tmp_path / 'store')
+    watchlists = WatchlistStore(tmp_path / 'watchlist.sqlite')
+    return lambda: create_app(store, watchlists)
+
+
+def call(app, method, path, **kwargs):
+    """``(status, json body)`` of one request to a fresh ``app()``."""
+    async def request():
+        async with TestClient(TestServer(app())) as client:
+            response = await client.request(method, path, **kwargs)
+            return response.status, await response.json()
+    return asyncio.run(request())
+
+
+def test_players_page_through_cursor(app):
+    status, first = call(app, 'GET', '/players', params={'limit': 5})
+    assert status == 200
+    status, second = call(app, 'GET', '/players', params={'limit': 5, 'cursor': first['next_cursor']})
+    assert status == 200
+    assert second['offset'] == 5
+    seen = [p['id'] for p in first['players'] + second['players']]
+    assert len(set(seen)) == 10
+
+
+def test_negative_cursor_offset_is_rejected(app):
+    _, first = call(app, 'GET', '/players', params={'limit': 5})
+    cursor = encode_cursor(first['version'], -3)
+
+    status, body = call(app, 'GET', '/players', params={'cursor': cursor})
+
+    assert status == 400
+    assert body == {'error': "invalid cursor"}
+
+
+@pytest.mark.parametrize('method, path', [
+    ('GET', '/players/99999999999'),
+    ('GET', '/players/99999999999/similar'),
+    ('PUT', '/watchlists/ann/99999999999'),
+    ('DELETE', '/watchlists/ann/99999999999999999999999'),
+])
+def test_ids_beyond_the_id_range_are_not_found(app, method, path):
+    status, _ = call(app, method, path)
+
+    assert status == 404
+
+
+def test_watchlist_edits(app):
+    status, body = call(app, 'PUT', '/watchlists/ann/3')
+    assert (status, body) == (200, {'user': 'ann', 'revision': 1})
+    status, body = call(app, 'GET', '/watchlists/ann')
+    assert [p['id'] for p in body['players']] == [3]
+    status, _ = call(app, 'PUT', '/watchlists/ann/999999')
+    assert status == 404
@@ -0,0 +1,110 @@
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from scout_core.sync.browser import BrowserPool
+from scout_core.sync.http import FetchResult
+from scout_core.sync.pipeline import _needs_browser
+from scout_core.sync.sources import SOURCES
+
+RENDERED = '<html><body><table class="items"><tr><td>Diego Rossi</td></tr></table></body></html>'
+
+
+class FakeDriver:
+    """Stands in for a Chrome session: ``fail`` maps URLs to the exception loading them raises."""
+
+    created = []
+
+    def __init__(self, fail=None):
+        self.fail = fail or {}
+        self.loaded = []
+        self.quit_calls = 0
+        FakeDriver.created.append(self)
+
+    def get(self, url):
+        if url in self.fail:
+            raise self.fail[url]
+        self.loaded.append(url)
+
+    def find_elements(self, by, xpath):
+        return [object()]
+
+    def execute_script(self, script):
+        return RENDERED
+
+    def quit(self):
+        self.quit_calls += 1
+
+
+def pool(**kwargs):
+    FakeDriver.created = []
+    fail = kwargs.pop('fail', None)
+    return BrowserPool(driver_factory=lambda: FakeDriver(fail), **kwargs)
+
+
+def test_sessions_are_reused():
+    browsers = pool(max_sessions=2)
+
+    first = browsers.get('transfermarkt', 'http://tm/1')
+    second = browsers.get('transfermarkt', 'http://tm/2', wait_for='//table')
+
+    assert (first.status, first.body) == (200, RENDERED.encode())
+    assert second.ok
+    assert browsers.started == 1
+    assert FakeDriver.created[0].loaded == ['http://tm/1', 'http://tm/2']
+
+
+def test_broken_sessions_are_recycled():
+    browsers = pool(fail={'http://tm/slow': TimeoutException(), 'http://tm/crash': WebDriverException('gone')})
+
+    slow = browsers.get('transfermarkt', 'http://tm/slow')
+    crash = browsers.get('transfermarkt', 'http://tm/crash')
+    fine = browsers.get('transfermarkt', 'http://tm/1')
+
+    assert slow.error == "browser page load timed out"
+    assert crash.error == "browser error: gone"
+    assert fine.ok
+    assert (browsers.started, browsers.recycled) == (3, 2)
+    assert [driver.quit_calls for driver in FakeDriver.created] == [1, 1, 0]
+
+
+def test_sessions_are_recycled_after_max_pages():
+    browsers = pool(max_pages=2)
+
+    for page in range(5):
+        assert browsers.get('transfermarkt', f'http://tm/{page}').ok
+
+    assert (browsers.started, browsers.recycled) == (3, 2)
+
+
+def test_start_failures_become_fetch_errors():
+    def broken_factory():
+        raise RuntimeError("no chrome")
+    browsers = BrowserPool(driver_factory=broken_factory)
+
+    result = browsers.get('transfermarkt', 'http://tm/1')
+
+    assert result.error == "browser failed to start: no chrome"
+
+
+def test_close_quits_idle_sessions():
+    browsers = pool(max_sessions=2)
+    browsers.get('transfermarkt', 'http://tm/1')
+
+    browsers.close()
+
+    assert [driver.quit_calls for driver in FakeDriver.created] == [1]
+    # A session checked in after close() is quit instead of kept
+    browsers.get('transfermarkt', 'http://tm/2')
+    assert [driver.quit_calls for driver in FakeDriver.created] == [1, 1]
+
+
+def test_empty_or_unrendered_pages_need_the_browser():
+    transfermarkt = SOURCES['transfermarkt']
+
+    def fetched(status, body):
+        return FetchResult('transfermarkt', 'http://tm/1', status, body)
+
+    assert _needs_browser(transfermarkt, fetched(200, b''))
+    assert _needs_browser(transfermarkt, fetched(200, b'<html><body><div id="app"></div></body></html>'))
+    assert _needs_browser(transfermarkt, fetched(403, b''))
+    assert not _needs_browser(transfermarkt, fetched(200, RENDERED.encode()))
+    assert not _needs_browser(transfermarkt, fetched(404, b''))
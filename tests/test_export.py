@@ -0,0 +1,77 @@
+import pandas as pd
+import pytest
+
+from scout_core.export import EXPORT_FORMATS, ExportCache, export_chunks, write_export
+from scout_core.sample_data import SAMPLE_PLAYERS
+from scout_core.schema import MISSING, compact_players
+
+
+@pytest.fixture
+def players():
+    players = compact_players(pd.DataFrame(SAMPLE_PLAYERS))
+    players.loc[players['id'] == 12, 'market_value'] = MISSING
+    return players
+
+
+def read_export(path, fmt):
+    extension, _ = EXPORT_FORMATS[fmt]
+    if extension == 'csv':
+        return pd.read_csv(path)
+    if extension == 'jsonl':
+        return pd.read_json(path, lines=True)
+    return pd.read_parquet(path)
+
+
+@pytest.mark.parametrize('fmt', list(EXPORT_FORMATS))
+def test_round_trip_across_chunks(players, fmt, tmp_path):
+    path = tmp_path / 'players'
+    rows = [11, 0, 5, 3, 8, 1, 2]
+
+    write_export(export_chunks(players, rows, chunk_rows=3), fmt, path)
+
+    exported = read_export(path, fmt)
+    expected = players.iloc[rows].reset_index(drop=True)
+    assert exported['name'].tolist() == expected['name'].tolist()
+    assert exported['club'].tolist() == expected['club'].tolist()
+    assert exported['goals'].tolist() == expected['goals'].tolist()
+    assert exported['rating'].tolist() == pytest.approx(expected['rating'].tolist())
+    assert exported['fbref'].tolist() == [bool(s & 1) for s in expected['sources']]
+    # Missing stats are exported empty, not as the stored marker
+    assert pd.isna(exported.loc[0, 'market_value'])
+    assert exported['market_value'][1:].tolist() == expected['market_value'][1:].tolist()
+
+
+@pytest.mark.parametrize('fmt', list(EXPORT_FORMATS))
+def test_empty_selection(players, fmt, tmp_path):
+    path = tmp_path / 'players'
+
+    write_export(export_chunks(players, []), fmt, path)
+
+    if fmt == 'JSON Lines':
+        assert path.read_text() == ''
+    else:
+        exported = read_export(path, fmt)
+        assert len(exported) == 0 and 'name' in exported
+
+
+def test_cache_reuses_files_per_key(players, tmp_path):
+    cache = ExportCache(tmp_path, max_files=2)
+    calls = []
+
+    def chunks():
+        calls.append(1)
+        return export_chunks(players)
+
+    first = cache.get(('players', 1, None), 'CSV', chunks)
+    assert cache.get(('players', 1, None), 'CSV', chunks) == first
+    assert len(calls) == 1
+
+    # A new data version (or format) is a different file
+    second = cache.get(('players', 2, None), 'CSV', chunks)
+    assert second != first and len(calls) == 2
+    cache.get(('players', 2, None), 'Parquet', chunks)
+    assert len(calls) == 3
+    # Only the most recently used files are kept
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(
+        [second.name, cache.path(('players', 2, None), 'Parquet').name]
+    )
@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from scout_core.history import HISTORY_COLUMNS, KEYFRAME_INTERVAL, SnapshotStore
+from scout_core.sample_data import SAMPLE_PLAYERS
+from scout_core.schema import compact_players
+
+START = pd.Timestamp('2026-01-01')
+
+
+def stats(players):
+    return players.set_index('id')[list(HISTORY_COLUMNS)].astype(np.float64)
+
+
+def synced_tables(count):
+    """``count`` player tables, each one sync after the other."""
+    players = compact_players(pd.DataFrame(SAMPLE_PLAYERS))
+    tables = [players]
+    for sync in range(1, count):
+        players = players.copy()
+        changed = players['id'] == sync % len(players) + 1
+        players.loc[changed, 'goals'] += 1
+        players.loc[changed, 'rating'] = np.float32(6 + sync / 10)
+        if sync == 25:
+            newcomer = players[players['id'] == 4].assign(id=13, name='Owen Wolff')
+            players = pd.concat([players, newcomer], ignore_index=True)
+        tables.append(players)
+    return tables
+
+
+@pytest.fixture
+def recorded(tmp_path):
+    history = SnapshotStore(tmp_path)
+    tables = synced_tables(2 * KEYFRAME_INTERVAL + 5)
+    previous = None
+    for day, players in enumerate(tables):
+        history.record(players, previous, timestamp=START + pd.Timedelta(days=day))
+        previous = players
+    return history, tables
+
+
+def test_keyframes_every_interval(recorded):
+    history, tables = recorded
+
+    kinds = [kind for _, kind, _ in history.snapshots()]
+
+    assert len(kinds) == len(tables)
+    assert [i for i, kind in enumerate(kinds) if kind == 'key'] == [0, KEYFRAME_INTERVAL, 2 * KEYFRAME_INTERVAL]
+
+
+def test_as_of_rebuilds_every_snapshot(recorded):
+    history, tables = recorded
+
+    for day, players in enumerate(tables):
+        rebuilt = history.as_of(START + pd.Timedelta(days=day, hours=12))
+        assert_frame_equal(rebuilt.sort_index(), stats(players).sort_index(), check_names=False,
+                           check_index_type=False)
+
+    assert history.as_of(START - pd.Timedelta(days=1)).empty
+
+
+def test_player_history_follows_the_changes(recorded):
+    history, tables = recorded
+
+    trend = history.player_history(3)
+
+    assert len(trend) == len(tables)
+    assert trend['rating'].tolist() == pytest.approx([stats(players).loc[3, 'rating'] for players in tables])
+    # A player first seen in a delta starts there
+    assert len(history.player_history(13)) == len(tables) - 25
+
+
+def test_unchanged_table_records_nothing(tmp_path):
+    history = SnapshotStore(tmp_path)
+    players = synced_tables(1)[0]
+    history.record(players)
+
+    assert history.record(players, players) is None
+    assert len(history.snapshots()) == 1
@@ -0,0 +1,95 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from scout_core import jobs
+from scout_core.dataset import open_store
+from scout_core.jobs import JobQueue
+from scout_core.sync import worker
+from scout_core.sync.pipeline import SourceFetch, SyncResult
+from scout_core.sync.sources import SOURCES
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = JobQueue(tmp_path / 'jobs.sqlite')
+    yield queue
+    queue.close()
+
+
+def test_submissions_are_deduplicated(queue):
+    everything = queue.submit()
+    mls = queue.submit(['MLS'])
+
+    assert mls.id == everything.id  # a queued sync of all leagues covers it
+    assert queue.submit([]).id == everything.id
+    assert queue.active().id == everything.id
+
+
+def test_jobs_run_one_at_a_time(queue):
+    first = queue.submit(['MLS'])
+    second = queue.submit(['USL Championship'])
+
+    claimed = queue.claim()
+    assert (claimed.id, claimed.status, claimed.leagues) == (first.id, 'running', ['MLS'])
+    assert queue.claim() is None
+
+    queue.report(first.id, 'fbref', 3, 6)
+    queue.report(first.id, 'asa', 2, 2)
+    assert queue.active().progress == (5, 8)
+
+    queue.finish(first.id, SyncResult(None, pages=8, unchanged=2, coverage={'asa': 4}, changed_ids=[1, 2]))
+    done = queue.get(first.id)
+    assert (done.status, done.pages, done.unchanged, done.changed, done.coverage) == ('done', 8, 2, 2, {'asa': 4})
+    assert queue.last_finished().id == first.id
+    assert queue.claim().id == second.id
+
+
+def test_failed_jobs_keep_their_message(queue):
+    job = queue.submit()
+    queue.claim()
+
+    queue.fail(job.id, "store is read-only")
+
+    failed = queue.get(job.id)
+    assert failed.finished and failed.message == "store is read-only"
+
+
+def test_stale_running_jobs_are_requeued(queue, monkeypatch):
+    job = queue.submit()
+    queue.claim()
+    monkeypatch.setattr(jobs, 'STALE_SECONDS', -1)
+
+    assert queue.claim().id == job.id
+
+
+def test_workers_retire_only_when_idle(queue):
+    queue.heartbeat(os.getpid())
+    assert queue.worker_alive()
+
+    job = queue.submit()
+    assert not queue.retire(os.getpid())
+    queue.claim()
+    queue.finish(job.id, SyncResult(None))
+
+    assert queue.retire(os.getpid())
+    assert not queue.worker_alive()
+
+
+def test_job_fails_when_no_source_returns_data(queue, tmp_path, monkeypatch):
+    def unreachable(name, *args):
+        return SourceFetch(name, errors=[f"{SOURCES[name].label}: HTTP 503"])
+
+    monkeypatch.setattr(worker, 'fetch_source', unreachable)
+    store = open_store(tmp_path / 'store')
+    version = store.version('players')
+    job = queue.submit()
+
+    with ThreadPoolExecutor() as pool:
+        worker.run_job(queue.claim(), queue, store, pool, tmp_path / 'state.sqlite')
+
+    failed = queue.get(job.id)
+    assert (failed.status, failed.message) == ('failed', worker.NO_DATA_MESSAGE)
+    assert len(failed.errors) == len(SOURCES)
+    assert store.version('players') == version
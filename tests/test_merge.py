@@ -0,0 +1,144 @@
+import numpy as np
+import pandas as pd
+
+from scout_core.sample_data import SAMPLE_PLAYERS
+from scout_core.schema import MISSING, compact_players, expand_players
+from scout_core.stats import player_stats
+from scout_core.sync.merge import combine_sources, combine_tables, merge_players
+from scout_core.sync.parsing import records_to_table
+from scout_core.sync.sources import SOURCES
+from scout_core.teams import team_aggregates
+
+
+def stored_players():
+    return expand_players(compact_players(pd.DataFrame(SAMPLE_PLAYERS)))
+
+
+def test_identical_replay_changes_nothing():
+    players = stored_players()
+    synced = pd.DataFrame(SAMPLE_PLAYERS).set_index('id')
+
+    merged, changed_ids = merge_players(players, synced, ['MLS'])
+
+    assert changed_ids == []
+    assert merged is players
+
+
+def test_changed_float_is_written_at_the_stored_dtype():
+    players = stored_players()
+    synced = pd.DataFrame(SAMPLE_PLAYERS).set_index('id')
+    synced.loc[3, 'rating'] = 9.1
+
+    merged, changed_ids = merge_players(players, synced, ['MLS'])
+
+    assert changed_ids == [3]
+    assert merged['rating'].dtype == 'float32'
+    assert merged.loc[merged['id'] == 3, 'rating'].item() == pd.Series([9.1], dtype='float32').item()
+
+
+def test_stints_at_two_clubs_add_up():
+    stints = records_to_table([
+        {'key': '92e7e919', 'name': 'Diego Rossi', 'club': 'Columbus Crew', 'matches': 10, 'goals': 6,
+         'minutes_played': 850, 'league': 'MLS'},
+        {'key': '92e7e919', 'name': 'Diego Rossi', 'club': 'LAFC', 'matches': 8, 'goals': 4,
+         'minutes_played': 700, 'league': 'MLS'},
+    ])
+    shooting = records_to_table([
+        {'key': '92e7e919', 'name': 'Diego Rossi', '_shots': 30.0, 'league': 'MLS'},
+        {'key': '92e7e919', 'name': 'Diego Rossi', '_shots': 24.0, 'league': 'MLS'},
+    ])
+
+    frame = combine_tables(SOURCES['fbref'], [stints, shooting])
+
+    row = frame.loc['92e7e919']
+    assert (row['matches'], row['goals'], row['minutes_played']) == (18, 10, 1550)
+    assert row['shots_per_game'] == 3.0
+    assert row['club'] == 'LAFC'
+
+
+def test_sofascore_player_on_two_pages_counts_once():
+    # The ranking shifted between the two requests: the last player of page
+    # one is the first of page two
+    page = {'key': '826643', 'name': 'Diego Rossi', 'club': 'Columbus Crew', 'matches': 18, 'rating': 8.2,
+            'league': 'MLS'}
+    first = records_to_table([{'key': '100', 'name': 'Cucho Hernandez', 'matches': 20, 'league': 'MLS'}, page])
+    second = records_to_table([page, {'key': '101', 'name': 'Tyler Adams', 'matches': 15, 'league': 'MLS'}])
+
+    frame = combine_tables(SOURCES['sofascore'], [first, second])
+
+    assert frame.loc['826643', 'matches'] == 18
+    assert frame['matches'].to_dict() == {'100': 20, '826643': 18, '101': 15}
+
+
+def test_namesakes_stay_apart():
+    table = records_to_table([
+        {'key': '101', 'name': 'Diego Rossi', 'age': 26, 'league': 'MLS'},
+        {'key': '202', 'name': 'Diego Rossi', 'age': 40, 'league': 'MLS'},
+    ])
+
+    frame = combine_tables(SOURCES['transfermarkt'], [table])
+
+    assert frame['age'].to_dict() == {'101': 26, '202': 40}
+
+
+def test_sources_combine_by_column_priority():
+    frames = {
+        'fbref': pd.DataFrame({'club': ['Columbus Crew'], 'pass_accuracy': [81.0], 'goals': [15]}, index=[1]),
+        'transfermarkt': pd.DataFrame({'club': ['Columbus'], 'market_value': [9_000_000]}, index=[1]),
+        'sofascore': pd.DataFrame({'rating': [8.2], 'pass_accuracy': [82.4]}, index=[1]),
+    }
+
+    combined = combine_sources(frames).loc[1]
+
+    assert combined['club'] == 'Columbus'
+    assert combined['pass_accuracy'] == 81.0
+    assert (combined['rating'], combined['goals']) == (8.2, 15)
+    assert combined['fbref'] and combined['sofascore'] and 'asa' not in combined
+
+
+def test_new_players_are_appended_and_coverage_flags_reset():
+    players = stored_players()
+    synced = pd.DataFrame(
+        {'name': ['Tyler Adams', 'Chidi Okafor'], 'club': ['AFC Bournemouth', 'NY Red Bulls'],
+         'goals': [2, 0], 'asa': [True, True]},
+        index=[2, 13],
+    )
+
+    merged, changed_ids = merge_players(players, synced, ['MLS'])
+
+    added = merged.set_index('id').loc[13]
+    assert (added['name'], added['club'], added['goals'], added['asa']) == ('Chidi Okafor', 'NY Red Bulls', 0, True)
+    # Stats no source reported are missing, not zero
+    assert np.isnan(added['rating']) and np.isnan(added['pass_accuracy'])
+    assert (added['market_value'], added['minutes_played']) == (MISSING, MISSING)
+    # MLS players ASA no longer reports lose the flag; other leagues keep theirs
+    flags = merged.set_index('id')['asa']
+    assert flags[2] and not flags[1]
+    assert flags[5] == players.set_index('id')['asa'][5]
+    assert changed_ids[-1] == 13
+
+
+def test_players_from_a_partial_source_leave_aggregates_alone():
+    players = stored_players()
+    # Only Transfermarkt knows this Columbus player: a value, no match stats
+    synced = pd.DataFrame(
+        {'name': ['Jacen Russell-Rowe'], 'club': ['Columbus Crew'], 'league': ['MLS'], 'position': ['ST'],
+         'market_value': [1_500_000], 'transfermarkt': [True]},
+        index=[14],
+    )
+    merged, _ = merge_players(players, synced, ['MLS'])
+    merged = compact_players(merged)
+
+    before = team_aggregates(compact_players(players)).set_index('name').loc['Columbus Crew']
+    after = team_aggregates(merged).set_index('name').loc['Columbus Crew']
+    assert after['players'] == before['players'] + 1
+    assert (after['avg_age'], after['avg_rating'], after['goals']) == (
+        before['avg_age'], before['avg_rating'], before['goals']
+    )
+    assert after['market_value'] == before['market_value'] + 1_500_000
+
+    # Nor are they ranked: every other player keeps their percentiles
+    stats = player_stats(merged)
+    others = merged['id'] != 14
+    assert stats[others].equals(player_stats(merged[others]))
+    assert np.isnan(stats.loc[~others, 'goals_per90']).all()
@@ -0,0 +1,80 @@
+import time
+
+import pytest
+
+from scout_core.sync import pagecache
+from scout_core.sync.pagecache import PageCache
+
+BODY = b'<html><body>' + b'<tr><td>Diego Rossi</td></tr>' * 200 + b'</body></html>'
+
+
+@pytest.fixture
+def cache(tmp_path):
+    with PageCache(tmp_path / 'cache') as cache:
+        yield cache
+
+
+def stored_files(cache):
+    return sorted(path.name for path in cache.objects.glob('*/*'))
+
+
+@pytest.mark.parametrize('codec', ['gzip', pagecache.default_codec()])
+def test_round_trip(tmp_path, codec):
+    with PageCache(tmp_path / codec, codec=codec) as cache:
+        digest = cache.put('fbref', 'MLS', 'http://fbref/1', BODY)
+
+        assert cache.get('http://fbref/1') == BODY
+        assert cache.get('http://fbref/2') is None
+        assert cache.has('http://fbref/1')
+        assert stored_files(cache) == [digest]
+        assert cache.stats()['stored_bytes'] < len(BODY)
+
+
+def test_identical_bodies_are_stored_once(cache):
+    cache.put('fbref', 'MLS', 'http://fbref/1', BODY)
+    cache.put('fbref', 'NWSL', 'http://fbref/2', BODY)
+
+    assert cache.stats() == {'pages': 2, 'blobs': 1, 'bytes': len(BODY), 'stored_bytes': cache.stats()['stored_bytes']}
+    assert cache.pages(leagues=['NWSL']) == [('fbref', 'NWSL', 'http://fbref/2')]
+
+
+def test_replaced_body_is_deleted_once_unreferenced(cache):
+    first = cache.put('fbref', 'MLS', 'http://fbref/1', BODY)
+    cache.put('fbref', 'MLS', 'http://fbref/2', BODY)
+    second = cache.put('fbref', 'MLS', 'http://fbref/1', BODY + b'new')
+    assert set(stored_files(cache)) == {first, second}
+
+    cache.put('fbref', 'MLS', 'http://fbref/2', BODY + b'new')
+
+    assert stored_files(cache) == [second]
+
+
+def test_evict_drops_least_recently_used_bodies(cache):
+    cache.put('fbref', 'MLS', 'http://fbref/1', BODY)
+    time.sleep(0.01)
+    cache.put('fbref', 'MLS', 'http://fbref/2', BODY + b'2')
+    cache.max_bytes = cache.stats()['stored_bytes'] - 1
+
+    assert cache.evict() == 1
+    assert cache.get('http://fbref/1') is None
+    assert cache.get('http://fbref/2') == BODY + b'2'
+    assert len(stored_files(cache)) == 1
+
+
+def test_put_survives_an_eviction_by_another_process(cache, monkeypatch):
+    cache.put('fbref', 'MLS', 'http://fbref/1', BODY)
+    other = PageCache(cache.directory, max_bytes=0)
+
+    class EvictingClock:
+        """Lets ``other`` evict everything between put()'s lookup and its transaction."""
+        def time(self):
+            monkeypatch.undo()
+            other.evict()
+            return time.time()
+    monkeypatch.setattr(pagecache, 'time', EvictingClock())
+
+    cache.put('fbref', 'MLS', 'http://fbref/2', BODY)
+    other.close()
+
+    assert cache.get('http://fbref/2') == BODY
+    assert len(stored_files(cache)) == 1
@@ -0,0 +1,92 @@
+import pytest
+
+from scout_core.sync.merge import combine_tables
+from scout_core.sync.parsers import (
+    parse_asa, parse_fbref, parse_market_value, parse_sofascore, parse_transfermarkt,
+)
+from scout_core.sync.parsing import parse_page
+from scout_core.sync.sources import SOURCES
+
+
+def test_fbref_standard_stats(fixture_page):
+    records = parse_fbref(fixture_page('fbref/stats.html'))
+
+    assert [record['key'] for record in records] == ['92e7e919', '0d5c0e5a', '0d5c0e5a', 'e4d3bd0b']
+    assert records[0] == {
+        'key': '92e7e919', 'name': 'Diego Rossi', 'nationality': 'URU', 'position': 'FW',
+        'club': 'Columbus Crew', 'age': 26, 'birth_year': 1998, 'matches': 28,
+        'minutes_played': 2340, 'goals': 15, 'assists': 8,
+    }
+    assert records[3]['position'] == 'CB'
+    assert 'assists' not in records[3]  # empty cell
+
+
+def test_fbref_tables_inside_comments(fixture_page):
+    records = parse_fbref(fixture_page('fbref/shooting.html'))
+
+    assert [(record['key'], record['_shots']) for record in records] == [
+        ('92e7e919', 90.0), ('0d5c0e5a', 40.0), ('0d5c0e5a', 28.0), ('e4d3bd0b', 3.0),
+    ]
+
+
+def test_fbref_pages_combine_into_per_game_stats(fixture_page):
+    tables = [parse_page('fbref', 'MLS', fixture_page(f'fbref/{page}.html')) for page in ('stats', 'shooting')]
+
+    frame = combine_tables(SOURCES['fbref'], tables)
+
+    assert '_shots' not in frame
+    assert frame.loc['92e7e919', 'shots_per_game'] == 3.2
+    lewis = frame.loc['0d5c0e5a']
+    assert (lewis['matches'], lewis['minutes_played'], lewis['goals']) == (26, 1856, 9)
+    assert lewis['shots_per_game'] == 2.6
+    assert lewis['league'] == 'MLS'
+
+
+def test_transfermarkt_market_values(fixture_page):
+    records = parse_transfermarkt(fixture_page('transfermarkt/marktwerte-1.html'))
+
+    assert records[0] == {
+        'key': '346543', 'name': 'Tyler Adams', 'position': 'CDM', 'nationality': 'United States',
+        'club': 'AFC Bournemouth', 'age': 25, 'market_value': 28_000_000,
+    }
+    # Namesakes keep their own ids
+    assert [(record['key'], record['age']) for record in records[1:]] == [('412356', 26), ('997701', 38)]
+    assert records[2]['market_value'] == 150_000
+
+
+@pytest.mark.parametrize('text, value', [
+    ('€8.50m', 8_500_000), ('€800k', 800_000), ('€1.20bn', 1_200_000_000), ('€750Th.', 750_000), ('-', None),
+])
+def test_market_value_text(text, value):
+    assert parse_market_value(text) == value
+
+
+def test_asa_players_and_xgoals(fixture_page):
+    tables = [parse_page('asa', 'MLS', fixture_page(f'asa/{page}.json')) for page in ('players', 'xgoals')]
+    assert parse_asa(fixture_page('asa/players.json'))[0] == {
+        'key': 'vzqo8xZQap', 'name': 'Diego Rossi', 'nationality': 'Uruguay', 'birth_year': 1998,
+    }
+
+    frame = combine_tables(SOURCES['asa'], tables)
+
+    # The stats-only player (no /players row) is dropped; Lewis's two stints add up
+    assert sorted(frame.index) == ['2vQ1XlWJQr', 'Oa5wY8RX5q', 'vzqo8xZQap']
+    assert (frame.loc['2vQ1XlWJQr', 'minutes_played'], frame.loc['2vQ1XlWJQr', 'goals']) == (1856, 9)
+    assert frame.loc['vzqo8xZQap', 'assists'] == 8
+
+
+def test_sofascore_statistics(fixture_page):
+    records = parse_sofascore(fixture_page('sofascore/statistics-0.json'))
+
+    assert records[0] == {
+        'key': '826143', 'name': 'Diego Rossi', 'club': 'Columbus Crew', 'rating': 8.2,
+        'pass_accuracy': 82.4, 'matches': 28,
+    }
+    assert records[3] == {'key': '1402212', 'name': 'Chidi Okafor', 'club': 'New York Red Bulls', 'matches': 0}
+    assert len(records) == 4  # the row without a player name is skipped
+
+
+def test_rows_without_an_id_fall_back_to_the_name():
+    body = b'{"results": [{"player": {"name": "Diego Ross\\u00ed"}, "rating": 7.0}]}'
+
+    assert parse_sofascore(body)[0]['key'] == 'name:diego rossi'
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from scout_core.dataset import build_player_index
+from scout_core.query import PlayerQuery
+from scout_core.sample_data import SAMPLE_PLAYERS
+from scout_core.schema import compact_players
+from scout_core.search import SearchIndex, normalize_text
+
+
+@pytest.fixture(scope='module')
+def index():
+    return build_player_index(compact_players(pd.DataFrame(SAMPLE_PLAYERS)))
+
+
+def names(index, query):
+    return index.query(query)['name'].tolist()
+
+
+def test_filters_and_sort(index):
+    query = PlayerQuery(league='MLS', age_range=(25, 30), sort_by='market_value')
+
+    assert names(index, query) == ['Tyler Adams', 'Diego Rossi', 'Jonathan Lewis', 'Nick Lima']
+
+
+def test_filters_combine_with_search(index):
+    query = PlayerQuery(position='ST', search='usa', sort_by='age', ascending=True)
+
+    assert names(index, query) == ['Ricardo Pepi', 'Greg Hurst']
+
+
+def test_unfiltered_query_is_every_player_by_rating(index):
+    ratings = index.query(PlayerQuery())['rating'].to_numpy()
+
+    assert len(ratings) == len(SAMPLE_PLAYERS)
+    assert (np.diff(ratings) <= 0).all()
+
+
+def test_unknown_category_matches_nothing(index):
+    assert names(index, PlayerQuery(league='Bundesliga')) == []
+
+
+def test_rows_for_ids_keeps_order_and_skips_unknown_ids(index):
+    rows = index.rows_for_ids([7, 999, 1])
+
+    assert index.df.iloc[rows]['id'].tolist() == [7, 1]
+
+
+def test_normalize_text():
+    assert normalize_text('  Arturo  RODRÍGUEZ ') == 'arturo rodriguez'
+
+
+@pytest.mark.parametrize('query, expected', [
+    ('rodriguez', ['Arturo Rodriguez']),
+    ('colorado', ['Jonathan Lewis', 'Hadji Barry']),
+    ('ma', ['Milan Iloski']),  # short queries match word prefixes (North Macedonia)
+    ('', [player['name'] for player in SAMPLE_PLAYERS]),
+])
+def test_search(query, expected):
+    players = pd.DataFrame(SAMPLE_PLAYERS)
+    rows = SearchIndex(players).search(query)
+
+    assert players.iloc[rows]['name'].tolist() == expected
+
+
+def test_fuzzy_search_finds_misspellings():
+    players = pd.DataFrame(SAMPLE_PLAYERS)
+    search = SearchIndex(players)
+
+    assert len(search.search('Diego Rosi')) == 0
+    assert players.iloc[search.search('Diego Rosi', fuzzy=True)]['name'].tolist() == ['Diego Rossi']
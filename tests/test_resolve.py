@@ -0,0 +1,72 @@
+import pandas as pd
+import pytest
+
+from scout_core.sample_data import SAMPLE_PLAYERS
+from scout_core.schema import compact_players, expand_players
+from scout_core.sync.resolve import name_tokens, resolve_players
+
+
+@pytest.fixture
+def players():
+    return expand_players(compact_players(pd.DataFrame(SAMPLE_PLAYERS)))
+
+
+def source_frame(rows):
+    return pd.DataFrame([row for _, row in rows], index=[key for key, _ in rows])
+
+
+def test_name_tokens_fold_accents_and_suffixes():
+    assert name_tokens('Diego Rossí Jr.') == ['diego', 'rossi']
+
+
+def test_spelling_variants_resolve_to_known_players(players):
+    fbref = source_frame([
+        ('a1', {'name': 'Tyler Shaan Adams', 'birth_year': 1999, 'nationality': 'USA'}),
+        ('b2', {'name': 'Diego Rossí', 'birth_year': 1998, 'nationality': 'Uruguay'}),
+    ])
+
+    frames, mappings = resolve_players({'fbref': fbref}, players, year=2024)
+
+    assert mappings['fbref'].to_dict() == {'a1': 2, 'b2': 1}
+    assert list(frames['fbref'].index) == [2, 1]
+
+
+def test_contradicting_birth_year_makes_a_new_player(players):
+    transfermarkt = source_frame([
+        ('412356', {'name': 'Diego Rossi', 'age': 26, 'nationality': 'Uruguay'}),
+        ('997701', {'name': 'Diego Rossi', 'age': 38, 'nationality': 'Italy'}),
+    ])
+
+    _, mappings = resolve_players({'transfermarkt': transfermarkt}, players, year=2024)
+
+    assert mappings['transfermarkt']['412356'] == 1
+    assert mappings['transfermarkt']['997701'] == players['id'].max() + 1
+
+
+def test_new_players_get_one_id_across_sources(players):
+    frames = {
+        'fbref': source_frame([('e4d3bd0b', {'name': 'Chidi Okafor', 'birth_year': 2004})]),
+        'sofascore': source_frame([('1402212', {'name': 'Chidi Okafor'})]),
+    }
+
+    _, mappings = resolve_players(frames, players, year=2024)
+
+    assert mappings['fbref']['e4d3bd0b'] == mappings['sofascore']['1402212'] == players['id'].max() + 1
+
+
+def test_id_map_is_used_first(players):
+    # Birth year off (e.g. a data entry error): blocking alone wouldn't match it
+    fbref = source_frame([('92e7e919', {'name': 'Diego Rossi', 'birth_year': 2008})])
+    _, mappings = resolve_players({'fbref': fbref}, players, year=2024)
+    assert mappings['fbref']['92e7e919'] != 1
+
+    _, mappings = resolve_players({'fbref': fbref}, players, {'fbref': {'92e7e919': 1}}, year=2024)
+    assert mappings['fbref']['92e7e919'] == 1
+
+
+def test_id_map_is_dropped_when_names_diverge(players):
+    fbref = source_frame([('92e7e919', {'name': 'Diego Rossi', 'birth_year': 1998})])
+
+    _, mappings = resolve_players({'fbref': fbref}, players, {'fbref': {'92e7e919': 12}}, year=2024)
+
+    assert mappings['fbref']['92e7e919'] == 1
@@ -0,0 +1,21 @@
+import pandas as pd
+
+from scout_core.sample_data import SAMPLE_PLAYERS
+from scout_core.schema import compact_players, expand_players, has_source
+
+
+def test_compact_round_trip_keeps_values():
+    players = pd.DataFrame(SAMPLE_PLAYERS)
+    compact = compact_players(players)
+
+    assert compact['sources'].dtype == 'uint8'
+    assert has_source(compact['sources'].to_numpy(), 'fbref').tolist() == players['fbref'].tolist()
+    expanded = expand_players(compact)
+    assert expanded['club'].tolist() == players['club'].tolist()
+    assert expanded['transfermarkt'].tolist() == players['transfermarkt'].tolist()
+
+
+def test_season_minutes_fit():
+    players = pd.DataFrame(SAMPLE_PLAYERS).assign(minutes_played=40_000)
+
+    assert (compact_players(players)['minutes_played'] == 40_000).all()
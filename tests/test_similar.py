@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+
+from scout_core.similar import SimilarityIndex
+
+
+def style_frame():
+    # One feature varies, so distances are plain differences in z-scores
+    return pd.DataFrame({
+        'position': ['ST', 'CB', 'ST', 'ST', 'CB'],
+        'shots_per_game': [3.0, 3.1, 2.0, 4.5, 0.5],
+        'tackles': [1.0] * 5,
+    })
+
+
+def test_nearest_first_without_the_player_itself():
+    index = SimilarityIndex(style_frame(), features=('shots_per_game', 'tackles'))
+
+    rows, distances = index.similar(0, k=3)
+
+    assert rows.tolist() == [1, 2, 3]
+    assert (np.diff(distances) >= 0).all()
+    assert 0 not in rows
+
+
+def test_same_position_only():
+    index = SimilarityIndex(style_frame(), features=('shots_per_game', 'tackles'))
+
+    rows, _ = index.similar(0, k=10, same_position=True)
+
+    assert rows.tolist() == [2, 3]
+
+
+def test_candidates_restrict_the_matches():
+    index = SimilarityIndex(style_frame(), features=('shots_per_game', 'tackles'))
+
+    rows, _ = index.similar(0, k=10, candidates=np.array([0, 3, 4]))
+
+    assert rows.tolist() == [3, 4]
+    assert len(index.similar(0, k=0)[0]) == 0
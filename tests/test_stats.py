@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from scout_core.sample_data import SAMPLE_PLAYERS
+from scout_core.schema import compact_players
+from scout_core.stats import PERCENTILE_COLUMNS, PERCENTILE_STATS, per90_values, percentile_column, player_stats
+
+
+@pytest.fixture
+def players():
+    return compact_players(pd.DataFrame(SAMPLE_PLAYERS))
+
+
+def test_per90_rates(players):
+    per90 = per90_values(players).set_index(players['id'])
+
+    rossi = players.set_index('id').loc[1]
+    assert per90.loc[1, 'goals_per90'] == pytest.approx(rossi['goals'] * 90 / rossi['minutes_played'], rel=1e-6)
+    assert per90.loc[1, 'shots_per90'] == pytest.approx(
+        rossi['shots_per_game'] * rossi['matches'] * 90 / rossi['minutes_played'], rel=1e-6
+    )
+
+
+def test_players_without_minutes_have_no_rates(players):
+    players = players.copy()
+    players.loc[players['id'] == 1, ['minutes_played', 'matches']] = 0
+
+    with np.errstate(all='raise'):
+        per90 = per90_values(players)
+
+    assert not np.isinf(per90.to_numpy()).any()
+    assert per90[players['id'] == 1].isna().all(axis=None)
+    assert per90[players['id'] != 1].notna().all(axis=None)
+
+
+def test_percentiles_are_ranks_within_the_cohort(players):
+    stats = player_stats(players)
+
+    percentiles = stats[PERCENTILE_COLUMNS].to_numpy()
+    assert ((percentiles >= 0) & (percentiles <= 100)).all()
+    ranked = pd.concat([stats, players[['pass_accuracy', 'rating']]], axis=1)
+    forwards = (players['league'] == 'MLS') & players['position'].isin(['FW', 'ST', 'LW', 'RW'])
+    for stat in PERCENTILE_STATS:
+        values = ranked.loc[forwards, stat].to_numpy()
+        pct = ranked.loc[forwards, percentile_column(stat)].to_numpy()
+        order = np.argsort(values, kind='stable')
+        assert (np.diff(pct[order]) >= 0).all(), stat
+        assert pct.max() == 100
@@ -0,0 +1,47 @@
+import os
+import shutil
+
+import pandas as pd
+
+from scout_core.sample_data import SAMPLE_PLAYERS
+from scout_core.store import Store, player_filter
+
+
+def test_rewrites_swap_versions_atomically(tmp_path):
+    store = Store(tmp_path)
+    assert (store.has('players'), store.version('players')) == (False, 0)
+    store.seed(pd.DataFrame(SAMPLE_PLAYERS))
+    first = store.version('players')
+    players = store.load_players()
+
+    store.write_players(players.assign(goals=players['goals'] + 1))
+    store.write_players(players)
+
+    assert store.version('players') > first
+    assert store.load_players().equals(players)
+    # The current version and the one before it stay on disk, nothing older
+    assert len([name for name in os.listdir(tmp_path) if name.startswith('.players-')]) == 2
+
+
+def test_pushdown_filters(tmp_path):
+    store = Store(tmp_path)
+    store.seed(pd.DataFrame(SAMPLE_PLAYERS))
+
+    players = store.load_players(player_filter(league='USL League One', value_range=(500_000, 10**7)))
+
+    assert players['name'].tolist() == ['Dariusz Formella']
+    mls_clubs = {player['club'] for player in SAMPLE_PLAYERS if player['league'] == 'MLS'}
+    assert set(store.load_teams(player_filter(league='MLS'))['name']) == mls_clubs
+
+
+def test_stores_from_before_versioning_still_load(tmp_path):
+    store = Store(tmp_path)
+    store.seed(pd.DataFrame(SAMPLE_PLAYERS))
+    current = (tmp_path / 'players.current').read_text()
+    shutil.move(tmp_path / current, tmp_path / 'players')
+    (tmp_path / 'players.current').unlink()
+
+    assert store.has('players') and len(store.load_players()) == len(SAMPLE_PLAYERS)
+    store.write_players(store.load_players())
+    store.write_players(store.load_players())
+    assert not (tmp_path / 'players').exists()
@@ -0,0 +1,131 @@
+import sqlite3
+from urllib.parse import urlsplit
+
+import pandas as pd
+import pytest
+
+from scout_core.dataset import open_store
+from scout_core.sample_data import SAMPLE_PLAYERS
+from scout_core.schema import compact_players
+from scout_core.sync import sync_players
+from scout_core.sync.http import FetchResult
+from scout_core.sync.pipeline import SyncResult, write_sync
+from scout_core.sync.state import SyncState, content_hash
+
+# Recorded MLS pages by URL path (and query); every other page is a 404
+RECORDED = {
+    '/en/comps/22/stats/Major-League-Soccer-Stats': 'fbref/stats.html',
+    '/en/comps/22/shooting/Major-League-Soccer-Stats': 'fbref/shooting.html',
+    '/major-league-soccer/marktwerte/wettbewerb/MLS1/page/1': 'transfermarkt/marktwerte-1.html',
+    '/api/v1/mls/players': 'asa/players.json',
+    '/api/v1/mls/players/xgoals': 'asa/xgoals.json',
+    '/api/v1/unique-tournament/242/season/57317/statistics'
+    '?limit=100&offset=0&order=-rating&accumulation=total': 'sofascore/statistics-0.json',
+}
+
+
+class FakeClient:
+    """``HttpClient`` serving the recorded pages, with ETags and ``304 Not Modified``."""
+
+    def __init__(self, read_page):
+        self.read_page = read_page
+        self.requests = []
+
+    def get(self, source, url, headers=None):
+        parts = urlsplit(url)
+        name = RECORDED.get(parts.path + (f"?{parts.query}" if parts.query else ''))
+        self.requests.append((url, headers or {}))
+        if name is None:
+            return FetchResult(source, url, 404, error="HTTP 404")
+        body = self.read_page(name)
+        etag = f'"{content_hash(body)[:16]}"'
+        if (headers or {}).get('If-None-Match') == etag:
+            return FetchResult(source, url, 304, headers={'ETag': etag})
+        return FetchResult(source, url, 200, body, {'ETag': etag})
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def client(fixture_page):
+    return FakeClient(fixture_page)
+
+
+@pytest.fixture
+def players():
+    return compact_players(pd.DataFrame(SAMPLE_PLAYERS))
+
+
+def test_sync_players_from_recorded_pages(players, client):
+    result = sync_players(players, leagues=['MLS'], client=client)
+
+    assert result.pages == len(RECORDED)
+    assert result.errors and all("(HTTP 404)" in error for error in result.errors)
+    assert result.coverage == {'fbref': 3, 'transfermarkt': 3, 'asa': 3, 'sofascore': 3}
+    synced = result.players.set_index('name')
+    rossi = synced.loc['Diego Rossi']
+    # The Italian namesake on Transfermarkt is a new player, not an update
+    assert len(rossi) == 2
+    rossi = rossi[rossi['id'] == 1].iloc[0]
+    assert (rossi['market_value'], rossi['rating'], rossi['goals']) == (9_000_000, pytest.approx(8.2), 15)
+    lewis = synced.loc['Jonathan Lewis']
+    assert (lewis['id'], lewis['matches'], lewis['goals']) == (7, 26, 9)
+    assert synced.loc['Tyler Adams', 'market_value'] == 28_000_000
+    assert 'Chidi Okafor' in synced.index
+    assert set(result.changed_ids) >= {1, 2, 7}
+
+
+def test_resync_with_state_reuses_unchanged_pages(tmp_path, players, client):
+    with SyncState(tmp_path / 'state.sqlite') as state:
+        first = sync_players(players, leagues=['MLS'], client=client, state=state)
+        client.requests.clear()
+        second = sync_players(first.players, leagues=['MLS'], client=client, state=state)
+        ids = state.player_ids('transfermarkt')
+
+    assert second.unchanged == len(RECORDED)
+    assert second.changed_ids == []
+    assert second.players is first.players
+    conditional = [url for url, headers in client.requests if 'If-None-Match' in headers]
+    assert len(conditional) == len(RECORDED)
+    assert ids['412356'] == 1 and ids['997701'] not in (1, None)
+
+
+def test_write_sync_publishes_players_after_teams_and_history(tmp_path):
+    store = open_store(tmp_path / 'store')
+    previous = store.load_players()
+    players = previous.copy()
+    players.loc[players['id'] == 3, 'goals'] += 5
+    seen = {}
+    write_players = store.write_players
+
+    def spy(df):
+        seen['teams'] = store.load_teams()
+        seen['snapshots'] = len(store.history.snapshots())
+        write_players(df)
+    store.write_players = spy
+
+    write_sync(store, previous, SyncResult(players, changed_ids=[3]))
+
+    club = players.loc[players['id'] == 3, 'club'].item()
+    goals = seen['teams'].set_index('name').loc[club, 'goals']
+    assert goals == players.loc[players['club'] == club, 'goals'].sum()
+    assert seen['snapshots'] == 2
+    assert store.load_players()['goals'].sum() == previous['goals'].sum() + 5
+
+
+def test_state_from_before_native_keys_is_reset(tmp_path):
+    path = tmp_path / 'state.sqlite'
+    with SyncState(path) as state:
+        state.save('http://tm/1', 'transfermarkt', {}, 'abc', [{'key': 'diego rossi'}])
+        state.save_player_ids('transfermarkt', {'diego rossi': 1})
+    with sqlite3.connect(path) as conn:
+        conn.execute("PRAGMA user_version = 1")
+
+    with SyncState(path) as state:
+        assert state.records('http://tm/1') is None
+        assert state.player_ids('transfermarkt') == {}
+    with SyncState(path) as state:
+        state.save_player_ids('transfermarkt', {'412345': 1})
+    with SyncState(path) as state:
+        assert state.player_ids('transfermarkt') == {'412345': 1}
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from scout_core.sample_data import SAMPLE_PLAYERS
+from scout_core.schema import compact_players
+from scout_core.teams import team_aggregates, update_team_aggregates
+
+
+@pytest.fixture
+def players():
+    return compact_players(pd.DataFrame(SAMPLE_PLAYERS))
+
+
+def updated(before, after, changed_ids):
+    return update_team_aggregates(team_aggregates(before), before, after, changed_ids)
+
+
+def test_aggregates_per_league_and_club(players):
+    teams = team_aggregates(players).set_index(['league', 'name'])
+
+    crew = teams.loc[('MLS', 'Columbus Crew')]
+    assert (crew['players'], crew['market_value'], crew['goals']) == (1, 8_500_000, 15)
+    assert len(teams) == players.groupby(['league', 'club'], observed=True).ngroups
+
+
+def test_stat_changes_match_a_full_recompute(players):
+    after = players.copy()
+    rossi = after['id'] == 1
+    after.loc[rossi, 'goals'] = 16
+    after.loc[rossi, 'rating'] = np.float32(8.4)
+
+    assert_frame_equal(updated(players, after, [1]), team_aggregates(after))
+
+
+def test_transfer_updates_both_teams(players):
+    # Pepi, PSV's only player, moves to Austin FC
+    after = players.astype({'club': object})
+    after.loc[after['id'] == 3, 'club'] = 'Austin FC'
+    after = compact_players(after)
+
+    teams = updated(players, after, [3])
+
+    assert_frame_equal(teams, team_aggregates(after))
+    assert 'PSV Eindhoven' not in set(teams['name'])
+    assert teams.set_index('name').loc['Austin FC', 'players'] == 2
+
+
+def test_added_and_deleted_players_match_a_full_recompute(players):
+    newcomer = players[players['id'] == 4].assign(id=13, name='Owen Wolff', goals=3)
+    after = pd.concat([players[players['id'] != 7], newcomer], ignore_index=True)
+
+    teams = updated(players, after, [7, 13])
+
+    # Colorado Rapids lost its only player; Austin FC gained one
+    assert_frame_equal(teams, team_aggregates(after))
+    assert 'Colorado Rapids' not in set(teams['name'])
+
+
+def test_nothing_changed_keeps_the_table(players):
+    teams = team_aggregates(players)
+
+    assert update_team_aggregates(teams, players, players, []) is teams
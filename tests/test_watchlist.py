@@ -0,0 +1,62 @@
+import pytest
+
+from scout_core.watchlist import Watchlist, WatchlistStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = WatchlistStore(tmp_path / 'watchlist.sqlite')
+    yield store
+    store.close()
+
+
+def test_edits_are_buffered_until_flush(store):
+    watchlist = Watchlist(store, 'ann')
+    watchlist.add(3)
+    watchlist.add(1)
+    watchlist.toggle(3)
+
+    assert list(watchlist) == [1]
+    assert store.load('ann') == ([], 0)
+
+    watchlist.flush()
+
+    assert store.load('ann') == ([1], 1)
+    watchlist.flush()  # nothing buffered: no new revision
+    assert store.revision('ann') == 1
+
+
+def test_sessions_of_one_scout_share_the_list(store):
+    first, second = Watchlist(store, 'ann'), Watchlist(store, 'ann')
+    first.add(5)
+    first.flush()
+
+    second.refresh()
+
+    assert 5 in second
+    assert list(Watchlist(store, 'bob')) == []
+
+
+def test_refresh_keeps_unflushed_edits(store):
+    other = Watchlist(store, 'ann')
+    watchlist = Watchlist(store, 'ann')
+    watchlist.add(2)
+    other.add(4)
+    other.flush()
+
+    watchlist.refresh()
+    watchlist.flush()
+    watchlist.refresh()
+
+    assert sorted(watchlist) == [2, 4]
+    assert sorted(store.load('ann')[0]) == [2, 4]
+
+
+def test_removals(store):
+    store.apply('ann', added=[1, 2, 3])
+    watchlist = Watchlist(store, 'ann')
+
+    watchlist.remove(2)
+    watchlist.flush()
+
+    assert store.load('ann') == ([1, 3], 2)